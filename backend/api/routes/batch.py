@@ -0,0 +1,152 @@
+import asyncio
+from typing import Dict
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, ValidationError
+from core.logging import logger
+from core.config import settings
+from core.executor import ChallengeExecutor, ExecutorSaturated, get_executor
+from core.description import DESCRIPTIONS
+from core.responses import ModelJSONResponse, challenge_response
+from core.validators import (
+    ChallengeBatchInput,
+    ChallengeBatchItem,
+    ChallengeBatchOutput,
+    ChallengeBatchResult,
+    format_validation_error,
+)
+from src.challenges.execution_context import DeadlineExceeded, ExecutionCancelled
+from src.challenges.registry import ChallengeRegistry, get_registry
+
+
+# Combinações exatas passam do limite de dígitos do json da biblioteca padrão
+router = APIRouter(prefix="/batch", default_response_class=ModelJSONResponse)
+
+
+@router.post(
+    "/",
+    response_model=ChallengeBatchOutput,
+    description=DESCRIPTIONS["batch"]["description"],
+)
+async def execute_batch(
+    input_data: ChallengeBatchInput,
+    challenges: ChallengeRegistry = Depends(get_registry),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Execute a heterogeneous list of challenges in one request.
+
+    Every item is resolved through the challenge registry, validated
+    against the input model of its challenge's execute method and then
+    dispatched exactly like a call to the challenge's own route: through
+    the result cache when the challenge has one and on the execution
+    backend configured for it. At most BATCH_CONCURRENCY items are in
+    flight at a time. A failing item does not fail the batch.
+
+    Args:
+        input_data (ChallengeBatchInput): Input data containing:
+            - items (List[ChallengeBatchItem]): Each with the challenge
+            name and its input object
+
+        challenges (ChallengeRegistry): Registry of the shared challenges,
+            automatically injected via dependency injection.
+
+        executor (ChallengeExecutor): Dispatches each item to the
+            execution backend configured for its challenge.
+
+    Returns:
+        ChallengeBatchOutput: One result per item, in input order, with the
+        status the item would have received from its own route (200, 404
+        unknown challenge, 422 invalid input, 500 execution error, 503
+        saturated backend, 504 request deadline passed) and either the
+        output or an error message.
+
+    Raises:
+        HTTPException: 413 if there are more than BATCH_MAX_ITEMS items.
+
+    Example:
+        Request payload:
+        {
+            "items": [
+                {"challenge": "string", "input": {"text": "BHA"}},
+                {"challenge": "sequence", "input": {"position": 5}}
+            ]
+        }
+    """
+    items = input_data.items
+    if len(items) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413, detail=f"Batch exceeds {settings.BATCH_MAX_ITEMS} items"
+        )
+
+    logger.debug("Processing challenge batch: items=%s", len(items))
+    semaphore = asyncio.Semaphore(max(1, settings.BATCH_CONCURRENCY))
+    models: Dict[str, type] = {}
+
+    async def run_item(index: int, item: ChallengeBatchItem) -> ChallengeBatchResult:
+        async with semaphore:
+            return await _run_item(index, item, challenges, executor, models)
+
+    results = await asyncio.gather(
+        *(run_item(index, item) for index, item in enumerate(items))
+    )
+    output = ChallengeBatchOutput(
+        results=results, errors=sum(result.status != 200 for result in results)
+    )
+    return challenge_response(output)
+
+
+async def _run_item(
+    index: int,
+    item: ChallengeBatchItem,
+    challenges: ChallengeRegistry,
+    executor: ChallengeExecutor,
+    models: Dict[str, type],
+) -> ChallengeBatchResult:
+    """
+    Validate and execute one batch item, capturing its failure if any.
+
+    Args:
+        index (int): Position of the item in the batch
+        item (ChallengeBatchItem): Challenge name and raw input
+        challenges (ChallengeRegistry): Registry of the shared challenges
+        executor (ChallengeExecutor): Dispatcher of challenge calls
+        models (Dict[str, type]): Input models resolved so far, by name
+
+    Returns:
+        ChallengeBatchResult: The item result or error
+    """
+    name = item.challenge
+
+    def failed(status: int, error: str) -> ChallengeBatchResult:
+        return ChallengeBatchResult(
+            index=index, challenge=name, status=status, error=error
+        )
+
+    if name not in challenges.names():
+        return failed(404, f"Unknown challenge: {name}")
+    model = models.get(name)
+    if model is None:
+        model = models[name] = challenges.input_model(name)
+
+    try:
+        challenge_input = model.model_validate(item.input)
+    except ValidationError as exc:
+        return failed(422, format_validation_error(exc))
+
+    try:
+        output: BaseModel = await executor.run(
+            name, challenges.get(name), challenge_input
+        )
+    except ExecutorSaturated as exc:
+        return failed(503, str(exc))
+    except DeadlineExceeded as exc:
+        return failed(504, str(exc))
+    except ExecutionCancelled:
+        raise
+    except Exception as exc:
+        logger.exception("Batch item failed", extra={"challenge": name, "index": index})
+        return failed(500, f"{type(exc).__name__}: {exc}")
+
+    return ChallengeBatchResult(
+        index=index, challenge=name, status=200, result=output.model_dump()
+    )
@@ -1,22 +1,46 @@
-from fastapi import APIRouter, Depends
+import csv
+import json
+from typing import Annotated, Any, AsyncIterator, Dict, List, NamedTuple, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import ValidationError
 from core.logging import logger
+from core.config import settings
+from core.executor import ChallengeExecutor, get_executor
 from core.description import DESCRIPTIONS
-from core.validators import BenefitsInput, BenefitsOutput
-from src.challenges.benefits_challenge import BenefitsChallenge
+from core.http_cache import not_modified
+from core.responses import ModelJSONResponse, challenge_response
+from core.streaming import iter_lines
+from core.validators import (
+    BenefitsBatchOutput,
+    BenefitsInput,
+    BenefitsOutput,
+    format_validation_error,
+)
+from src.challenges.base_challenge import IChallenge
+from src.challenges.registry import registry
 
 
 router = APIRouter(prefix="/benefits")
 
 
-def get_benefits_challenge() -> BenefitsChallenge:
+class _InvalidRecord(NamedTuple):
+    # Registro que não pôde ser decodificado; vira o erro só dessa linha
+    error: str
+
+
+def get_benefits_challenge() -> IChallenge:
     """
-    Dependency provider for BenefitsChallenge instance.
+    Dependency provider for the shared BenefitsChallenge instance.
+
+    The instance is built once by the challenge registry and reused by
+    every request. It is wrapped with the shared result cache, so
+    repeated inputs are answered without recomputing them.
 
     Returns:
-        BenefitsChallenge: An instance of BenefitsChallenge class
-        for use in the benefits calculation endpoint.
+        IChallenge: The registered BenefitsChallenge for use in the
+        benefits calculation endpoint.
     """
-    return BenefitsChallenge()
+    return registry.get("benefits")
 
 
 @router.post(
@@ -26,7 +50,8 @@ def get_benefits_challenge() -> BenefitsChallenge:
 )
 async def calculate_benefits(
     input_data: BenefitsInput,
-    challenge: BenefitsChallenge = Depends(get_benefits_challenge),
+    challenge: IChallenge = Depends(get_benefits_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
 ):
     """
     Calculate employee benefits based on employment data.
@@ -41,14 +66,18 @@ async def calculate_benefits(
             - hire_date (date): Employee hire date
             - resignation_date (date): Employee resignation/termination date
 
-        challenge (BenefitsChallenge): Benefits calculation service instance,
+        challenge (IChallenge): Benefits calculation service instance,
             automatically injected via dependency injection.
 
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
     Returns:
         BenefitsOutput: Object containing the calculated benefits values
         for each type of labor right.
 
     Raises:
+        ExecutorSaturated: If the execution backend is saturated (503).
         HTTPException: If input data is invalid or processing fails.
 
     Example:
@@ -59,9 +88,208 @@ async def calculate_benefits(
             "resignation_date": "2023-06-20"
         }
     """
+    logger.debug(
+        "Processing benefits calculation: salary=%s, hire_date=%s, "
+        "resignation_date=%s",
+        input_data.salary,
+        input_data.hire_date,
+        input_data.resignation_date,
+    )
+    result = await executor.run("benefits", challenge, input_data)
+    return challenge_response(result)
+
+
+@router.get(
+    "/",
+    response_model=BenefitsOutput,
+    description=f"{DESCRIPTIONS['benefits']['description']} "
+    f"{DESCRIPTIONS['http_cache']['description']}",
+)
+async def lookup_benefits(
+    request: Request,
+    response: Response,
+    input_data: Annotated[BenefitsInput, Query()],
+    challenge: IChallenge = Depends(get_benefits_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Calculate benefits for the employment data given in the query string.
+
+    The result carries a strong ETag derived from the input and the
+    configured Cache-Control header; when If-None-Match already holds the
+    ETag, a 304 is returned without running the challenge.
+
+    Args:
+        request (Request): The incoming request, for If-None-Match
+        response (Response): Response receiving the caching headers
+        input_data (BenefitsInput): Query parameters:
+            - salary (float): Monthly salary
+            - hire_date (date): Hire date (YYYY-MM-DD)
+            - resignation_date (date): Resignation date (YYYY-MM-DD)
+        challenge (IChallenge): Benefits calculation service instance.
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
+    Returns:
+        BenefitsOutput: Same result as POST /benefits/, or an empty
+        304 response
+
+    Example:
+        Request:
+        GET /api/v1/benefits/?salary=5000&hire_date=2020-01-15&resignation_date=2023-06-20
+    """
+    cached = not_modified(request, response, "benefits", input_data)
+    if cached is not None:
+        return cached
+    result = await executor.run("benefits", challenge, input_data)
+    return challenge_response(result, response)
+
+
+def get_benefits_batch_challenge() -> IChallenge:
+    """
+    Dependency provider for the shared BenefitsChallenge used by batches.
+
+    Batches bypass the result cache, so the unwrapped instance is returned.
+
+    Returns:
+        IChallenge: The registered BenefitsChallenge for use in the
+        benefits batch endpoint.
+    """
+    return registry.unwrapped("benefits")
+
+
+@router.post(
+    "/batch",
+    response_model=BenefitsBatchOutput,
+    description=DESCRIPTIONS["benefits_batch"]["description"],
+)
+async def calculate_benefits_batch(
+    request: Request,
+    challenge: IChallenge = Depends(get_benefits_batch_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Calculate employee benefits for a batch of records in one request.
+
+    The body may be a JSON array of BenefitsInput objects
+    (application/json), one JSON object per line (application/x-ndjson) or
+    a CSV file with a salary,hire_date,resignation_date header (text/csv).
+    NDJSON and CSV bodies are parsed as they are received.
+
+    Every record is validated on its own: invalid records, including
+    NDJSON lines that are not valid JSON, are reported in their result
+    item and do not fail the rest of the batch.
+
+    Args:
+        request (Request): The incoming request carrying the records
+
+        challenge (IChallenge): Benefits calculation service instance,
+            automatically injected via dependency injection.
+
+        executor (ChallengeExecutor): Dispatches the batch to the
+            execution backend configured for benefits in Settings.
+
+    Returns:
+        ModelJSONResponse: A BenefitsBatchOutput body: one result item per
+        record, in input order, with either the calculated benefits or an
+        error message. Items are built as plain dicts and written to JSON
+        in one pass, so response_model only documents the body.
+
+    Raises:
+        HTTPException: 400 if the body cannot be parsed, 413 if it has more
+            than BENEFITS_BATCH_MAX_ROWS records.
+
+    Example:
+        Request payload:
+        [
+            {"salary": 5000.00, "hire_date": "2020-01-15",
+             "resignation_date": "2023-06-20"},
+            {"salary": 3000.00, "hire_date": "2024-01-01",
+             "resignation_date": "2025-08-21"}
+        ]
+    """
+    results: List[Optional[Dict[str, Any]]] = []
+    valid_rows: List[BenefitsInput] = []
+    valid_indexes: List[int] = []
+
+    try:
+        async for row in _iter_records(request):
+            index = len(results)
+            if index >= settings.BENEFITS_BATCH_MAX_ROWS:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Batch exceeds {settings.BENEFITS_BATCH_MAX_ROWS} rows",
+                )
+            error = None
+            if isinstance(row, _InvalidRecord):
+                error = row.error
+            elif not isinstance(row, dict):
+                error = "record must be an object"
+            else:
+                try:
+                    valid_rows.append(BenefitsInput.model_validate(row))
+                    valid_indexes.append(index)
+                except ValidationError as exc:
+                    error = format_validation_error(exc)
+                except TypeError as exc:
+                    error = str(exc)
+            results.append(
+                None
+                if error is None
+                else {"index": index, "result": None, "error": error}
+            )
+    except (ValueError, csv.Error) as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid batch body: {exc}")
+
     logger.info(
-        f"Processing benefits calculation: salary={input_data.salary}, "
-        f"hire_date={input_data.hire_date}, "
-        f"resignation_date={input_data.resignation_date}"
+        "Processing benefits batch: rows=%s, valid=%s", len(results), len(valid_rows)
     )
-    return challenge.execute(input_data)
+    computed = await executor.submit("benefits", challenge.execute_batch, valid_rows)
+    for index, item in zip(valid_indexes, computed):
+        item["index"] = index
+        results[index] = item
+
+    # Itens já no formato de BenefitsBatchOutput: escritos direto em JSON,
+    # sem um modelo por linha
+    errors = sum(item["error"] is not None for item in results)
+    return ModelJSONResponse({"results": results, "errors": errors})
+
+
+async def _iter_records(request: Request) -> AsyncIterator[Any]:
+    """
+    Yield the raw records of a batch body according to its content type.
+
+    Args:
+        request (Request): The incoming batch request
+
+    Yields:
+        Any: Each decoded record (a dict for well-formed input), or an
+        _InvalidRecord for an NDJSON line that is not valid JSON
+
+    Raises:
+        ValueError: If the body is not valid JSON or CSV, or not UTF-8
+    """
+    content_type = request.headers.get("content-type", "application/json")
+    media_type = content_type.split(";")[0].strip().lower()
+
+    if media_type in ("application/x-ndjson", "application/jsonl"):
+        async for line in iter_lines(request):
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                record = _InvalidRecord(f"invalid JSON: {exc}")
+            yield record
+    elif media_type == "text/csv":
+        header = None
+        async for line in iter_lines(request):
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in values]
+            else:
+                yield dict(zip(header, values))
+    else:
+        body = json.loads(await request.body())
+        if not isinstance(body, list):
+            raise ValueError("expected a JSON array of records")
+        for row in body:
+            yield row
@@ -1,22 +1,51 @@
-from fastapi import APIRouter, Depends
+import base64
+import binascii
+from typing import Annotated
+from array import array
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from starlette.concurrency import run_in_threadpool
 from core.logging import logger
+from core.deadlines import current_context
+from core.executor import ChallengeExecutor, get_executor
+from core.streaming import read_int32_array
 from core.description import DESCRIPTIONS
-from src.challenges.board_game_challenge import BoardGameChallenge
-from core.validators import BoardGameInput, BoardGameOutput
+from core.http_cache import not_modified
+from core.responses import ModelJSONResponse, challenge_response
+from src.challenges.base_challenge import IChallenge
+from src.challenges.board_game_session import (
+    BoardSession,
+    BoardSessionStore,
+    get_session_store,
+)
+from src.challenges.board_game_solver import BoardSolution, int32_board
+from src.challenges.registry import registry
+from core.validators import (
+    BoardGameBase64Input,
+    BoardGameBinaryParams,
+    BoardGameInput,
+    BoardGameOutput,
+    BoardGamePatchInput,
+    BoardGameSessionOutput,
+)
 
 
-router = APIRouter(prefix="/board_game")
+# Combinações exatas passam do limite de dígitos do json da biblioteca padrão
+router = APIRouter(prefix="/board_game", default_response_class=ModelJSONResponse)
 
 
-def get_board_game_challenge() -> BoardGameChallenge:
+def get_board_game_challenge() -> IChallenge:
     """
-    Dependency provider for BoardGameChallenge instance.
+    Dependency provider for the shared BoardGameChallenge instance.
+
+    The instance is built once by the challenge registry and reused by
+    every request. It is wrapped with the shared result cache, so
+    repeated inputs are answered without recomputing them.
 
     Returns:
-        BoardGameChallenge: An instance of BoardGameChallenge class
-        for use in the board game solver endpoint.
+        IChallenge: The registered BoardGameChallenge for use in the
+        board game solver endpoint.
     """
-    return BoardGameChallenge()
+    return registry.get("board_game")
 
 
 @router.post(
@@ -26,7 +55,8 @@ def get_board_game_challenge() -> BoardGameChallenge:
 )
 async def solve_board_game(
     input_data: BoardGameInput,
-    challenge: BoardGameChallenge = Depends(get_board_game_challenge),
+    challenge: IChallenge = Depends(get_board_game_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
 ):
     """
     Solve a board game challenge based on input parameters.
@@ -40,14 +70,18 @@ async def solve_board_game(
             - Additional board configuration parameters as
             defined in BoardGameInput
 
-        challenge (BoardGameChallenge): Board game solver service instance,
+        challenge (IChallenge): Board game solver service instance,
             automatically injected via dependency injection.
 
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
     Returns:
         BoardGameOutput: Object containing the solution to the board game
         challenge, which may include paths, moves, or optimal configurations.
 
     Raises:
+        ExecutorSaturated: If the execution backend is saturated (503).
         HTTPException: If input data is invalid or no solution can be found.
 
     Example:
@@ -57,7 +91,365 @@ async def solve_board_game(
             // other board configuration parameters
         }
     """
-    logger.info(
-        f"Processing board game challenge, board_size = {input_data.board_size}"
+    logger.debug(
+        "Processing board game challenge, board_size = %s", input_data.board_size
+    )
+    result = await executor.run("board_game", challenge, input_data)
+    return challenge_response(result)
+
+
+@router.get(
+    "/",
+    response_model=BoardGameOutput,
+    description=f"{DESCRIPTIONS['board_game']['description']} "
+    f"{DESCRIPTIONS['http_cache']['description']}",
+)
+async def lookup_board_game(
+    request: Request,
+    response: Response,
+    input_data: Annotated[BoardGameInput, Query()],
+    challenge: IChallenge = Depends(get_board_game_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Solve a board given in the query string.
+
+    The result carries a strong ETag derived from the input and the
+    configured Cache-Control header; when If-None-Match already holds the
+    ETag, a 304 is returned without running the challenge.
+
+    Args:
+        request (Request): The incoming request, for If-None-Match
+        response (Response): Response receiving the caching headers
+        input_data (BoardGameInput): Query parameters:
+            - board_size (int): Number of cells
+            - board (List[int]): One parameter per cell, in order
+            - combinations_mode, modulus: As in the POST body
+        challenge (IChallenge): Board game solver service instance.
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
+    Returns:
+        BoardGameOutput: Same result as POST /board_game/, or an empty
+        304 response
+
+    Example:
+        Request:
+        GET /api/v1/board_game/?board_size=3&board=1&board=1&board=0
+    """
+    cached = not_modified(request, response, "board_game", input_data)
+    if cached is not None:
+        return cached
+    result = await executor.run("board_game", challenge, input_data)
+    return challenge_response(result, response)
+
+
+def get_board_game_binary_challenge() -> IChallenge:
+    """
+    Dependency provider for the BoardGameChallenge used by binary uploads.
+
+    Binary boards are meant for very large inputs, whose cache keys would
+    cost a JSON serialization of the whole board, so the instance is
+    returned without the result cache.
+
+    Returns:
+        IChallenge: The registered BoardGameChallenge.
+    """
+    return registry.unwrapped("board_game")
+
+
+@router.post(
+    "/binary",
+    response_model=BoardGameOutput,
+    description=DESCRIPTIONS["board_game_binary"]["description"],
+)
+async def solve_board_game_binary(
+    request: Request,
+    params: Annotated[BoardGameBinaryParams, Query()],
+    challenge: IChallenge = Depends(get_board_game_binary_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Solve a board sent as raw little-endian int32 values.
+
+    The body (application/octet-stream) holds 4 bytes per cell and is read
+    chunk by chunk straight into an array('i'), so no JSON array or list
+    of Python ints is ever built; board_size is the number of cells.
+
+    Args:
+        request (Request): The incoming request carrying the board
+
+        params (BoardGameBinaryParams): Query parameters containing:
+            - combinations_mode (str): "exact" (default), "mod" or "log10"
+            - modulus (Optional[int]): Modulus used in "mod" mode
+
+        challenge (IChallenge): Board game solver service instance.
+
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
+    Returns:
+        BoardGameOutput: The board metrics, as for the JSON endpoint.
+
+    Raises:
+        HTTPException: 422 if the body is not a whole number of int32
+            values or holds fewer than 3 cells.
+
+    Example:
+        POST /api/v1/board_game/binary?combinations_mode=log10
+        Body: struct.pack("<1000000i", *board)
+    """
+    try:
+        board = await read_int32_array(request)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return challenge_response(await _solve_array(board, params, challenge, executor))
+
+
+@router.post(
+    "/base64",
+    response_model=BoardGameOutput,
+    description=DESCRIPTIONS["board_game_binary"]["description"],
+)
+async def solve_board_game_base64(
+    input_data: BoardGameBase64Input,
+    challenge: IChallenge = Depends(get_board_game_binary_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Solve a board sent as base64-encoded little-endian int32 values.
+
+    For clients limited to JSON bodies: the board is decoded into an
+    array('i') instead of being parsed from a JSON array.
+
+    Args:
+        input_data (BoardGameBase64Input): Input data containing:
+            - board_size (int): The size of the game board
+            - board_base64 (str): base64 of 4 bytes per cell
+            - combinations_mode (str): "exact" (default), "mod" or "log10"
+            - modulus (Optional[int]): Modulus used in "mod" mode
+
+        challenge (IChallenge): Board game solver service instance.
+
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
+    Returns:
+        BoardGameOutput: The board metrics, as for the JSON endpoint.
+
+    Raises:
+        HTTPException: 422 if board_base64 is not valid base64 of int32
+            values.
+    """
+    try:
+        data = base64.b64decode(input_data.board_base64, validate=True)
+        board = int32_board(data)
+    except (binascii.Error, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid board_base64: {exc}")
+    if len(board) != input_data.board_size:
+        result = BoardGameOutput(turns=0, probability=0.0, combinations=0)
+    else:
+        result = await _solve_array(board, input_data, challenge, executor)
+    return challenge_response(result)
+
+
+async def _solve_array(
+    board: array,
+    params: BoardGameBinaryParams,
+    challenge: IChallenge,
+    executor: ChallengeExecutor,
+) -> BoardGameOutput:
+    if len(board) < 3:
+        raise HTTPException(status_code=422, detail="board must have at least 3 cells")
+    # O array já é válido: dispensa a validação (e a cópia) do Pydantic
+    input_data = BoardGameInput.model_construct(
+        board_size=len(board),
+        board=board,
+        combinations_mode=params.combinations_mode,
+        modulus=params.modulus,
+    )
+    logger.debug("Processing binary board game challenge, board_size = %s", len(board))
+    return await executor.run("board_game", challenge, input_data)
+
+
+def get_board_game_session_challenge() -> IChallenge:
+    """
+    Dependency provider for the BoardGameChallenge used by sessions.
+
+    Sessions keep their own solver state, so the instance is returned
+    without the result cache.
+
+    Returns:
+        IChallenge: The registered BoardGameChallenge.
+    """
+    return registry.unwrapped("board_game")
+
+
+@router.post(
+    "/sessions",
+    response_model=BoardGameSessionOutput,
+    status_code=201,
+    description=DESCRIPTIONS["board_game_sessions"]["description"],
+)
+async def create_board_game_session(
+    input_data: BoardGameInput,
+    challenge: IChallenge = Depends(get_board_game_session_challenge),
+    sessions: BoardSessionStore = Depends(get_session_store),
+):
+    """
+    Upload a board, solve it and keep it on the server for later edits.
+
+    Solver states are mutable and live in this process, so session work
+    always runs on a thread of this process, never on the process pool.
+    The first solve is bounded by the request deadline (504); later edits
+    always run to completion, so a stored board is never left half solved.
+
+    Args:
+        input_data (BoardGameInput): Board, as for the solver endpoint
+
+        challenge (IChallenge): Board game solver service instance,
+            automatically injected via dependency injection.
+
+        sessions (BoardSessionStore): Store of the board sessions.
+
+    Returns:
+        BoardGameSessionOutput: The board metrics and the session_id to
+        send edits to.
+
+    Raises:
+        HTTPException: 422 if the board does not have board_size cells or
+            a fixed jump lands before the start of the board.
+    """
+    try:
+        state = await run_in_threadpool(
+            challenge.solve_state, input_data, current_context()
+        )
+    except (ValueError, IndexError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    session = sessions.create(state)
+    logger.debug(
+        "Created board session %s, board_size = %s",
+        session.session_id,
+        input_data.board_size,
+    )
+    output = _session_output(challenge, session, state.solution())
+    return challenge_response(output, status_code=201)
+
+
+@router.get(
+    "/sessions/{session_id}",
+    response_model=BoardGameSessionOutput,
+    description=DESCRIPTIONS["board_game_sessions"]["description"],
+)
+async def get_board_game_session(
+    session_id: str,
+    challenge: IChallenge = Depends(get_board_game_session_challenge),
+    sessions: BoardSessionStore = Depends(get_session_store),
+):
+    """
+    Return the metrics of a session's current board.
+
+    Args:
+        session_id (str): Identifier returned when the session was created
+
+        challenge (IChallenge): Board game solver service instance.
+
+        sessions (BoardSessionStore): Store of the board sessions.
+
+    Returns:
+        BoardGameSessionOutput: The current board metrics.
+
+    Raises:
+        HTTPException: 404 if the session does not exist or has expired.
+    """
+    session = _get_session(sessions, session_id)
+    return challenge_response(_session_output(challenge, session, session.solution()))
+
+
+@router.patch(
+    "/sessions/{session_id}",
+    response_model=BoardGameSessionOutput,
+    description=DESCRIPTIONS["board_game_sessions"]["description"],
+)
+async def patch_board_game_session(
+    session_id: str,
+    input_data: BoardGamePatchInput,
+    challenge: IChallenge = Depends(get_board_game_session_challenge),
+    sessions: BoardSessionStore = Depends(get_session_store),
+):
+    """
+    Edit cells of a session's board and re-solve only what changed.
+
+    Editing cell k only changes the values of cells 0..k, so the solver
+    resumes its backward pass near k instead of starting over: edits near
+    the start of the board are the cheapest. recomputed_cells in the
+    response reports how many cells were recomputed.
+
+    Args:
+        session_id (str): Identifier returned when the session was created
+
+        input_data (BoardGamePatchInput): Input data containing:
+            - cells (List[BoardGameCellPatch]): index and new value of
+            each edited cell (the last one wins for repeated indexes)
+
+        challenge (IChallenge): Board game solver service instance.
+
+        sessions (BoardSessionStore): Store of the board sessions.
+
+    Returns:
+        BoardGameSessionOutput: The metrics of the edited board.
+
+    Raises:
+        HTTPException: 404 if the session does not exist or has expired,
+            422 if an index is outside the board or a new fixed jump lands
+            before its start (the board is left unchanged).
+
+    Example:
+        Request payload:
+        {"cells": [{"index": 10, "value": 3}]}
+    """
+    session = _get_session(sessions, session_id)
+    cells = {cell.index: cell.value for cell in input_data.cells}
+    try:
+        solution = await run_in_threadpool(session.apply, cells)
+    except (ValueError, IndexError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return challenge_response(_session_output(challenge, session, solution))
+
+
+@router.delete("/sessions/{session_id}", status_code=204)
+async def delete_board_game_session(
+    session_id: str, sessions: BoardSessionStore = Depends(get_session_store)
+):
+    """
+    Discard a board session.
+
+    Args:
+        session_id (str): Identifier returned when the session was created
+
+        sessions (BoardSessionStore): Store of the board sessions.
+
+    Raises:
+        HTTPException: 404 if the session does not exist or has expired.
+    """
+    if not sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail="Board session not found")
+    return Response(status_code=204)
+
+
+def _get_session(sessions: BoardSessionStore, session_id: str) -> BoardSession:
+    session = sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Board session not found")
+    return session
+
+
+def _session_output(
+    challenge: IChallenge, session: BoardSession, solution: BoardSolution
+) -> BoardGameSessionOutput:
+    return BoardGameSessionOutput(
+        **challenge.output(solution).model_dump(),
+        session_id=session.session_id,
+        board_size=session.state.n,
+        recomputed_cells=session.recomputed_cells,
     )
-    return challenge.execute(input_data)
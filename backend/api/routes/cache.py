@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from core.cache import cache_stats
+
+
+router = APIRouter(prefix="/cache")
+
+
+@router.get("/stats")
+async def get_cache_stats():
+    """
+    Report the counters of the challenge result caches.
+
+    Returns:
+        dict: For each cached challenge, its hits, misses, evictions,
+        shared_hits and current size.
+    """
+    return cache_stats()
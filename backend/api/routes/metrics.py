@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from core.metrics import CONTENT_TYPE, metrics
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Expose the application metrics for Prometheus.
+
+    Returns:
+        PlainTextResponse: Request latency and size histograms, requests in
+        flight, and per-challenge execute duration and input size, in the
+        Prometheus text exposition format.
+    """
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
@@ -1,22 +1,42 @@
-from fastapi import APIRouter, Depends
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from core.logging import logger
+from core.config import settings
+from core.executor import ChallengeExecutor, get_executor
 from core.description import DESCRIPTIONS
-from core.validators import SequenceInput, SequenceOutput
-from src.challenges.sequence_challenge import SequenceChallenge
+from core.http_cache import not_modified
+from core.responses import challenge_response
+from src.challenges.base_challenge import IChallenge
+from src.challenges.registry import registry
+from core.validators import (
+    SequenceBatchInput,
+    SequenceBatchOutput,
+    SequenceInput,
+    SequenceOutput,
+    SequencePositionOutput,
+    SequenceRangeInput,
+    SequenceRangeStreamInput,
+    SequenceSumOutput,
+    SequenceValueInput,
+)
 
 
 router = APIRouter(prefix="/sequence")
 
 
-def get_sequence_challenge() -> SequenceChallenge:
+def get_sequence_challenge() -> IChallenge:
     """
-    Dependency provider for SequenceChallenge instance.
+    Dependency provider for the shared SequenceChallenge instance.
+
+    The instance is built once by the challenge registry and reused by
+    every request.
 
     Returns:
-        SequenceChallenge: An instance of SequenceChallenge class
-        for use in the sequence calculation endpoint.
+        IChallenge: The registered SequenceChallenge for use in the
+        sequence calculation endpoint.
     """
-    return SequenceChallenge()
+    return registry.get("sequence")
 
 
 @router.post(
@@ -26,7 +46,8 @@ def get_sequence_challenge() -> SequenceChallenge:
 )
 async def calculate_sequence(
     input_data: SequenceInput,
-    challenge: SequenceChallenge = Depends(get_sequence_challenge),
+    challenge: IChallenge = Depends(get_sequence_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
 ):
     """
     Calculate a specific element in a mathematical sequence.
@@ -40,15 +61,19 @@ async def calculate_sequence(
             - position (int): The position in the sequence to calculate
             - Additional sequence parameters as defined in SequenceInput
 
-        challenge (SequenceChallenge): Sequence calculation service instance,
+        challenge (IChallenge): Sequence calculation service instance,
             automatically injected via dependency injection.
 
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
     Returns:
         SequenceOutput: Object containing the calculated sequence value
         at the specified position and potentially additional
         sequence information.
 
     Raises:
+        ExecutorSaturated: If the execution backend is saturated (503).
         HTTPException: If input data is invalid or the calculation fails.
 
     Example:
@@ -58,5 +83,233 @@ async def calculate_sequence(
             // other sequence parameters if applicable
         }
     """
-    logger.info(f"Processing sequence challenge, position = {input_data.position}")
-    return challenge.execute(input_data)
+    logger.debug("Processing sequence challenge, position = %s", input_data.position)
+    result = await executor.run("sequence", challenge, input_data)
+    return challenge_response(result)
+
+
+@router.get(
+    "/",
+    response_model=SequenceOutput,
+    description=f"{DESCRIPTIONS['sequence']['description']} "
+    f"{DESCRIPTIONS['http_cache']['description']}",
+)
+async def lookup_sequence(
+    request: Request,
+    response: Response,
+    input_data: Annotated[SequenceInput, Query()],
+    challenge: IChallenge = Depends(get_sequence_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Calculate the sequence value at a position given in the query string.
+
+    The result carries a strong ETag derived from the input and the
+    configured Cache-Control header; when If-None-Match already holds the
+    ETag, a 304 is returned without running the challenge.
+
+    Args:
+        request (Request): The incoming request, for If-None-Match
+        response (Response): Response receiving the caching headers
+        input_data (SequenceInput): Query parameters:
+            - position (int): The position to calculate (> 0)
+        challenge (IChallenge): Sequence calculation service instance.
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
+    Returns:
+        SequenceOutput: Same result as POST /sequence/, or an empty
+        304 response
+
+    Example:
+        Request:
+        GET /api/v1/sequence/?position=10
+    """
+    cached = not_modified(request, response, "sequence", input_data)
+    if cached is not None:
+        return cached
+    result = await executor.run("sequence", challenge, input_data)
+    return challenge_response(result, response)
+
+
+@router.post(
+    "/batch",
+    response_model=SequenceBatchOutput,
+    description=DESCRIPTIONS["sequence_batch"]["description"],
+)
+async def calculate_sequence_batch(
+    input_data: SequenceBatchInput,
+    challenge: IChallenge = Depends(get_sequence_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Calculate the sequence values at a list of positions.
+
+    Args:
+        input_data (SequenceBatchInput): Input data containing:
+            - positions (List[int]): 1-indexed positions (each >= 1)
+
+        challenge (IChallenge): Sequence calculation service instance,
+            automatically injected via dependency injection.
+
+        executor (ChallengeExecutor): Dispatches the batch to the
+            execution backend configured for sequence in Settings.
+
+    Returns:
+        SequenceBatchOutput: The value at each position, in input order.
+
+    Raises:
+        HTTPException: 413 if there are more than
+            SEQUENCE_BATCH_MAX_POSITIONS positions.
+
+    Example:
+        Request payload:
+        {"positions": [1, 5, 10]}
+
+        Response:
+        {"results": [11, 39, 74]}
+    """
+    if len(input_data.positions) > settings.SEQUENCE_BATCH_MAX_POSITIONS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {settings.SEQUENCE_BATCH_MAX_POSITIONS} positions",
+        )
+    results = await executor.submit(
+        "sequence", challenge.execute_many, input_data.positions
+    )
+    return challenge_response(SequenceBatchOutput(results=results))
+
+
+@router.post(
+    "/range",
+    response_class=StreamingResponse,
+    description=DESCRIPTIONS["sequence_range"]["description"],
+)
+async def stream_sequence_range(
+    input_data: SequenceRangeStreamInput,
+    challenge: IChallenge = Depends(get_sequence_challenge),
+):
+    """
+    Stream the sequence values at the positions of a range.
+
+    Values are encoded in chunks as they are sent, so memory use does not
+    depend on the size of the range.
+
+    Args:
+        input_data (SequenceRangeStreamInput): Input data containing:
+            - start (int): First position (>= 1)
+            - stop (int): Position where the range stops (exclusive)
+            - step (int): Distance between positions (>= 1)
+            - format (str): "ndjson" (default) or "binary"
+
+        challenge (IChallenge): Sequence calculation service instance,
+            automatically injected via dependency injection.
+
+    Returns:
+        StreamingResponse: With format "ndjson", lines holding JSON arrays
+        of consecutive values (application/x-ndjson); with "binary", the
+        values as little-endian int64 (application/octet-stream).
+
+    Raises:
+        HTTPException: 413 if the range holds more than
+            SEQUENCE_RANGE_MAX_TERMS terms, 400 if a binary value does not
+            fit in an int64.
+
+    Example:
+        Request payload:
+        {"start": 1, "stop": 6, "format": "ndjson"}
+
+        Response:
+        [11,18,25,32,39]
+    """
+    count = challenge.range_count(input_data)
+    if count > settings.SEQUENCE_RANGE_MAX_TERMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Range exceeds {settings.SEQUENCE_RANGE_MAX_TERMS} terms",
+        )
+    binary = input_data.format == "binary"
+    chunks = challenge.iter_range_chunks(input_data, binary)
+    try:
+        # O primeiro bloco valida o range antes de enviar o status 200
+        first = next(chunks, b"")
+    except OverflowError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    def body():
+        yield first
+        yield from chunks
+
+    logger.debug("Streaming sequence range of %s terms", count)
+    return StreamingResponse(
+        body(),
+        media_type="application/octet-stream" if binary else "application/x-ndjson",
+        headers={"X-Sequence-Count": str(count)},
+    )
+
+
+@router.post(
+    "/sum",
+    response_model=SequenceSumOutput,
+    description=DESCRIPTIONS["sequence_sum"]["description"],
+)
+async def calculate_sequence_sum(
+    input_data: SequenceRangeInput,
+    challenge: IChallenge = Depends(get_sequence_challenge),
+):
+    """
+    Calculate the partial sum of the values at the positions of a range.
+
+    Args:
+        input_data (SequenceRangeInput): Input data containing:
+            - start (int): First position (>= 1)
+            - stop (int): Position where the range stops (exclusive)
+            - step (int): Distance between positions (>= 1)
+
+        challenge (IChallenge): Sequence calculation service instance,
+            automatically injected via dependency injection.
+
+    Returns:
+        SequenceSumOutput: Number of terms and the sum of their values.
+
+    Example:
+        Request payload:
+        {"start": 1, "stop": 4}
+
+        Response:
+        {"count": 3, "sum": 54}
+    """
+    return challenge_response(challenge.range_sum(input_data))
+
+
+@router.post(
+    "/position",
+    response_model=SequencePositionOutput,
+    description=DESCRIPTIONS["sequence_position"]["description"],
+)
+async def find_sequence_position(
+    input_data: SequenceValueInput,
+    challenge: IChallenge = Depends(get_sequence_challenge),
+):
+    """
+    Find which position of the sequence holds a value.
+
+    Args:
+        input_data (SequenceValueInput): Input data containing:
+            - value (int): The value to look up
+
+        challenge (IChallenge): Sequence calculation service instance,
+            automatically injected via dependency injection.
+
+    Returns:
+        SequencePositionOutput: The 1-indexed position, or null when the
+        value is not a term of the sequence.
+
+    Example:
+        Request payload:
+        {"value": 39}
+
+        Response:
+        {"position": 5}
+    """
+    return challenge_response(challenge.position_of(input_data))
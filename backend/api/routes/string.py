@@ -1,28 +1,47 @@
-from fastapi import APIRouter, Depends
+import json
+from typing import Annotated, AsyncIterator, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from core.admission import AdmissionRejected
 from core.logging import logger
+from core.config import settings
+from core.executor import ChallengeExecutor, get_executor
 from core.description import DESCRIPTIONS
+from core.http_cache import not_modified
+from core.responses import challenge_response
+from core.streaming import (
+    DuplexStreamingResponse,
+    LineTooLong,
+    iter_line_batches,
+    read_edges,
+)
+from src.challenges.base_challenge import IChallenge
+from src.challenges.registry import registry
 from core.validators import StringInput, StringOutput
-from src.challenges.string_challenge import StringChallenge
 
 router = APIRouter(prefix="/string")
 
 
-def get_string_challenge() -> StringChallenge:
+def get_string_challenge() -> IChallenge:
     """
-    Dependency provider for StringChallenge instance.
+    Dependency provider for the shared StringChallenge instance.
+
+    The instance is built once by the challenge registry and reused by
+    every request.
 
     Returns:
-        StringChallenge: An instance of StringChallenge class
-        for use in the string processing endpoint.
+        IChallenge: The registered StringChallenge for use in the
+        string processing endpoint.
     """
-    return StringChallenge()
+    return registry.get("string")
 
 
 @router.post(
     "/", response_model=StringOutput, description=DESCRIPTIONS["string"]["description"]
 )
 async def check_string(
-    input_data: StringInput, challenge: StringChallenge = Depends(get_string_challenge)
+    input_data: StringInput,
+    challenge: IChallenge = Depends(get_string_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
 ):
     """
     Process and analyze a string according to specific challenge rules.
@@ -37,15 +56,19 @@ async def check_string(
             - Additional parameters for string processing rules
             as defined in StringInput
 
-        challenge (StringChallenge): String processing service instance,
+        challenge (IChallenge): String processing service instance,
             automatically injected via dependency injection.
 
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
     Returns:
         StringOutput: Object containing the processing results,
         which may include validation outcomes, transformed strings,
         or analysis data.
 
     Raises:
+        ExecutorSaturated: If the execution backend is saturated (503).
         HTTPException: If input data is invalid or processing fails.
 
     Example:
@@ -55,6 +78,220 @@ async def check_string(
             // other processing parameters if applicable
         }
     """
-    logger.info("Received request to check string")
-    result = challenge.execute(input_data)
-    return result
+    logger.debug("Received request to check string")
+    result = await executor.run("string", challenge, input_data)
+    return challenge_response(result)
+
+
+@router.get(
+    "/",
+    response_model=StringOutput,
+    description=f"{DESCRIPTIONS['string']['description']} "
+    f"{DESCRIPTIONS['http_cache']['description']}",
+)
+async def lookup_string(
+    request: Request,
+    response: Response,
+    input_data: Annotated[StringInput, Query()],
+    challenge: IChallenge = Depends(get_string_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Validate a string given in the query string.
+
+    The result carries a strong ETag derived from the input and the
+    configured Cache-Control header; when If-None-Match already holds the
+    ETag, a 304 is returned without running the challenge.
+
+    Args:
+        request (Request): The incoming request, for If-None-Match
+        response (Response): Response receiving the caching headers
+        input_data (StringInput): Query parameters:
+            - text (str): The string to validate
+        challenge (IChallenge): String processing service instance.
+        executor (ChallengeExecutor): Dispatches the challenge to the
+            execution backend configured for it in Settings.
+
+    Returns:
+        StringOutput: Same result as POST /string/, or an empty
+        304 response
+
+    Example:
+        Request:
+        GET /api/v1/string/?text=BHA
+    """
+    cached = not_modified(request, response, "string", input_data)
+    if cached is not None:
+        return cached
+    result = await executor.run("string", challenge, input_data)
+    return challenge_response(result, response)
+
+
+@router.post(
+    "/raw",
+    response_model=StringOutput,
+    description=DESCRIPTIONS["string_raw"]["description"],
+)
+async def check_string_raw(
+    request: Request,
+    challenge: IChallenge = Depends(get_string_challenge),
+):
+    """
+    Validate a string sent as the raw request body.
+
+    Intended for multi-megabyte strings: the body (text/plain or
+    application/octet-stream, UTF-8 encoded) is read chunk by chunk and
+    only its first and last four bytes are kept, so no JSON decoding,
+    Python str or Pydantic model of the full text is ever built. The rule
+    only depends on the first and last code points, which are decoded from
+    those bytes; the middle of the body is not checked for valid UTF-8.
+
+    Args:
+        request (Request): The incoming request carrying the text
+
+        challenge (IChallenge): String processing service instance,
+            automatically injected via dependency injection.
+
+    Returns:
+        StringOutput: Object containing the validation result.
+
+    Raises:
+        HTTPException: 422 if the body is empty, 400 if either end of the
+            body is not a valid UTF-8 code point.
+
+    Example:
+        Request payload (text/plain):
+        BHA
+    """
+    head, tail, length = await read_edges(request)
+    logger.debug("Received raw string of %s bytes", length)
+    if not length:
+        raise HTTPException(
+            status_code=422, detail="text: String should have at least 1 character"
+        )
+    try:
+        result = challenge.execute_edges(head, tail)
+    except UnicodeDecodeError as exc:
+        raise HTTPException(status_code=400, detail=f"Body is not valid UTF-8: {exc}")
+    return challenge_response(result)
+
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl")
+
+
+@router.post(
+    "/stream",
+    response_class=DuplexStreamingResponse,
+    description=DESCRIPTIONS["string_stream"]["description"],
+)
+async def check_string_stream(
+    request: Request,
+    challenge: IChallenge = Depends(get_string_challenge),
+    executor: ChallengeExecutor = Depends(get_executor),
+):
+    """
+    Validate a stream of strings, answering while the upload is read.
+
+    The body is newline-delimited: one raw string per line (text/plain) or
+    one JSON object with a "text" field, or a JSON string, per line
+    (application/x-ndjson). Empty lines are skipped. Each chunk of the
+    upload is validated as soon as it arrives and its results are sent
+    back immediately, so neither the body nor the results are ever held
+    in memory as a whole.
+
+    Args:
+        request (Request): The incoming request carrying the strings
+
+        challenge (IChallenge): String processing service instance,
+            automatically injected via dependency injection.
+
+        executor (ChallengeExecutor): Dispatches each chunk to the
+            execution backend configured for string in Settings.
+
+    Returns:
+        DuplexStreamingResponse: NDJSON body with one line per input line,
+        in input order: {"index": i, "is_valid": bool}, or
+        {"index": i, "error": "..."} for lines that cannot be parsed. If the
+        upload itself is unreadable (e.g. a line longer than
+        STRING_STREAM_MAX_LINE_BYTES) or goes over the admission budget
+        while it is read, a final {"error": "..."} line is sent and the
+        stream ends.
+
+    Example:
+        Request payload (application/x-ndjson):
+        {"text": "BHA"}
+        {"text": "hello"}
+
+        Response:
+        {"index": 0, "is_valid": true}
+        {"index": 1, "is_valid": false}
+    """
+    media_type = request.headers.get("content-type", "text/plain")
+    is_ndjson = media_type.split(";")[0].strip().lower() in NDJSON_MEDIA_TYPES
+    logger.debug("Streaming string validation, ndjson=%s", is_ndjson)
+    return DuplexStreamingResponse(
+        _stream_results(request, challenge, executor, is_ndjson),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _stream_results(
+    request: Request,
+    challenge: IChallenge,
+    executor: ChallengeExecutor,
+    is_ndjson: bool,
+) -> AsyncIterator[bytes]:
+    index = 0
+    try:
+        async for lines in iter_line_batches(
+            request, settings.STRING_STREAM_MAX_LINE_BYTES
+        ):
+            parsed = [_parse_line(line, is_ndjson) for line in lines]
+            texts = [text for text, _ in parsed]
+            results = await executor.submit("string", challenge.execute_many, texts)
+            output = []
+            for (_, error), is_valid in zip(parsed, results):
+                if error is None:
+                    item = {"index": index, "is_valid": is_valid}
+                else:
+                    item = {"index": index, "error": error}
+                output.append(json.dumps(item))
+                index += 1
+            yield ("\n".join(output) + "\n").encode("utf-8")
+    except LineTooLong as exc:
+        yield (json.dumps({"error": str(exc)}) + "\n").encode("utf-8")
+    except AdmissionRejected as exc:
+        # O status 200 já foi enviado: a recusa vai na última linha
+        yield (json.dumps({"error": exc.detail}) + "\n").encode("utf-8")
+
+
+def _parse_line(line: bytes, is_ndjson: bool) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract the string to validate from one line of the upload.
+
+    Args:
+        line (bytes): A non-empty line, without its terminator
+        is_ndjson (bool): Whether the line is a JSON value
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The string and None, or None
+        and an error message
+    """
+    try:
+        text = line.decode("utf-8")
+    except UnicodeDecodeError:
+        return None, "line is not valid UTF-8"
+    if not is_ndjson:
+        return text, None
+
+    try:
+        value = json.loads(text)
+    except ValueError as exc:
+        return None, f"invalid JSON: {exc}"
+    if isinstance(value, dict):
+        value = value.get("text")
+    if not isinstance(value, str):
+        return None, "text: Input should be a valid string"
+    if not value:
+        return None, "text: String should have at least 1 character"
+    return value, None
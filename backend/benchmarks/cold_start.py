@@ -0,0 +1,76 @@
+"""
+Cold start probe, run in a fresh interpreter by the benchmark suite.
+
+Imports the application, runs its startup (lifespan) and serves one
+request in process, then prints the time of each phase as JSON:
+
+    python -m benchmarks.cold_start
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import sys  # noqa: E402
+
+
+async def _first_request(app) -> int:
+    body = json.dumps({"position": 5}).encode()
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/sequence/",
+        "raw_path": b"/api/v1/sequence/",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 80),
+        "app": app,
+    }
+    await app(scope, receive, send)
+    return status[0]
+
+
+async def _probe() -> dict:
+    import main
+
+    imported = time.perf_counter()
+    app = main.app
+    created = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        status = await _first_request(app)
+        served = time.perf_counter()
+    return {
+        "import_s": imported - _START,
+        "create_app_s": created - imported,
+        "startup_s": started - created,
+        "first_request_s": served - started,
+        "ready_s": served - _START,
+        "status": status,
+    }
+
+
+if __name__ == "__main__":
+    json.dump(asyncio.run(_probe()), sys.stdout)
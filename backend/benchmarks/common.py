@@ -0,0 +1,111 @@
+import json
+import math
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Sequence
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        values (Sequence[float]): Samples, in any order
+        fraction (float): Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        float: The sample at that rank, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(fn: Callable[[], object], repeats: int, warmup: int = 1) -> Dict:
+    """
+    Time a callable several times.
+
+    Args:
+        fn (Callable[[], object]): Code under measurement
+        repeats (int): Number of timed runs
+        warmup (int): Untimed runs executed first
+
+    Returns:
+        Dict: min, median and mean time in seconds, and the number of
+        repeats. "value" (the median) is the figure compared against the
+        baseline.
+    """
+    for _ in range(warmup):
+        fn()
+    times: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    return {
+        "value": median,
+        "min_s": min(times),
+        "median_s": median,
+        "mean_s": statistics.fmean(times),
+        "repeats": repeats,
+    }
+
+
+def latency_summary(latencies: Sequence[float], elapsed: float, errors: int) -> Dict:
+    """
+    Summarize request latencies of a throughput run.
+
+    Args:
+        latencies (Sequence[float]): Latency of each request, in seconds
+        elapsed (float): Wall-clock duration of the run, in seconds
+        errors (int): Number of failed requests
+
+    Returns:
+        Dict: Request count, throughput, latency percentiles in
+        milliseconds and error rate. "value" (p50 in seconds) is the figure
+        compared against the baseline.
+    """
+    count = len(latencies)
+    return {
+        "value": percentile(latencies, 0.50),
+        "requests": count,
+        "throughput_rps": count / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p90_ms": percentile(latencies, 0.90) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "p999_ms": percentile(latencies, 0.999) * 1000,
+        "max_ms": max(latencies, default=0.0) * 1000,
+        "errors": errors,
+        "error_rate": errors / count if count else 0.0,
+    }
+
+
+def environment() -> Dict:
+    """
+    Describe the machine the benchmarks ran on.
+
+    Returns:
+        Dict: Timestamp, Python version and platform
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def write_json(path: str, data: Dict) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def read_json(path: str) -> Dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
@@ -0,0 +1,442 @@
+"""
+Load generator for the challenge API.
+
+Run from the backend directory:
+
+    python -m benchmarks.load                          # in-process app, closed loop
+    python -m benchmarks.load --concurrency 64 --duration 30
+    python -m benchmarks.load --url http://localhost --rate 50,100,200,400
+    python -m benchmarks.load --url http://localhost:8001 --mix board_game=1
+
+Requests replay a weighted mix of the string, sequence, board_game and
+benefits endpoints (--mix), drawn from a pool of --distinct pre-built
+payloads per endpoint whose sizes follow long-tailed distributions:
+mostly short strings and small boards, with occasional large ones.
+
+Two modes are supported:
+    - closed loop (default): --concurrency clients, each sending its next
+      request as soon as the previous one is answered
+    - open loop (--rate): requests start at a constant rate whatever the
+      response times. Latency is measured from the scheduled start, so
+      time spent waiting for a free connection (--max-in-flight) counts,
+      and an overloaded server shows up as growing latency rather than
+      as a lower request rate. Several comma-separated rates run as
+      successive steps, to find the breaking point.
+
+Without --url, the app is created in this process (with its startup and
+shutdown) and called through httpx's ASGI transport; the client then
+shares the CPU with the app. With --url, any running deployment is
+targeted, e.g. the compose stack through nginx (http://localhost) or the
+backend directly (http://localhost:8001).
+
+Each step reports throughput, p50/p99/p999 latency, error rate and
+status counts, overall and per endpoint, and is written as JSON
+(--output).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import sys
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import environment, latency_summary, write_json
+
+DEFAULT_OUTPUT = "load_results.json"
+DEFAULT_MIX = "string=40,sequence=30,board_game=15,benefits=15"
+
+PATHS = {
+    "string": "/api/v1/string/",
+    "sequence": "/api/v1/sequence/",
+    "board_game": "/api/v1/board_game/",
+    "benefits": "/api/v1/benefits/",
+}
+
+# Tabuleiros maiores que isso pedem combinações em log10
+_EXACT_MAX_CELLS = 2000
+
+
+def _long_tail(rng: random.Random, median: float, sigma: float, high: int) -> int:
+    # Log-normal: a maioria perto da mediana, alguns muito maiores
+    return max(1, min(high, int(rng.lognormvariate(math.log(median), sigma))))
+
+
+def string_payload(rng: random.Random, max_size: int) -> dict:
+    length = _long_tail(rng, 24, 1.5, max_size)
+    first = "B" if rng.random() < 0.8 else "C"
+    last = "A" if rng.random() < 0.6 else "Z"
+    return {"text": first + "x" * max(0, length - 2) + last}
+
+
+def sequence_payload(rng: random.Random, max_size: int) -> dict:
+    return {"position": int(10 ** rng.uniform(0, 9))}
+
+
+def _board_cell(rng: random.Random, cell: int) -> int:
+    roll = rng.random()
+    if roll < 0.7:
+        return 0
+    if roll < 0.9:
+        return rng.randint(1, 6)
+    # Recuo que nunca volta para antes da casa inicial
+    return -rng.randint(1, min(6, cell))
+
+
+def board_game_payload(rng: random.Random, max_size: int) -> dict:
+    size = max(3, _long_tail(rng, 64, 1.2, max_size))
+    # Casa inicial sem salto, como num tabuleiro de verdade
+    board = [0] + [_board_cell(rng, cell) for cell in range(1, size)]
+    mode = "exact" if size <= _EXACT_MAX_CELLS else "log10"
+    return {"board_size": size, "board": board, "combinations_mode": mode}
+
+
+def benefits_payload(rng: random.Random, max_size: int) -> dict:
+    hire_date = date(1990, 1, 1) + timedelta(days=rng.randint(0, 12_500))
+    tenure = timedelta(days=int(rng.expovariate(1 / 900)))
+    return {
+        "salary": round(max(1.0, rng.lognormvariate(math.log(4_000), 0.6)), 2),
+        "hire_date": str(hire_date),
+        "resignation_date": str(min(hire_date + tenure, date(2025, 12, 31))),
+    }
+
+
+GENERATORS: Dict[str, Callable[[random.Random, int], dict]] = {
+    "string": string_payload,
+    "sequence": sequence_payload,
+    "board_game": board_game_payload,
+    "benefits": benefits_payload,
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """
+    Parse a request mix such as "string=40,board_game=10".
+
+    Args:
+        text (str): Comma-separated endpoint=weight pairs
+
+    Returns:
+        Dict[str, float]: Weight per endpoint
+
+    Raises:
+        ValueError: On unknown endpoints or non-positive weights
+    """
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in PATHS:
+            raise ValueError(f"Unknown endpoint in mix: {name!r}")
+        mix[name] = float(weight or 1)
+        if mix[name] <= 0:
+            raise ValueError(f"Weight of {name} must be positive")
+    return mix
+
+
+class Workload:
+    """
+    Pre-built request bodies and the mix they are drawn from.
+
+    Bodies are encoded once, up front, so generating load costs as little
+    client time as possible.
+    """
+
+    def __init__(
+        self,
+        mix: Dict[str, float],
+        distinct: int = 1000,
+        max_string: int = 65_536,
+        max_board: int = 20_000,
+        seed: int = 1,
+    ):
+        self._rng = random.Random(seed)
+        limits = {"string": max_string, "board_game": max_board}
+        self.names = list(mix)
+        self.weights = [mix[name] for name in self.names]
+        self.bodies = {
+            name: [
+                json.dumps(GENERATORS[name](self._rng, limits.get(name, 0))).encode()
+                for _ in range(max(1, distinct))
+            ]
+            for name in self.names
+        }
+
+    def next(self) -> Tuple[str, bytes]:
+        """Return the endpoint name and body of the next request."""
+        name = self._rng.choices(self.names, self.weights)[0]
+        return name, self._rng.choice(self.bodies[name])
+
+
+class Recorder:
+    """Latencies, status codes and failures of the requests of one step."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {name: [] for name in PATHS}
+        self.statuses: Dict[str, Counter] = {name: Counter() for name in PATHS}
+
+    async def send(self, client, name: str, body: bytes, start: float) -> None:
+        """
+        Send one request and record it.
+
+        Args:
+            client (httpx.AsyncClient): Client used for the request
+            name (str): Endpoint name
+            body (bytes): JSON body
+            start (float): perf_counter() instant latency is measured from
+        """
+        try:
+            response = await client.post(
+                PATHS[name], content=body, headers={"content-type": "application/json"}
+            )
+            status = str(response.status_code)
+        except Exception as exc:
+            # Sem resposta (timeout, conexão recusada): conta pelo tipo
+            status = type(exc).__name__
+        self.latencies[name].append(time.perf_counter() - start)
+        self.statuses[name][status] += 1
+
+    def summary(self, elapsed: float) -> Dict:
+        """
+        Summarize the step, overall and per endpoint.
+
+        Requests without a response or answered with a 4xx/5xx status are
+        errors.
+
+        Args:
+            elapsed (float): Duration of the step, in seconds
+
+        Returns:
+            Dict: latency_summary fields plus status counts, with an
+            "endpoints" entry holding the same figures per endpoint
+        """
+
+        def summarize(latencies: List[float], statuses: Counter) -> Dict:
+            errors = sum(
+                count
+                for status, count in statuses.items()
+                if not status.isdigit() or int(status) >= 400
+            )
+            result = latency_summary(latencies, elapsed, errors)
+            result["statuses"] = dict(statuses)
+            return result
+
+        endpoints = {
+            name: summarize(self.latencies[name], self.statuses[name])
+            for name in PATHS
+            if self.latencies[name]
+        }
+        everything = summarize(
+            [value for values in self.latencies.values() for value in values],
+            sum(self.statuses.values(), Counter()),
+        )
+        everything["endpoints"] = endpoints
+        return everything
+
+
+async def run_closed(
+    client, workload: Workload, concurrency: int, duration: float, requests: int
+) -> Dict:
+    """
+    Run a closed-loop step: each client waits for its previous response.
+
+    Args:
+        client (httpx.AsyncClient): Client used for the requests
+        workload (Workload): Request mix
+        concurrency (int): Number of simultaneous clients
+        duration (float): Seconds to run, if requests is 0
+        requests (int): Total number of requests; 0 to run for duration
+
+    Returns:
+        Dict: Step summary (see Recorder.summary)
+    """
+    recorder = Recorder()
+    started = time.perf_counter()
+    deadline = started + duration
+    remaining = iter(range(requests)) if requests else None
+
+    async def worker() -> None:
+        while True:
+            if remaining is not None:
+                if next(remaining, None) is None:
+                    return
+            elif time.perf_counter() >= deadline:
+                return
+            name, body = workload.next()
+            await recorder.send(client, name, body, time.perf_counter())
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return recorder.summary(time.perf_counter() - started)
+
+
+async def run_open(
+    client, workload: Workload, rate: float, duration: float, max_in_flight: int
+) -> Dict:
+    """
+    Run an open-loop step: requests start at a constant rate.
+
+    Requests are scheduled every 1/rate seconds for duration seconds. At
+    most max_in_flight are outstanding; later ones wait for a slot, and
+    that wait is part of their latency, measured from the scheduled start.
+
+    Args:
+        client (httpx.AsyncClient): Client used for the requests
+        workload (Workload): Request mix
+        rate (float): Requests started per second
+        duration (float): Seconds during which requests are started
+        max_in_flight (int): Maximum number of outstanding requests
+
+    Returns:
+        Dict: Step summary (see Recorder.summary), with the target rate
+    """
+    recorder = Recorder()
+    slots = asyncio.Semaphore(max(1, max_in_flight))
+    interval = 1 / rate
+    count = max(1, int(rate * duration))
+    tasks = []
+
+    async def fire(name: str, body: bytes, scheduled: float) -> None:
+        async with slots:
+            await recorder.send(client, name, body, scheduled)
+
+    started = time.perf_counter()
+    for index in range(count):
+        scheduled = started + index * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        name, body = workload.next()
+        tasks.append(asyncio.ensure_future(fire(name, body, scheduled)))
+    await asyncio.gather(*tasks)
+    result = recorder.summary(time.perf_counter() - started)
+    result["target_rps"] = rate
+    return result
+
+
+@asynccontextmanager
+async def open_client(
+    url: Optional[str], connections: int, timeout: float
+) -> AsyncIterator:
+    """
+    Open an HTTP client for a deployment, or for an in-process app.
+
+    Args:
+        url (Optional[str]): Base URL of the deployment; None to create the
+            app in this process, running its startup and shutdown
+        connections (int): Maximum number of open connections
+        timeout (float): Timeout of each request, in seconds
+
+    Yields:
+        httpx.AsyncClient: The client
+    """
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=connections, max_keepalive_connections=connections
+    )
+    if url is not None:
+        async with httpx.AsyncClient(
+            base_url=url, limits=limits, timeout=timeout
+        ) as client:
+            yield client
+        return
+
+    from main import create_app
+
+    # Mede a aplicação, não o log de cada requisição
+    disabled = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        app = create_app()
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://load",
+                limits=limits,
+                timeout=timeout,
+            ) as client:
+                yield client
+    finally:
+        logging.disable(disabled)
+
+
+async def run_load(args: argparse.Namespace) -> Dict[str, Dict]:
+    workload = Workload(
+        parse_mix(args.mix),
+        distinct=args.distinct,
+        max_string=args.max_string,
+        max_board=args.max_board,
+        seed=args.seed,
+    )
+    rates = [float(rate) for rate in args.rate.split(",")] if args.rate else []
+    connections = args.max_in_flight if rates else args.concurrency
+    results: Dict[str, Dict] = {}
+    async with open_client(args.url, connections, args.timeout) as client:
+        if not rates:
+            name = f"closed[concurrency={args.concurrency}]"
+            results[name] = await run_closed(
+                client, workload, args.concurrency, args.duration, args.requests
+            )
+            print(f"  {name}: {format_summary(results[name])}", file=sys.stderr)
+        for rate in rates:
+            name = f"open[rate={rate:g}]"
+            results[name] = await run_open(
+                client, workload, rate, args.duration, args.max_in_flight
+            )
+            print(f"  {name}: {format_summary(results[name])}", file=sys.stderr)
+    return results
+
+
+def format_summary(result: Dict) -> str:
+    return (
+        f"{result['throughput_rps']:.0f} req/s, p50={result['p50_ms']:.2f}ms "
+        f"p99={result['p99_ms']:.2f}ms p999={result['p999_ms']:.2f}ms "
+        f"errors={result['error_rate']:.2%}"
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--rate", default="")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--requests", type=int, default=0)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--distinct", type=int, default=1000)
+    parser.add_argument("--max-string", type=int, default=65_536)
+    parser.add_argument("--max-board", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_load(args))
+    write_json(
+        args.output,
+        {
+            "environment": environment(),
+            "target": args.url or "in-process",
+            "mix": parse_mix(args.mix),
+            "results": results,
+        },
+    )
+
+    print(f"\n{'step':<28} {'endpoint':<12} result")
+    for step, result in results.items():
+        print(f"{step:<28} {'all':<12} {format_summary(result)}")
+        for endpoint, figures in result["endpoints"].items():
+            print(f"{'':<28} {endpoint:<12} {format_summary(figures)}")
+        print(f"{'':<28} {'statuses':<12} {result['statuses']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,456 @@
+"""
+Benchmark suite for the challenges and the HTTP API.
+
+Run from the backend directory:
+
+    python -m benchmarks.run                   # full suite
+    python -m benchmarks.run --quick           # smaller inputs, fewer repeats
+    python -m benchmarks.run --only board_game # cases whose name contains it
+    python -m benchmarks.run --save-baseline   # store results as the baseline
+    python -m benchmarks.run --only cold_start # startup time of fresh processes
+    python -m benchmarks.run --only http_response # FAST_RESPONSES on and off
+
+Results are printed as a table and written as JSON (--output). When a
+baseline file exists, every case is compared against it and cases slower
+than the baseline by more than --tolerance are reported as regressions
+(exit code 1 with --fail-on-regression). The committed baseline
+(benchmarks/baseline.json) was measured on a single-core machine, as
+its "environment" entry records; timings only compare within a machine,
+so regenerate it with --save-baseline before relying on the comparison
+elsewhere.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from benchmarks.common import (
+    environment,
+    latency_summary,
+    measure,
+    read_json,
+    write_json,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+# (nome, função medida, repetições)
+Case = Tuple[str, Callable[[], object], int]
+
+# Meta de partida a frio: importar, criar o app, iniciar e responder a 1ª
+# requisição em processo, num interpretador novo
+COLD_START_TARGET_S = 1.0
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def board_game_cases(quick: bool) -> Iterator[Case]:
+    from core.validators import BoardGameInput
+    from src.challenges.board_game_challenge import BoardGameChallenge
+
+    challenge = BoardGameChallenge()
+    rng = random.Random(1)
+    sizes = [10, 100, 1_000, 10_000] + ([] if quick else [100_000, 1_000_000])
+    for size in sizes:
+        board = [rng.randint(1, 6) for _ in range(size)]
+        repeats = 3 if size >= 100_000 else 10
+        modes = [("mod", 1_000_000_007), ("log10", None)]
+        if size <= 10_000:
+            modes.insert(0, ("exact", None))
+        for mode, modulus in modes:
+            input_data = BoardGameInput(
+                board_size=size,
+                board=board,
+                combinations_mode=mode,
+                modulus=modulus,
+            )
+            yield (
+                f"board_game[n={size},mode={mode}]",
+                lambda input_data=input_data: challenge.execute(input_data),
+                repeats,
+            )
+
+    # Edição de uma sessão: custo proporcional ao índice editado
+    size = sizes[-1]
+    state = challenge.solve_state(
+        BoardGameInput(
+            board_size=size,
+            board=[rng.randint(1, 6) for _ in range(size)],
+            combinations_mode="mod",
+            modulus=1_000_000_007,
+        )
+    )
+    for index in (10, size // 2):
+        yield (
+            f"board_game_session_patch[n={size},index={index}]",
+            lambda index=index: state.update({index: rng.randint(1, 6)}),
+            10,
+        )
+
+
+def benefits_cases(quick: bool) -> Iterator[Case]:
+    from core.validators import BenefitsInput
+    from src.challenges.benefits_challenge import BenefitsChallenge
+
+    challenge = BenefitsChallenge()
+    rng = random.Random(2)
+    rows = 10_000 if quick else 100_000
+    first_day = date(1950, 1, 1)
+    inputs = []
+    for _ in range(rows):
+        hire_date = first_day + timedelta(days=rng.randint(0, 54_000))
+        resignation_date = min(
+            hire_date + timedelta(days=rng.randint(0, 20_000)), date(2100, 12, 31)
+        )
+        inputs.append(
+            BenefitsInput(
+                salary=round(rng.uniform(1_000, 50_000), 2),
+                hire_date=hire_date,
+                resignation_date=resignation_date,
+            )
+        )
+    scalar_rows = inputs[:10_000]
+
+    def scalar():
+        for row in scalar_rows:
+            try:
+                challenge.execute(row)
+            except ValueError:
+                pass
+
+    yield (f"benefits_execute[rows={len(scalar_rows)}]", scalar, 5)
+    # Mesmas linhas do caso escalar, para comparar custo por linha
+    yield (
+        f"benefits_execute_batch[rows={len(scalar_rows)}]",
+        lambda: challenge.execute_batch(scalar_rows),
+        5,
+    )
+    if rows > len(scalar_rows):
+        yield (
+            f"benefits_execute_batch[rows={rows}]",
+            lambda: challenge.execute_batch(inputs),
+            5,
+        )
+
+
+def string_cases(quick: bool) -> Iterator[Case]:
+    from core.validators import StringInput
+    from src.challenges.string_challenge import StringChallenge
+
+    challenge = StringChallenge()
+    sizes_mb = [1] if quick else [1, 4, 16]
+    for size_mb in sizes_mb:
+        text = "B" + "x" * (size_mb * 1024 * 1024 - 2) + "A"
+        input_data = StringInput(text=text)
+        yield (
+            f"string_execute[{size_mb}MB]",
+            lambda input_data=input_data: challenge.execute(input_data),
+            20,
+        )
+        yield (
+            f"string_validate_execute[{size_mb}MB]",
+            lambda text=text: challenge.execute(StringInput(text=text)),
+            10,
+        )
+
+
+def http_payloads(count: int = 64) -> Dict[str, List[dict]]:
+    """
+    Build distinct request bodies per endpoint, so cached challenges are
+    measured with a mix of hits and misses rather than a single hot key.
+    """
+    rng = random.Random(3)
+    return {
+        "/api/v1/string/": [
+            {"text": "B" + "x" * rng.randint(0, 64) + rng.choice("AB")}
+            for _ in range(count)
+        ],
+        "/api/v1/sequence/": [
+            {"position": rng.randint(1, 10**6)} for _ in range(count)
+        ],
+        "/api/v1/board_game/": [
+            {"board_size": 100, "board": [rng.randint(1, 6) for _ in range(100)]}
+            for _ in range(count)
+        ],
+        "/api/v1/benefits/": [
+            {
+                "salary": round(rng.uniform(1_000, 50_000), 2),
+                "hire_date": "2024-01-01",
+                "resignation_date": str(date(2024, 1, 1) + timedelta(days=i)),
+            }
+            for i in range(count)
+        ],
+    }
+
+
+async def run_http(path: str, payloads: List[dict], requests: int, concurrency: int):
+    """
+    Send requests to the in-process app and summarize their latency.
+
+    Args:
+        path (str): Endpoint path
+        payloads (List[dict]): JSON bodies, sent in round-robin
+        requests (int): Total number of requests
+        concurrency (int): Number of concurrent clients
+
+    Returns:
+        Dict: Throughput and latency percentiles (see latency_summary)
+    """
+    import httpx
+    from main import app
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker():
+            nonlocal errors
+            for index in remaining:
+                body = payloads[index % len(payloads)]
+                start = time.perf_counter()
+                response = await client.post(path, json=body)
+                latencies.append(time.perf_counter() - start)
+                if response.status_code >= 400:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return latency_summary(latencies, elapsed, errors)
+
+
+def http_results(quick: bool, only: str) -> Dict[str, Dict]:
+    requests = 300 if quick else 3_000
+    concurrency = 16
+    results = {}
+    for path, payloads in http_payloads().items():
+        name = f"http_post[{path}]"
+        if only and only not in name:
+            continue
+        results[name] = asyncio.run(run_http(path, payloads, requests, concurrency))
+    return results
+
+
+def response_results(quick: bool, only: str) -> Dict[str, Dict]:
+    """
+    Measure the per-request cost of the response path, with FastAPI's
+    response model handling ("validated") and with FAST_RESPONSES ("fast"):
+    a tiny response, where framework overhead dominates, and a benefits
+    batch of 1000 records, where it grows with the output.
+    """
+    from core.config import settings
+
+    requests = 300 if quick else 3_000
+    rng = random.Random(5)
+    batch = [
+        {
+            "salary": round(rng.uniform(1_000, 50_000), 2),
+            "hire_date": "2020-01-01",
+            "resignation_date": str(date(2021, 1, 1) + timedelta(days=i % 700)),
+        }
+        for i in range(1000)
+    ]
+    cases = {
+        "/api/v1/sequence/": ([{"position": 10}], requests),
+        "/api/v1/benefits/batch": ([batch], max(10, requests // 30)),
+    }
+    results = {}
+    fast_responses = settings.FAST_RESPONSES
+    try:
+        for mode, fast in (("validated", False), ("fast", True)):
+            settings.FAST_RESPONSES = fast
+            for path, (payloads, count) in cases.items():
+                name = f"http_response[{path}][{mode}]"
+                if only and only not in name:
+                    continue
+                results[name] = asyncio.run(run_http(path, payloads, count, 1))
+                print(f"  {name}: {format_result(results[name])}", file=sys.stderr)
+    finally:
+        settings.FAST_RESPONSES = fast_responses
+    return results
+
+
+def cold_start(runs: int, env: Dict[str, str] = None) -> Dict:
+    """
+    Measure the cold start of the application in fresh interpreters.
+
+    Each run starts "python -m benchmarks.cold_start", which imports the
+    app, runs its startup and serves one request in process, and reports
+    the time of each phase.
+
+    Args:
+        runs (int): Number of processes started
+        env (Dict[str, str]): Extra environment variables, e.g. settings
+
+    Returns:
+        Dict: Median time of each phase, the median time until the first
+        response as "value", and whether it is within COLD_START_TARGET_S
+    """
+    phases: Dict[str, List[float]] = {}
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.cold_start"],
+            cwd=BACKEND_DIR,
+            env={**os.environ, **(env or {})},
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        for phase, seconds in json.loads(completed.stdout).items():
+            if phase.endswith("_s"):
+                phases.setdefault(phase, []).append(seconds)
+    result = {phase: statistics.median(values) for phase, values in phases.items()}
+    result.update(
+        value=result["ready_s"],
+        runs=runs,
+        target_s=COLD_START_TARGET_S,
+        within_target=result["ready_s"] <= COLD_START_TARGET_S,
+    )
+    return result
+
+
+def cold_start_results(quick: bool, only: str) -> Dict[str, Dict]:
+    runs = 3 if quick else 10
+    variants = {
+        "cold_start[warmup]": {},
+        "cold_start[lazy]": {"CHALLENGE_WARMUP": "false"},
+    }
+    results = {}
+    for name, env in variants.items():
+        if only and only not in name:
+            continue
+        results[name] = cold_start(runs, env)
+        print(f"  {name}: {format_result(results[name])}", file=sys.stderr)
+    return results
+
+
+CASE_GROUPS = [board_game_cases, benefits_cases, string_cases]
+
+
+def run_suite(quick: bool = False, only: str = "") -> Dict[str, Dict]:
+    """
+    Run every benchmark case.
+
+    Args:
+        quick (bool): Use smaller inputs and fewer repeats
+        only (str): Only run cases whose name contains this text
+
+    Returns:
+        Dict[str, Dict]: Measurements keyed by case name
+    """
+    results: Dict[str, Dict] = {}
+    for group in CASE_GROUPS:
+        for name, fn, repeats in group(quick):
+            if only and only not in name:
+                continue
+            results[name] = measure(fn, repeats=1 if quick else repeats)
+            print(f"  {name}: {format_result(results[name])}", file=sys.stderr)
+    results.update(http_results(quick, only))
+    results.update(response_results(quick, only))
+    results.update(cold_start_results(quick, only))
+    return results
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float
+) -> List[Dict]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results (Dict[str, Dict]): Current measurements
+        baseline (Dict[str, Dict]): Baseline measurements
+        tolerance (float): Allowed slowdown, e.g. 0.2 for 20%
+
+    Returns:
+        List[Dict]: One entry per case present in both, with the ratio
+        current/baseline of their "value" and a regression flag
+    """
+    report = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference or not reference.get("value"):
+            continue
+        ratio = result["value"] / reference["value"]
+        report.append(
+            {"name": name, "ratio": ratio, "regression": ratio > 1 + tolerance}
+        )
+    return report
+
+
+def format_result(result: Dict) -> str:
+    if "ready_s" in result:
+        return (
+            f"ready={result['ready_s'] * 1000:.0f}ms "
+            f"(import={result['import_s'] * 1000:.0f}ms "
+            f"create_app={result['create_app_s'] * 1000:.0f}ms "
+            f"startup={result['startup_s'] * 1000:.0f}ms) "
+            f"target={result['target_s'] * 1000:.0f}ms"
+            + ("" if result["within_target"] else " MISSED")
+        )
+    if "throughput_rps" in result:
+        return (
+            f"{result['throughput_rps']:.0f} req/s, "
+            f"p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+            f"errors={result['errors']}"
+        )
+    return (
+        f"median={result['median_s'] * 1000:.3f}ms min={result['min_s'] * 1000:.3f}ms"
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--only", default="")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Benchmarks medem o código, não o log de cada requisição
+    logging.disable(logging.INFO)
+
+    results = run_suite(quick=args.quick, only=args.only)
+    data = {"environment": environment(), "quick": args.quick, "results": results}
+    write_json(args.output, data)
+
+    print(f"\n{'case':<48} result")
+    for name, result in results.items():
+        print(f"{name:<48} {format_result(result)}")
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        report = compare(results, read_json(args.baseline)["results"], args.tolerance)
+        print(f"\nComparison with {args.baseline} (tolerance {args.tolerance:.0%}):")
+        for entry in report:
+            flag = "REGRESSION" if entry["regression"] else "ok"
+            print(f"{entry['name']:<48} x{entry['ratio']:.2f} {flag}")
+        regressions = [entry for entry in report if entry["regression"]]
+
+    if args.save_baseline:
+        write_json(args.baseline, data)
+        print(f"\nBaseline saved to {args.baseline}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+# backend/core/admission.py
+import threading
+from typing import Dict, Optional
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.config import Settings, settings
+from core.metrics import admission_cost_in_flight, admission_rejected
+from src.challenges.registry import ChallengeRegistry, registry
+
+# Requisições sujeitas ao controle de admissão e prefixo das rotas de desafio
+ADMITTED_PREFIX = "/api/"
+CHALLENGE_PREFIX = "/api/v1/"
+# Rota de lotes, cujos itens podem ser de qualquer desafio
+BATCH_NAME = "batch"
+# Rotas que processam e descartam o corpo pedaço a pedaço
+STREAMED_PATHS = frozenset({"/api/v1/string/stream"})
+
+
+class AdmissionRejected(HTTPException):
+    """
+    413 or 429 error of a request refused by admission control.
+
+    Raised from the request's receive() when a body without
+    Content-Length goes over budget while it is read. Routes that stream
+    their response while reading the body have already sent their status
+    by then, so they catch it and report the error in the body instead.
+    """
+
+
+class AdmissionController:
+    """
+    Per-client and global budgets of the cost of in-flight requests.
+
+    Every admitted request holds its estimated cost until its response is
+    sent. A request is admitted only if its cost fits both in what is
+    left of its client's budget and in what is left of the global one;
+    a request that could never fit, however idle the server, is too large.
+
+    Attributes:
+        enabled (bool): Whether requests are checked at all
+        max_request_cost (float): Highest cost a single request may have
+        retry_after (int): Seconds sent in the Retry-After header of 429s
+    """
+
+    def __init__(self, config: Settings):
+        self.enabled = config.ADMISSION_ENABLED
+        self.max_request_cost = min(
+            config.ADMISSION_MAX_REQUEST_COST,
+            config.ADMISSION_CLIENT_BUDGET,
+            config.ADMISSION_GLOBAL_BUDGET,
+        )
+        self.retry_after = config.ADMISSION_RETRY_AFTER
+        self._client_header = config.ADMISSION_CLIENT_HEADER
+        self._client_budget = config.ADMISSION_CLIENT_BUDGET
+        self._global_budget = config.ADMISSION_GLOBAL_BUDGET
+        self._metrics_enabled = config.METRICS_ENABLED
+        self._in_flight: Dict[str, float] = {}
+        self._total = 0.0
+        self._lock = threading.Lock()
+
+    def client_id(self, scope: Scope, headers: Headers) -> str:
+        """
+        Identify the client a request is charged to.
+
+        Args:
+            scope (Scope): ASGI scope of the request
+            headers (Headers): Request headers
+
+        Returns:
+            str: Value of ADMISSION_CLIENT_HEADER (first address of a list)
+            when configured and present, otherwise the peer address
+        """
+        if self._client_header:
+            value = headers.get(self._client_header)
+            if value:
+                return value.split(",", 1)[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def try_acquire(self, client: str, cost: float) -> bool:
+        """
+        Charge a cost to a client if it fits in both budgets.
+
+        Args:
+            client (str): Client identifier
+            cost (float): Cost to add to the client's in-flight cost
+
+        Returns:
+            bool: True if the cost was charged, False if over budget
+        """
+        with self._lock:
+            used = self._in_flight.get(client, 0.0)
+            if (
+                used + cost > self._client_budget
+                or self._total + cost > self._global_budget
+            ):
+                return False
+            self._in_flight[client] = used + cost
+            self._total += cost
+        if self._metrics_enabled:
+            admission_cost_in_flight.inc(amount=cost)
+        return True
+
+    def release(self, client: str, cost: float) -> None:
+        with self._lock:
+            used = self._in_flight.get(client, 0.0) - cost
+            # Remove clientes ociosos para o dicionário não crescer sem limite
+            if used <= 1e-9:
+                self._in_flight.pop(client, None)
+            else:
+                self._in_flight[client] = used
+            self._total = max(0.0, self._total - cost)
+        if self._metrics_enabled:
+            admission_cost_in_flight.dec(amount=cost)
+
+    def in_flight(self, client: Optional[str] = None) -> float:
+        """
+        Return the cost currently charged to a client, or to all of them.
+
+        Args:
+            client (Optional[str]): Client identifier; None for the total
+
+        Returns:
+            float: The in-flight cost
+        """
+        with self._lock:
+            if client is None:
+                return self._total
+            return self._in_flight.get(client, 0.0)
+
+    def reject(self, status: int) -> AdmissionRejected:
+        """
+        Build the error returned for a rejected request.
+
+        Args:
+            status (int): 413 (request too costly) or 429 (over budget)
+
+        Returns:
+            AdmissionRejected: The error, with Retry-After on 429s
+        """
+        if self._metrics_enabled:
+            admission_rejected.inc(str(status))
+        if status == 413:
+            return AdmissionRejected(
+                status_code=413, detail="Request exceeds the admission cost limit"
+            )
+        return AdmissionRejected(
+            status_code=429,
+            detail="Admission budget exhausted, retry later",
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+
+def estimate_cost(
+    path: str, body_size: int, challenges: ChallengeRegistry = registry
+) -> float:
+    """
+    Estimate the cost of a request from its path and body size.
+
+    Requests to a challenge's routes (/api/v1/<name>/...) are estimated by
+    the challenge itself. Batches (/api/v1/batch/) may hold items of any
+    challenge, so they are charged as the costliest registered challenge
+    would charge the same body. Anything else is charged as linear-time
+    input.
+
+    Args:
+        path (str): Request path
+        body_size (int): Size of the body, in bytes
+        challenges (ChallengeRegistry): Registry resolving challenge names
+
+    Returns:
+        float: Estimated cost, in units of 1 KiB of linear-time input
+    """
+    if path.startswith(CHALLENGE_PREFIX):
+        name = path[len(CHALLENGE_PREFIX) :].split("/", 1)[0]
+        if name in challenges.names():
+            return challenges.unwrapped(name).estimate_cost(body_size)
+        if name == BATCH_NAME:
+            return max(
+                (
+                    challenges.unwrapped(other).estimate_cost(body_size)
+                    for other in challenges.names()
+                ),
+                default=1.0 + body_size / 1024,
+            )
+    return 1.0 + body_size / 1024
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware rejecting requests whose estimated cost is over budget.
+
+    The cost is estimated from Content-Length, plus the size of the query
+    string (which carries the input of GET requests), before the body is
+    read: requests costlier than ADMISSION_MAX_REQUEST_COST get a 413 and
+    requests over the client or global budget a 429, without the body
+    ever being received. Bodies without Content-Length (chunked) or
+    longer than declared are re-estimated as they arrive, and the reading
+    fails with the same errors, as AdmissionRejected, as soon as they go
+    over budget. The cost is held until the response, including streamed
+    ones, is finished.
+
+    Routes in STREAMED_PATHS hold only one chunk of their body at a time
+    (its lines are validated and dropped as it arrives), so their body
+    is charged by its largest chunk rather than by its total size, and
+    Content-Length is not used: a stream of any length costs what its
+    biggest chunk costs.
+    """
+
+    def __init__(self, app: ASGIApp, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or admission
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        controller = self.controller
+        if (
+            scope["type"] != "http"
+            or not controller.enabled
+            or not scope["path"].startswith(ADMITTED_PREFIX)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        path = scope["path"]
+        client = controller.client_id(scope, headers)
+        streamed = path in STREAMED_PATHS
+        content_length = headers.get("content-length", "")
+        declared = (
+            int(content_length) if content_length.isdigit() and not streamed else 0
+        )
+        query_size = len(scope.get("query_string", b""))
+        charged = estimate_cost(path, query_size + declared)
+        if charged > controller.max_request_cost:
+            await _send_error(controller.reject(413), scope, receive, send)
+            return
+        if not controller.try_acquire(client, charged):
+            await _send_error(controller.reject(429), scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_counted() -> Message:
+            nonlocal charged, received
+            message = await receive()
+            if message["type"] == "http.request":
+                size = len(message.get("body", b""))
+                # Corpo em fluxo: só o maior pedaço fica em memória por vez
+                metered = max(received, size) if streamed else received + size
+                if metered > received and metered > declared:
+                    # Corpo sem Content-Length: o custo cresce com os bytes
+                    cost = estimate_cost(path, query_size + metered)
+                    if cost > controller.max_request_cost:
+                        raise controller.reject(413)
+                    if not controller.try_acquire(client, cost - charged):
+                        raise controller.reject(429)
+                    charged = cost
+                received = metered
+            return message
+
+        try:
+            await self.app(scope, receive_counted, send)
+        finally:
+            controller.release(client, charged)
+
+
+async def _send_error(
+    exc: HTTPException, scope: Scope, receive: Receive, send: Send
+) -> None:
+    response = JSONResponse(
+        status_code=exc.status_code, content={"detail": exc.detail}, headers=exc.headers
+    )
+    await response(scope, receive, send)
+
+
+# Orçamentos do processo, compartilhados por todas as requisições
+admission = AdmissionController(settings)
@@ -0,0 +1,239 @@
+# backend/core/cache.py
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from pydantic import BaseModel
+from core.config import Settings, settings
+
+
+def input_hash(namespace: str, input_data: BaseModel) -> str:
+    """
+    Build a canonical hash for a validated challenge input.
+
+    Pydantic serializes fields in declaration order, so equal inputs always
+    produce the same JSON and therefore the same hash.
+
+    Args:
+        namespace (str): Prefix separating inputs of different challenges
+        input_data (BaseModel): Validated challenge input
+
+    Returns:
+        str: Hex encoded SHA-256 digest
+    """
+    digest = hashlib.sha256(namespace.encode("utf-8"))
+    digest.update(b":")
+    digest.update(input_data.model_dump_json().encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU cache with per-entry time to live.
+
+    Attributes:
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups not found or expired
+        evictions (int): Entries removed to respect max_entries
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """
+    Shared result store backed by a SQLite file.
+
+    Lets several worker processes on the same host share cached results.
+    Values are stored as JSON text with an absolute expiry time; expired
+    rows are purged periodically on write.
+    """
+
+    _PURGE_EVERY = 1000
+
+    def __init__(self, path: str, ttl_seconds: float):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, now + self._ttl_seconds),
+            )
+            self._writes += 1
+            if self._writes % self._PURGE_EVERY == 0:
+                self._connection.execute(
+                    "DELETE FROM results WHERE expires_at <= ?", (now,)
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class ResultCache:
+    """
+    Two-level cache of challenge results.
+
+    Results are looked up in an in-process LRU first and then, when a shared
+    backend is configured, in the shared store. Shared hits are copied into
+    the local LRU.
+
+    Attributes:
+        local (LRUCache): In-process LRU cache of output models
+        shared (Optional[SQLiteCacheBackend]): Optional shared store
+        shared_hits (int): Lookups answered by the shared store
+    """
+
+    def __init__(
+        self, local: LRUCache, shared: Optional[SQLiteCacheBackend] = None
+    ) -> None:
+        self.local = local
+        self.shared = shared
+        self.shared_hits = 0
+
+    def get(self, key: str, output_model: type) -> Optional[BaseModel]:
+        value = self.local.get(key)
+        if value is not None or self.shared is None:
+            return value
+        raw = self.shared.get(key)
+        if raw is None:
+            return None
+        value = output_model.model_validate_json(raw)
+        self.shared_hits += 1
+        self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value: BaseModel) -> None:
+        self.local.set(key, value)
+        if self.shared is not None:
+            self.shared.set(key, value.model_dump_json())
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict[str, int]: hits, misses, evictions, shared_hits and size
+        """
+        return {
+            "hits": self.local.hits + self.shared_hits,
+            "misses": self.local.misses - self.shared_hits,
+            "evictions": self.local.evictions,
+            "shared_hits": self.shared_hits,
+            "size": len(self.local),
+        }
+
+
+def build_result_cache(config: Settings) -> ResultCache:
+    """
+    Create a ResultCache from the application settings.
+
+    Args:
+        config (Settings): Application settings
+
+    Returns:
+        ResultCache: Cache with the configured local and shared levels
+    """
+    shared = None
+    if config.CACHE_SHARED_BACKEND == "sqlite":
+        shared = SQLiteCacheBackend(config.CACHE_SQLITE_PATH, config.CACHE_TTL_SECONDS)
+    return ResultCache(
+        LRUCache(config.CACHE_MAX_ENTRIES, config.CACHE_TTL_SECONDS), shared
+    )
+
+
+# Um cache por desafio, criado sob demanda e compartilhado entre requisições
+_caches: Dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(name: str) -> ResultCache:
+    """
+    Return the long-lived result cache of a challenge, creating it once.
+
+    Args:
+        name (str): Challenge name, e.g. "board_game"
+
+    Returns:
+        ResultCache: The cache shared by all requests for that challenge
+    """
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = _caches[name] = build_result_cache(settings)
+        return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Return the counters of every result cache created so far.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Counters keyed by challenge name
+    """
+    with _caches_lock:
+        caches = dict(_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
@@ -1,5 +1,13 @@
+from typing import Dict, Literal, Optional
 from pydantic_settings import BaseSettings
 
+ExecutionBackend = Literal["inline", "thread", "process"]
+CacheSharedBackend = Literal["none", "sqlite"]
+LogQueuePolicy = Literal["drop", "block"]
+LogFormat = Literal["text", "json"]
+ServerLoop = Literal["auto", "asyncio", "uvloop"]
+ServerHttp = Literal["auto", "h11", "httptools"]
+
 
 class Settings(BaseSettings):
     """
@@ -13,18 +21,193 @@ class Settings(BaseSettings):
     Attributes:
         PORT (int): The port number on which the application will run.
             Default: 5879
+        SERVER_HOST (str): Address serve.py binds to. Default: "0.0.0.0"
+        SERVER_WORKERS (Optional[int]): Number of worker processes started
+            by serve.py; None for one per CPU core. Default: None
+        SERVER_LOOP (str): Event loop of the workers: "uvloop", "asyncio"
+            or "auto" (uvloop when installed). Default: "auto"
+        SERVER_HTTP (str): HTTP parser of the workers: "httptools", "h11"
+            or "auto" (httptools when installed). Default: "auto"
+        SERVER_KEEPALIVE_SECONDS (int): Time an idle keep-alive connection
+            is kept open. Default: 5
+        SERVER_BACKLOG (int): Maximum number of connections waiting to be
+            accepted. Default: 2048
+        SERVER_MAX_REQUESTS (Optional[int]): Requests a worker serves before
+            it is gracefully replaced by a new one; None never recycles
+            workers. Default: 10000
+        SERVER_MAX_REQUESTS_JITTER (int): Random number of requests, up to
+            this value, added to SERVER_MAX_REQUESTS of each worker so they
+            are not all recycled at once. Default: 1000
+        SERVER_GRACEFUL_TIMEOUT (int): Seconds a stopping or recycled
+            worker has to finish its requests. Default: 30
+        SERVER_WORKER_TIMEOUT (int): Seconds a worker may stay unresponsive
+            (e.g. running an inline challenge) before it is killed and
+            replaced. Default: 120
+        SERVER_PRELOAD (bool): Whether the app is imported once before the
+            workers are forked, so they share its memory copy-on-write.
+            Default: True
         APP_NAME (str): The name of the application.
             Default: "ChallengeAPI"
         DEBUG (bool): Flag indicating whether debug mode is enabled.
             Default: False
         LOG_LEVEL (str): The logging level for the application.
             Default: "INFO"
+        LOG_FORMAT (str): Log output format, "text" or structured "json".
+            Default: "text"
+        LOG_SAMPLE_RATES (Dict[str, float]): Fraction of successful, fast
+            requests whose access log is written, keyed by path prefix
+            (longest prefix wins, e.g. {"/api/v1/string": 0.01}). Errors and
+            slow requests are always logged. Default: {} (log everything)
+        LOG_SLOW_REQUEST_MS (float): Requests slower than this are always
+            logged, regardless of sampling. Default: 500.0
+        LOG_QUEUE_ENABLED (bool): Whether log records are handed to a
+            background thread that formats and writes them. Default: True
+        LOG_QUEUE_SIZE (int): Maximum number of records waiting in the
+            logging queue. Default: 10000
+        LOG_QUEUE_POLICY (str): What to do when the logging queue is full:
+            "drop" the record or "block" the caller. Default: "drop"
+        EXECUTION_BACKEND (str): Default backend used to run challenges:
+            "inline" (on the event loop), "thread" or "process" (worker pool).
+            Default: "inline"
+        EXECUTION_ROUTES (Dict[str, str]): Per-challenge backend overrides,
+            keyed by challenge name ("string", "sequence", "board_game",
+            "benefits"). Default: {"board_game": "thread"}
+        EXECUTION_MAX_WORKERS (int): Number of workers in each pool.
+            Default: 4
+        EXECUTION_QUEUE_SIZE (int): Maximum number of calls waiting for a
+            worker before new calls are rejected with 503. Default: 32
+        EXECUTION_RETRY_AFTER (int): Value in seconds of the Retry-After
+            header sent when the pools are saturated. Default: 1
+        EXECUTION_TIMEOUT_SECONDS (Optional[float]): Time a request's
+            challenge work may run before it is abandoned with 504; None
+            for no deadline. Default: 30.0
+        EXECUTION_TIMEOUT_HEADER (str): Request header with which a client
+            may ask for a shorter timeout, in seconds.
+            Default: "X-Request-Timeout"
+        CACHE_ENABLED (bool): Whether challenges whose routes opt in have
+            their results memoized. Default: True
+        CACHE_MAX_ENTRIES (int): Maximum number of results kept in memory per
+            challenge (LRU eviction). Default: 1024
+        CACHE_TTL_SECONDS (float): Time to live of cached results.
+            Default: 300.0
+        CACHE_SHARED_BACKEND (str): Optional store shared between worker
+            processes: "none" or "sqlite". Default: "none"
+        CACHE_SQLITE_PATH (str): Database file of the sqlite shared store.
+            Default: "cache/challenge_cache.sqlite3"
+        BENEFITS_BATCH_MAX_ROWS (int): Maximum number of records accepted by
+            the benefits batch endpoint. Default: 500000
+        BENEFITS_CALENDAR_FIRST_YEAR (int): First year of the calendar table
+            used by the benefits calculation. Default: 1950
+        BENEFITS_CALENDAR_LAST_YEAR (int): Last year of the calendar table.
+            Dates outside the table give the same results, computed
+            without it. Default: 2100
+        BOARD_SESSION_MAX_ENTRIES (int): Maximum number of board game
+            sessions kept in memory per process (LRU eviction). Default: 32
+        BOARD_SESSION_TTL_SECONDS (float): Time a board game session is kept
+            after its last use. Default: 1800.0
+        BOARD_GAME_NUMPY_MIN_CELLS (Optional[int]): Smallest board whose
+            probability is pre-processed with NumPy, when it is installed;
+            None disables the NumPy backend. Results are identical either
+            way. Default: 512
+        BATCH_MAX_ITEMS (int): Maximum number of items accepted by the
+            multi-challenge batch endpoint. Default: 1000
+        BATCH_CONCURRENCY (int): Number of items of one batch request that
+            are dispatched to the execution backends at the same time.
+            Default: 8
+        SEQUENCE_BATCH_MAX_POSITIONS (int): Maximum number of positions in
+            one sequence batch request. Default: 1000000
+        SEQUENCE_RANGE_MAX_TERMS (int): Maximum number of terms streamed by
+            one sequence range request. Default: 100000000
+        STRING_STREAM_MAX_LINE_BYTES (int): Longest line accepted by the
+            streaming string endpoint; longer lines end the stream with an
+            error. Default: 1048576
+        CHALLENGE_WARMUP (bool): Whether every challenge is imported, built
+            and warmed up at startup; False defers each one to its first
+            request, for a faster cold start. Default: True
+        HTTP_CACHE_CONTROL (str): Cache-Control header of the GET variants
+            of the challenge endpoints. Default: "public, max-age=3600"
+        HTTP_CACHE_VERSION (str): Part of every ETag; change it when
+            challenge results change, so clients and proxies stop
+            revalidating results of the previous version. Default: "1"
+        FAST_RESPONSES (bool): Whether challenge routes send their outputs
+            serialized directly by Pydantic, skipping FastAPI's validation
+            of the output against the response model. Default: False
+        METRICS_ENABLED (bool): Whether request and challenge metrics are
+            recorded and exposed at /metrics. Default: True
+        ADMISSION_ENABLED (bool): Whether requests to /api/ are charged an
+            estimated cost and rejected when over budget. Default: True
+        ADMISSION_MAX_REQUEST_COST (float): Highest cost of a single
+            request; costlier requests are rejected with 413. Costs are
+            estimated by each challenge from the body size, in units of
+            1 KiB of linear-time input. Default: 65536.0
+        ADMISSION_CLIENT_BUDGET (float): Total cost of the requests of one
+            client in flight at the same time; more are rejected with 429.
+            Default: 131072.0
+        ADMISSION_GLOBAL_BUDGET (float): Total cost of all the requests in
+            flight at the same time in this process; more are rejected
+            with 429. Default: 524288.0
+        ADMISSION_CLIENT_HEADER (Optional[str]): Header identifying the
+            client, e.g. "X-Real-IP" behind a proxy; None uses the peer
+            address. Default: None
+        ADMISSION_RETRY_AFTER (int): Value in seconds of the Retry-After
+            header sent with 429 responses. Default: 1
     """
 
     PORT: int = 5879
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_LOOP: ServerLoop = "auto"
+    SERVER_HTTP: ServerHttp = "auto"
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_MAX_REQUESTS: Optional[int] = 10_000
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+    SERVER_WORKER_TIMEOUT: int = 120
+    SERVER_PRELOAD: bool = True
     APP_NAME: str = "ChallengeAPI"
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: LogFormat = "text"
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+    LOG_SLOW_REQUEST_MS: float = 500.0
+    LOG_QUEUE_ENABLED: bool = True
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_QUEUE_POLICY: LogQueuePolicy = "drop"
+    EXECUTION_BACKEND: ExecutionBackend = "inline"
+    EXECUTION_ROUTES: Dict[str, ExecutionBackend] = {"board_game": "thread"}
+    EXECUTION_MAX_WORKERS: int = 4
+    EXECUTION_QUEUE_SIZE: int = 32
+    EXECUTION_RETRY_AFTER: int = 1
+    EXECUTION_TIMEOUT_SECONDS: Optional[float] = 30.0
+    EXECUTION_TIMEOUT_HEADER: str = "X-Request-Timeout"
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_TTL_SECONDS: float = 300.0
+    CACHE_SHARED_BACKEND: CacheSharedBackend = "none"
+    CACHE_SQLITE_PATH: str = "cache/challenge_cache.sqlite3"
+    BENEFITS_BATCH_MAX_ROWS: int = 500_000
+    BENEFITS_CALENDAR_FIRST_YEAR: int = 1950
+    BENEFITS_CALENDAR_LAST_YEAR: int = 2100
+    BOARD_SESSION_MAX_ENTRIES: int = 32
+    BOARD_SESSION_TTL_SECONDS: float = 1800.0
+    BOARD_GAME_NUMPY_MIN_CELLS: Optional[int] = 512
+    BATCH_MAX_ITEMS: int = 1000
+    BATCH_CONCURRENCY: int = 8
+    SEQUENCE_BATCH_MAX_POSITIONS: int = 1_000_000
+    SEQUENCE_RANGE_MAX_TERMS: int = 100_000_000
+    STRING_STREAM_MAX_LINE_BYTES: int = 1024 * 1024
+    CHALLENGE_WARMUP: bool = True
+    HTTP_CACHE_CONTROL: str = "public, max-age=3600"
+    HTTP_CACHE_VERSION: str = "1"
+    FAST_RESPONSES: bool = False
+    METRICS_ENABLED: bool = True
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_MAX_REQUEST_COST: float = 65536.0
+    ADMISSION_CLIENT_BUDGET: float = 131072.0
+    ADMISSION_GLOBAL_BUDGET: float = 524288.0
+    ADMISSION_CLIENT_HEADER: Optional[str] = None
+    ADMISSION_RETRY_AFTER: int = 1
 
     class Config:
         """
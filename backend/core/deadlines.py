@@ -0,0 +1,161 @@
+# backend/core/deadlines.py
+import asyncio
+from contextvars import ContextVar
+from typing import Any, List, Optional
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.config import Settings, settings
+from src.challenges.execution_context import ExecutionContext
+
+# Contexto da requisição em andamento, lido pelo executor
+_current_context: ContextVar[Optional[ExecutionContext]] = ContextVar(
+    "execution_context", default=None
+)
+
+
+def current_context() -> Optional[ExecutionContext]:
+    """
+    Return the execution context of the request being handled.
+
+    Returns:
+        Optional[ExecutionContext]: The context set by DeadlineMiddleware,
+        or None outside of a request
+    """
+    return _current_context.get()
+
+
+class RequestContext(ExecutionContext):
+    """
+    ExecutionContext of an HTTP request, cancelled when its client leaves.
+
+    The application reads the request through receive(). While work is
+    awaited through wait(), a single watcher task keeps reading the
+    request too, so an http.disconnect is seen even though the handler is
+    not reading; the messages it reads are handed back to the application
+    by later receive() calls, so no body bytes are lost, and an error
+    raised while it reads is raised again by the next receive(). The
+    watcher reads ahead at most one body chunk: while the body is still
+    arriving (e.g. a streamed upload), it stops after one chunk instead
+    of buffering the rest of the body, and the application sees a
+    disconnect through its own receive() calls.
+    """
+
+    def __init__(self, timeout: Optional[float], receive: Receive):
+        super().__init__(timeout)
+        self._receive = receive
+        self._buffered: List[Message] = []
+        self._error: Optional[Exception] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self._waiting = 0
+
+    async def receive(self) -> Message:
+        if self._buffered:
+            return self._buffered.pop(0)
+        if self._error is not None:
+            # Erro da leitura feita pelo observador (ex.: recusa da admissão)
+            error, self._error = self._error, None
+            raise error
+        message = await self._receive()
+        if message["type"] == "http.disconnect":
+            self.cancel()
+        return message
+
+    async def wait(self, future: "asyncio.Future[Any]") -> Any:
+        """
+        Await work running on a worker, cancelling it if the client leaves.
+
+        The future is always awaited to the end: a cancelled challenge
+        stops at its next check() and the future then fails with
+        ExecutionCancelled, so workers are never released early.
+
+        Args:
+            future (asyncio.Future): Result of the work
+
+        Returns:
+            Any: Whatever the work returns
+        """
+        self._waiting += 1
+        # Com um pedaço do corpo já guardado, não lê mais nada adiantado
+        if self._watcher is None and not self._buffered:
+            self._watcher = asyncio.ensure_future(self._watch())
+        try:
+            if self._watcher is not None:
+                await asyncio.wait(
+                    {future, self._watcher}, return_when="FIRST_COMPLETED"
+                )
+            return await future
+        finally:
+            self._waiting -= 1
+            if self._waiting == 0:
+                self.close()
+
+    def close(self) -> None:
+        """Stop the disconnect watcher, if one is running."""
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None and not watcher.done():
+            watcher.cancel()
+
+    async def _watch(self) -> None:
+        while True:
+            try:
+                message = await self._receive()
+            except Exception as exc:
+                self._error = exc
+                return
+            self._buffered.append(message)
+            if message["type"] == "http.disconnect":
+                self.cancel()
+                return
+            if message.get("more_body", False):
+                # Corpo ainda chegando: o resto fica para a aplicação
+                return
+
+
+class DeadlineMiddleware:
+    """
+    ASGI middleware giving every request an execution context.
+
+    The deadline is EXECUTION_TIMEOUT_SECONDS after the request arrives,
+    or sooner when the client sends a shorter timeout in the
+    EXECUTION_TIMEOUT_HEADER header (in seconds); the header can only
+    shorten the configured timeout. The context is made available to the
+    executor through current_context().
+    """
+
+    def __init__(self, app: ASGIApp, config: Settings = settings):
+        self.app = app
+        self._timeout = config.EXECUTION_TIMEOUT_SECONDS
+        self._header = config.EXECUTION_TIMEOUT_HEADER
+
+    def timeout_for(self, headers: Headers) -> Optional[float]:
+        """
+        Return the time budget of a request.
+
+        Args:
+            headers (Headers): Request headers
+
+        Returns:
+            Optional[float]: Seconds the request may run, or None for no
+            deadline. Invalid or non-positive header values are ignored.
+        """
+        timeout = self._timeout
+        try:
+            requested = float(headers.get(self._header, ""))
+        except ValueError:
+            return timeout
+        if not requested > 0:
+            return timeout
+        return requested if timeout is None else min(requested, timeout)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context = RequestContext(self.timeout_for(Headers(scope=scope)), receive)
+        token = _current_context.set(context)
+        try:
+            await self.app(scope, context.receive, send)
+        finally:
+            context.close()
+            _current_context.reset(token)
@@ -9,16 +9,56 @@ DESCRIPTIONS = {
         "example_input": {"text": "hello"},
         "response_model": BaseModel,
     },
+    "string_raw": {
+        "description": "Validates a string sent as the raw UTF-8 request body (text/plain or application/octet-stream). Only the first and last code points are read, so very large strings are checked in constant memory.",
+        "example_input": "BHA",
+        "response_model": BaseModel,
+    },
+    "string_stream": {
+        "description": "Validates a stream of strings sent as newline-delimited text or NDJSON, answering with one NDJSON result per line while the upload is still being read.",
+        "example_input": '{"text": "BHA"}\n{"text": "hello"}\n',
+        "response_model": BaseModel,
+    },
     "sequence": {
         "description": "Calculates the value of a number sequence based on a position (greater than 0).",
         "example_input": {"position": 5},
         "response_model": BaseModel,
     },
+    "sequence_batch": {
+        "description": "Calculates the sequence values at a list of positions in one request.",
+        "example_input": {"positions": [1, 5, 1000000]},
+        "response_model": BaseModel,
+    },
+    "sequence_range": {
+        "description": "Streams the sequence values at the positions range(start, stop, step), as NDJSON lines of JSON arrays or as raw little-endian int64 values (format 'binary').",
+        "example_input": {"start": 1, "stop": 1000001, "step": 1, "format": "ndjson"},
+        "response_model": BaseModel,
+    },
+    "sequence_sum": {
+        "description": "Calculates in constant time how many terms the positions range(start, stop, step) holds and the sum of their values.",
+        "example_input": {"start": 1, "stop": 1000001, "step": 1},
+        "response_model": BaseModel,
+    },
+    "sequence_position": {
+        "description": "Finds in constant time the position that holds a value, or null if the value is not in the sequence.",
+        "example_input": {"value": 39},
+        "response_model": BaseModel,
+    },
     "board_game": {
-        "description": "Solves a board game by calculating the minimum number of turns, success probability, and combinations without loops, given the board size and the list of jumps.",
+        "description": "Solves a board game by calculating the minimum number of turns, success probability, and combinations without loops, given the board size and the list of jumps. Set combinations_mode to 'mod' (with a modulus) or 'log10' to avoid computing the exact, exponentially large number of combinations.",
         "example_input": {"board_size": 3, "board": [1, 1, 1]},
         "response_model": BaseModel,
     },
+    "board_game_binary": {
+        "description": "Solves a board sent in a compact binary form: little-endian int32 cells as the raw body of /binary (options in the query string) or base64-encoded in the board_base64 field of /base64. Intended for very large boards.",
+        "example_input": {"board_size": 3, "board_base64": "AQAAAAEAAAABAAAA"},
+        "response_model": BaseModel,
+    },
+    "board_game_sessions": {
+        "description": "Keeps a board on the server so it can be edited cell by cell: POST /sessions uploads and solves it, PATCH /sessions/{session_id} changes cells and re-solves only the cells before the last edited one, GET returns the current metrics and DELETE discards the session.",
+        "example_input": {"cells": [{"index": 1, "value": 2}]},
+        "response_model": BaseModel,
+    },
     "benefits": {
         "description": "Calculates the proportional value of vacation and thirteenth salary when resigning, based on salary and the dates of admission and resignation.",
         "example_input": {
@@ -28,6 +68,32 @@ DESCRIPTIONS = {
         },
         "response_model": BaseModel,
     },
+    "benefits_batch": {
+        "description": "Calculates vacation and thirteenth salary for a batch of employees sent as a JSON array, NDJSON or CSV. Each record is validated on its own and results are returned in input order.",
+        "example_input": [
+            {
+                "salary": 3000.0,
+                "hire_date": "2024-01-01",
+                "resignation_date": "2025-08-21",
+            }
+        ],
+        "response_model": BaseModel,
+    },
+    "http_cache": {
+        "description": "GET variant of the challenge endpoint, with the input as query parameters (one board parameter per cell for the board game). Answers carry a strong ETag derived from the input and a Cache-Control header, so browsers and proxies can cache them; a request whose If-None-Match holds the ETag gets a 304 without the challenge being run.",
+        "example_input": {"position": 5},
+        "response_model": BaseModel,
+    },
+    "batch": {
+        "description": "Executes a list of challenges of any kind in one request. Each item names the challenge (string, sequence, board_game or benefits) and carries its input; results are returned in input order with a per-item status.",
+        "example_input": {
+            "items": [
+                {"challenge": "string", "input": {"text": "BHA"}},
+                {"challenge": "sequence", "input": {"position": 5}},
+            ]
+        },
+        "response_model": BaseModel,
+    },
 }
 
 
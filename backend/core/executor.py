@@ -0,0 +1,228 @@
+# backend/core/executor.py
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from pydantic import BaseModel
+from core.config import Settings, settings
+from core.deadlines import RequestContext, current_context
+from core.logging import logger
+from core.metrics import challenge_duration, challenge_input_size
+from src.challenges.base_challenge import IChallenge
+from src.challenges.cached_challenge import CachedChallenge
+from src.challenges.execution_context import ExecutionContext
+
+
+class ExecutorSaturated(Exception):
+    """
+    Raised when a worker pool has no free slot for a new challenge call.
+
+    Attributes:
+        backend (str): The saturated backend ("thread" or "process")
+        retry_after (int): Seconds the client should wait before retrying
+    """
+
+    def __init__(self, backend: str, retry_after: int):
+        super().__init__(f"Execution backend '{backend}' is saturated")
+        self.backend = backend
+        self.retry_after = retry_after
+
+
+class ChallengeExecutor:
+    """
+    Dispatches IChallenge.execute calls to the configured execution backend.
+
+    Each challenge name is routed to one of three backends:
+        - inline: runs on the event loop (cheap challenges)
+        - thread: runs on a shared ThreadPoolExecutor
+        - process: runs on a shared ProcessPoolExecutor (CPU-bound work)
+
+    Pools are created lazily on first use. Every pool accepts at most
+    EXECUTION_MAX_WORKERS running calls plus EXECUTION_QUEUE_SIZE waiting
+    calls; anything beyond that raises ExecutorSaturated instead of queueing
+    without bound.
+    """
+
+    def __init__(self, config: Settings):
+        self._default_backend = config.EXECUTION_BACKEND
+        self._routes = dict(config.EXECUTION_ROUTES)
+        self._max_workers = max(1, config.EXECUTION_MAX_WORKERS)
+        self._capacity = self._max_workers + max(0, config.EXECUTION_QUEUE_SIZE)
+        self._retry_after = config.EXECUTION_RETRY_AFTER
+        self._metrics_enabled = config.METRICS_ENABLED
+        self._pools: Dict[str, Executor] = {}
+        self._pending: Dict[str, int] = {"thread": 0, "process": 0}
+        self._lock = threading.Lock()
+
+    def backend_for(self, name: str) -> str:
+        """
+        Return the backend configured for a challenge.
+
+        Args:
+            name (str): Challenge name, e.g. "board_game"
+
+        Returns:
+            str: "inline", "thread" or "process"
+        """
+        return self._routes.get(name, self._default_backend)
+
+    async def run(
+        self,
+        name: str,
+        challenge: IChallenge,
+        input_data: BaseModel,
+        context: Optional[ExecutionContext] = None,
+    ) -> BaseModel:
+        """
+        Execute a challenge on the backend configured for it.
+
+        Cached challenges are looked up in this process first, so only cache
+        misses reach the worker pools. When METRICS_ENABLED is on, the input
+        size of every call and the duration of every execute that is not a
+        cache hit are recorded per challenge class; the duration is measured
+        in the worker, so it excludes the time spent waiting for one.
+
+        The execution context (by default the current request's) is passed
+        to execute; calls whose deadline has already passed are not
+        dispatched at all.
+
+        Args:
+            name (str): Challenge name used for routing
+            challenge (IChallenge): Challenge instance to execute
+            input_data (BaseModel): Validated challenge input
+            context (Optional[ExecutionContext]): Deadline and cancellation
+                of the call; None for the current request's
+
+        Returns:
+            BaseModel: The challenge output
+
+        Raises:
+            ExecutorSaturated: If the selected pool has no free slot
+            DeadlineExceeded: If the deadline passes before or during the
+                call
+            ExecutionCancelled: If the client disconnects during the call
+        """
+        if context is None:
+            context = current_context()
+        cached_challenge = None
+        if isinstance(challenge, CachedChallenge):
+            cached_challenge, challenge = challenge, challenge.challenge
+        label = type(challenge).__name__
+        if self._metrics_enabled:
+            size = challenge.input_size(input_data)
+            if size is not None:
+                challenge_input_size.observe(size, label)
+
+        if cached_challenge is not None:
+            cached = cached_challenge.lookup(input_data)
+            if cached is not None:
+                return cached
+
+        if context is not None:
+            context.check()
+        if self._metrics_enabled:
+            output, seconds = await self.submit(
+                name, _timed, challenge.execute, input_data, context
+            )
+            challenge_duration.observe(seconds, label)
+        else:
+            output = await self.submit(name, challenge.execute, input_data, context)
+
+        if cached_challenge is not None:
+            cached_challenge.store(input_data, output)
+        return output
+
+    async def submit(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call an arbitrary challenge method on the backend configured for it.
+
+        Used for entry points other than execute, such as batch methods.
+        With the process backend, fn and its arguments must be picklable.
+        While a worker runs the call, a disconnect of the current request's
+        client cancels its execution context. The pool slot stays taken
+        until the worker finishes, even if the caller stops waiting first.
+
+        Args:
+            name (str): Challenge name used for routing
+            fn (Callable): Function or bound challenge method to call
+            *args: Positional arguments passed to fn
+
+        Returns:
+            Any: Whatever fn returns
+
+        Raises:
+            ExecutorSaturated: If the selected pool has no free slot
+        """
+        backend = self.backend_for(name)
+        if backend == "inline":
+            return fn(*args)
+
+        self._acquire(backend)
+        try:
+            work = self._pool(backend).submit(fn, *args)
+        except BaseException:
+            self._release(backend)
+            raise
+        # A vaga só é liberada quando o worker termina, mesmo que quem
+        # aguarda seja cancelado antes
+        work.add_done_callback(lambda _: self._release(backend))
+        future = asyncio.wrap_future(work)
+        context = current_context()
+        if isinstance(context, RequestContext):
+            return await context.wait(future)
+        return await future
+
+    def shutdown(self) -> None:
+        """Shut down all worker pools, waiting for running calls."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=True)
+
+    def _acquire(self, backend: str) -> None:
+        with self._lock:
+            if self._pending[backend] >= self._capacity:
+                logger.warning(f"Execution backend saturated: {backend}")
+                raise ExecutorSaturated(backend, self._retry_after)
+            self._pending[backend] += 1
+
+    def _release(self, backend: str) -> None:
+        with self._lock:
+            self._pending[backend] -= 1
+
+    def _pool(self, backend: str) -> Executor:
+        with self._lock:
+            pool = self._pools.get(backend)
+            if pool is None:
+                if backend == "process":
+                    pool = ProcessPoolExecutor(max_workers=self._max_workers)
+                else:
+                    pool = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="challenge",
+                    )
+                self._pools[backend] = pool
+            return pool
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    # Executado no worker (também em outro processo): devolve a duração
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+# Executor global compartilhado pelas rotas
+executor = ChallengeExecutor(settings)
+
+
+def get_executor() -> ChallengeExecutor:
+    """
+    Dependency provider for the shared ChallengeExecutor.
+
+    Returns:
+        ChallengeExecutor: The application-wide challenge executor.
+    """
+    return executor
@@ -0,0 +1,87 @@
+# backend/core/http_cache.py
+from typing import Optional
+from fastapi import Request, Response
+from pydantic import BaseModel
+from core.cache import input_hash
+from core.config import Settings, settings
+
+
+def challenge_etag(
+    name: str, input_data: BaseModel, config: Settings = settings
+) -> str:
+    """
+    Build the strong ETag of a challenge result.
+
+    Challenges are pure functions of their input, so the result is
+    identified by the canonical hash of the validated input, whatever
+    the order or spelling of the query parameters. HTTP_CACHE_VERSION is
+    part of the hash, so bumping it invalidates every ETag issued before.
+
+    Args:
+        name (str): Challenge name, e.g. "sequence"
+        input_data (BaseModel): Validated challenge input
+        config (Settings): Application settings
+
+    Returns:
+        str: Quoted ETag, e.g. '"3f2a..."'
+    """
+    return f'"{input_hash(f"{name}@{config.HTTP_CACHE_VERSION}", input_data)}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison If-None-Match calls for: a "W/" prefix on
+    the client's tags is ignored, and "*" matches anything.
+
+    Args:
+        if_none_match (Optional[str]): Header value, a list of tags
+        etag (str): Quoted ETag of the current representation
+
+    Returns:
+        bool: Whether the client already holds the representation
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    name: str,
+    input_data: BaseModel,
+    config: Settings = settings,
+) -> Optional[Response]:
+    """
+    Apply the HTTP caching headers of a GET challenge endpoint.
+
+    Sets ETag and Cache-Control (HTTP_CACHE_CONTROL) on the response the
+    route will return, so browsers and the nginx proxy cache can store
+    it. When the request's If-None-Match already holds the ETag, returns
+    an empty 304 response instead, and the challenge is not executed.
+
+    Args:
+        request (Request): The incoming request
+        response (Response): The response injected into the route
+        name (str): Challenge name
+        input_data (BaseModel): Validated challenge input
+        config (Settings): Application settings
+
+    Returns:
+        Optional[Response]: A 304 response to return as is, or None when
+        the route should compute the result
+    """
+    headers = {
+        "ETag": challenge_etag(name, input_data, config),
+        "Cache-Control": config.HTTP_CACHE_CONTROL,
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -1,19 +1,139 @@
 # backend/core/logging.py
 import os
+import queue
+import atexit
+import random
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict
+from core.config import settings
+
+try:
+    from pythonjsonlogger.json import JsonFormatter
+except ImportError:  # python-json-logger < 3
+    from pythonjsonlogger.jsonlogger import JsonFormatter
 
 # Flag para garantir configuração única
 _is_setup = False
 
+# Fila de logs e thread de escrita em segundo plano (modo assíncrono)
+_listener = None
+_queue_handler = None
+
+# Atributos padrão de um LogRecord; o restante veio de extra=
+_RECORD_ATTRIBUTES = set(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+
+def record_extras(record: logging.LogRecord) -> Dict[str, object]:
+    """
+    Retorna os campos passados via extra= para um registro de log.
+
+    Args:
+        record (logging.LogRecord): Registro de log
+
+    Returns:
+        Dict[str, object]: Campos extras, na ordem em que foram definidos
+    """
+    return {
+        key: value
+        for key, value in record.__dict__.items()
+        if key not in _RECORD_ATTRIBUTES
+    }
+
+
+class RequestLogSampler:
+    """
+    Decide quais requisições bem-sucedidas têm o log de acesso escrito.
+
+    Erros (status >= 400) e requisições lentas são sempre registrados. As
+    demais são amostradas conforme a taxa do maior prefixo de caminho que
+    casar em LOG_SAMPLE_RATES (1.0 quando nenhum prefixo casar).
+    """
+
+    def __init__(self, rates: Dict[str, float], slow_request_ms: float):
+        # Prefixos mais longos primeiro para que o mais específico vença
+        self._rates = sorted(rates.items(), key=lambda item: -len(item[0]))
+        self._slow_request_ms = slow_request_ms
+
+    def rate_for(self, path: str) -> float:
+        for prefix, rate in self._rates:
+            if path.startswith(prefix):
+                return rate
+        return 1.0
+
+    def should_log(self, path: str, status_code: int, duration_ms: float) -> bool:
+        if status_code >= 400 or duration_ms >= self._slow_request_ms:
+            return True
+        rate = self.rate_for(path)
+        return rate >= 1.0 or random.random() < rate
+
+
+request_sampler = RequestLogSampler(
+    settings.LOG_SAMPLE_RATES, settings.LOG_SLOW_REQUEST_MS
+)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Handler que apenas enfileira os registros de log.
+
+    A formatação e a escrita em disco ficam com a thread do QueueListener,
+    de modo que as threads das requisições nunca fazem I/O de log.
+    A fila é limitada: quando cheia, o registro é descartado (policy "drop")
+    ou a thread chamadora espera por espaço (policy "block").
+
+    Em processos filhos (pool de processos criado via fork) não existe
+    listener, então os registros são escritos diretamente nos handlers.
+    """
+
+    def __init__(self, log_queue, handlers, block=False):
+        super().__init__(log_queue)
+        self.block = block
+        self.dropped = 0
+        self._handlers = handlers
+        self._pid = os.getpid()
+
+    def prepare(self, record):
+        # A formatação é adiada para a thread do listener
+        return record
+
+    def enqueue(self, record):
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def emit(self, record):
+        if os.getpid() != self._pid:
+            for handler in self._handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        super().emit(record)
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener que espera espaço na fila para o sinal de parada."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
 
 def setup_logging():
     """
     Configura o sistema de log da aplicação.
-    Logs serão escritos em 'logs/app_log.log' e também exibidos no console.
+    Logs serão escritos em 'logs/app_log.log' e também exibidos no console,
+    em texto ou em JSON estruturado conforme LOG_FORMAT.
+    Com LOG_QUEUE_ENABLED, os registros passam por uma fila limitada e são
+    formatados e escritos por uma thread em segundo plano.
     Executa apenas uma vez, usando uma flag global.
     """
-    global _is_setup
+    global _is_setup, _listener, _queue_handler
     if _is_setup:
         return
 
@@ -24,8 +144,9 @@ def setup_logging():
     )  # Alterei para um nome mais relevante
 
     # Obter o logger raiz
+    level = logging.getLevelName(settings.LOG_LEVEL.upper())
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
+    root_logger.setLevel(level)
 
     # Limpa handlers existentes para evitar duplicação
     if root_logger.handlers:
@@ -37,15 +158,21 @@ def setup_logging():
         def format(self, record):
             # Extrair extra como string, se existir
             extra_str = ""
-            if hasattr(record, "extra") and record.extra:
-                extra_str = " - " + " ".join(
-                    f"{k}={v}" for k, v in record.extra.items()
-                )
+            extras = record_extras(record)
+            if extras:
+                extra_str = " - " + " ".join(f"{k}={v}" for k, v in extras.items())
             # Construir a mensagem completa
             msg = record.getMessage() + extra_str
             return f"{self.formatTime(record, self.datefmt)} - {record.levelname} -> {record.name} - {record.filename} -> {msg}"
 
-    formatter = CustomFormatter(datefmt="%Y-%m-%d %H:%M")
+    if settings.LOG_FORMAT == "json":
+        # Campos extras são serializados só quando o registro é escrito
+        formatter = JsonFormatter(
+            "%(asctime)s %(levelname)s %(name)s %(message)s",
+            rename_fields={"asctime": "time", "levelname": "level"},
+        )
+    else:
+        formatter = CustomFormatter(datefmt="%Y-%m-%d %H:%M")
 
     # Handler para o arquivo de log com rotação
     file_handler = RotatingFileHandler(
@@ -55,20 +182,61 @@ def setup_logging():
         encoding="utf-8",
     )
     file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
+    file_handler.setLevel(level)
 
     # Handler para o console
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    console_handler.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
+    console_handler.setLevel(level)
+
+    handlers = [file_handler, console_handler]
+    if settings.LOG_QUEUE_ENABLED:
+        # As requisições só enfileiram; a thread do listener formata e escreve
+        log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        _queue_handler = BoundedQueueHandler(
+            log_queue, handlers, block=settings.LOG_QUEUE_POLICY == "block"
+        )
+        _listener = _DrainingQueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+        root_logger.addHandler(_queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
 
     # Log de confirmação da configuração (apenas uma vez)
     logging.getLogger(__name__).info("Sistema de log configurado.")
     _is_setup = True
 
 
+def shutdown_logging():
+    """
+    Esvazia a fila de logs e encerra a thread em segundo plano.
+
+    Todos os registros já enfileirados são escritos antes do retorno.
+    Depois disso os handlers passam a ser usados diretamente pelo logger
+    raiz, para que logs emitidos durante o encerramento não se percam.
+    Um novo setup_logging volta a configurar o log do zero.
+    """
+    global _is_setup, _listener, _queue_handler
+    if _listener is None:
+        _is_setup = False
+        return
+
+    _listener.stop()
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_queue_handler)
+    for handler in _listener.handlers:
+        root_logger.addHandler(handler)
+
+    if _queue_handler.dropped:
+        logger.warning("Logs descartados por fila cheia: %s", _queue_handler.dropped)
+    _listener = None
+    _queue_handler = None
+    _is_setup = False
+
+
 # Logger global acessível diretamente
 logger = logging.getLogger(__name__)
 
@@ -79,5 +247,5 @@ def get_logger():
     return logger
 
 
-# Chamar setup_logging() uma vez ao importar o módulo
-setup_logging()
+# Garante que a fila seja esvaziada mesmo sem o lifespan (ex.: testes)
+atexit.register(shutdown_logging)
@@ -0,0 +1,287 @@
+# backend/core/metrics.py
+import bisect
+import math
+import threading
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+# Buckets padrão, em segundos, para latências de requisições e desafios
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Buckets para tamanhos (bytes, células, caracteres)
+SIZE_BUCKETS = tuple(10.0**exponent for exponent in range(0, 9))
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+
+
+class _ThreadShards:
+    """
+    Per-thread storage of metric values.
+
+    Every thread writes only to its own shard, so recording needs no lock;
+    the lock is only taken once per thread, to register a new shard, and
+    when the shards are collected. Shards are never removed, so values
+    recorded by threads that have finished are still exported.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: List[Dict[Labels, list]] = []
+        self._lock = threading.Lock()
+
+    def local(self) -> Dict[Labels, list]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def snapshot(self) -> List[Dict[Labels, list]]:
+        # dict() de outro thread é atômico sob o GIL
+        with self._lock:
+            shards = list(self._shards)
+        return [dict(shard) for shard in shards]
+
+
+class _Metric:
+    """
+    Base class of the metric types.
+
+    Attributes:
+        name (str): Metric name, e.g. "http_requests_in_flight"
+        documentation (str): Help text shown in the exposition format
+        label_names (Tuple[str, ...]): Names of the metric labels
+    """
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._shards = _ThreadShards()
+
+    def collect(self) -> Iterator[str]:
+        """
+        Render the metric in the Prometheus text exposition format.
+
+        Yields:
+            str: One line per sample, preceded by the HELP and TYPE lines
+        """
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        yield from self._samples()
+
+    def _samples(self) -> Iterator[str]:
+        merged: Dict[Labels, float] = {}
+        for shard in self._shards.snapshot():
+            for labels, cell in shard.items():
+                merged[labels] = merged.get(labels, 0.0) + cell[0]
+        for labels in sorted(merged):
+            yield self._line(self.name, labels, merged[labels])
+
+    def _line(self, name: str, labels: Labels, value: float, extra: str = "") -> str:
+        pairs = [
+            f'{key}="{_escape_label(label)}"'
+            for key, label in zip(self.label_names, labels)
+        ]
+        if extra:
+            pairs.append(extra)
+        label_text = "{" + ",".join(pairs) + "}" if pairs else ""
+        return f"{name}{label_text} {_format_value(value)}"
+
+    def _cell(self, labels: Labels, size: int) -> list:
+        shard = self._shards.local()
+        cell = shard.get(labels)
+        if cell is None:
+            if len(labels) != len(self.label_names):
+                raise ValueError(
+                    f"{self.name} expects labels {self.label_names}, got {labels}"
+                )
+            cell = shard[labels] = [0.0] * size
+        return cell
+
+
+class Counter(_Metric):
+    """Monotonically increasing value, e.g. a number of errors."""
+
+    type_name = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels, 1)[0] += amount
+
+
+class Gauge(_Metric):
+    """
+    Value that goes up and down, e.g. requests in flight.
+
+    Increments and decrements may happen on different threads; the
+    exported value is the sum over all threads.
+    """
+
+    type_name = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels, 1)[0] += amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._cell(labels, 1)[0] -= amount
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values over fixed buckets.
+
+    Each cell stores the per-bucket counts (the last one for +Inf), the sum
+    and the count of observations; buckets are made cumulative on export.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # buckets + [+Inf, soma, contagem]
+        self._size = len(self.buckets) + 3
+
+    def observe(self, value: float, *labels: str) -> None:
+        cell = self._cell(labels, self._size)
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def _samples(self) -> Iterator[str]:
+        merged: Dict[Labels, List[float]] = {}
+        for shard in self._shards.snapshot():
+            for labels, cell in shard.items():
+                total = merged.setdefault(labels, [0.0] * self._size)
+                for index, value in enumerate(list(cell)):
+                    total[index] += value
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for labels in sorted(merged):
+            cell = merged[labels]
+            cumulative = 0.0
+            for bound, count in zip(bounds, cell):
+                cumulative += count
+                yield self._line(
+                    f"{self.name}_bucket", labels, cumulative, f'le="{bound}"'
+                )
+            yield self._line(f"{self.name}_sum", labels, cell[-2])
+            yield self._line(f"{self.name}_count", labels, cell[-1])
+
+
+class MetricsRegistry:
+    """Collection of metrics exported together by the /metrics endpoint."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Render every registered metric in the text exposition format.
+
+        Returns:
+            str: The exposition text, ending with a newline
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(text: str) -> str:
+    return _escape_help(text).replace('"', '\\"')
+
+
+# Registro e métricas globais da aplicação
+metrics = MetricsRegistry()
+
+request_latency = metrics.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency, by method, route and status code.",
+        ("method", "path", "status"),
+    )
+)
+request_size = metrics.register(
+    Histogram(
+        "http_request_size_bytes",
+        "Size of HTTP request bodies from Content-Length, by route.",
+        ("method", "path"),
+        buckets=SIZE_BUCKETS,
+    )
+)
+requests_in_flight = metrics.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being handled.")
+)
+challenge_duration = metrics.register(
+    Histogram(
+        "challenge_execute_duration_seconds",
+        "Duration of IChallenge.execute calls that were not cache hits, "
+        "by challenge class.",
+        ("challenge",),
+    )
+)
+challenge_input_size = metrics.register(
+    Histogram(
+        "challenge_input_size",
+        "Size of challenge inputs (cells, characters, rows), by challenge class.",
+        ("challenge",),
+        buckets=SIZE_BUCKETS,
+    )
+)
+admission_rejected = metrics.register(
+    Counter(
+        "admission_rejected_total",
+        "Requests rejected by admission control, by status code (413, 429).",
+        ("status",),
+    )
+)
+admission_cost_in_flight = metrics.register(
+    Gauge(
+        "admission_cost_in_flight",
+        "Estimated cost of the requests currently admitted.",
+    )
+)
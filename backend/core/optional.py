@@ -0,0 +1,26 @@
+# backend/core/optional.py
+import importlib
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def optional_module(name: str) -> Optional[ModuleType]:
+    """
+    Import an optional dependency on first use.
+
+    Heavy optional modules (e.g. NumPy) are only imported by the code
+    paths that need them, so processes that never take those paths do not
+    pay for the import at startup.
+
+    Args:
+        name (str): Module name, e.g. "numpy"
+
+    Returns:
+        Optional[ModuleType]: The module, or None when it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
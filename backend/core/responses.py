@@ -0,0 +1,69 @@
+# backend/core/responses.py
+from typing import Any, Optional
+import pydantic_core
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from core.config import Settings, settings
+
+
+class ModelJSONResponse(JSONResponse):
+    """
+    JSON response written by pydantic-core's serializer.
+
+    Pydantic models are written by model_dump_json, without FastAPI's
+    response model handling; other content (e.g. what FastAPI builds
+    from a route's response_model) by pydantic_core.to_json. Unlike the
+    standard library, neither limits the number of digits of integers,
+    which the exact board game combinations of a board of a few
+    thousand cells exceed; routes that may return such values use this
+    class as their response_class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return pydantic_core.to_json(content)
+
+
+def challenge_response(
+    output: BaseModel,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+    config: Settings = settings,
+) -> Any:
+    """
+    Return a challenge output from a route.
+
+    With FAST_RESPONSES on, the output is returned as a ModelJSONResponse,
+    which FastAPI sends as is: the output is not dumped, validated again
+    against the route's response_model and encoded by the standard
+    library. Challenge outputs are built by the challenges themselves as
+    instances of the response model, so the validation only repeats
+    work. Headers set on the response injected into the route (e.g. the
+    ETag of GET endpoints) are copied over; the route's status code is
+    not applied by FastAPI to a returned response, so routes with another
+    status code than 200 pass it along.
+
+    With FAST_RESPONSES off, the output is returned unchanged and goes
+    through FastAPI's usual response handling.
+
+    Args:
+        output (BaseModel): Output of the challenge, an instance of the
+            route's response_model
+        response (Optional[Response]): Response injected into the route,
+            if the route sets headers on it
+        status_code (int): Status code of the route. Default: 200
+        config (Settings): Application settings
+
+    Returns:
+        Any: The response or the output itself
+    """
+    if not config.FAST_RESPONSES:
+        return output
+    fast = ModelJSONResponse(output, status_code=status_code)
+    if response is not None:
+        for key, value in response.headers.items():
+            if key != "content-length":
+                fast.headers[key] = value
+    return fast
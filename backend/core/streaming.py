@@ -0,0 +1,144 @@
+# backend/core/streaming.py
+import sys
+from array import array
+from typing import AsyncIterator, List, Tuple
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+
+class LineTooLong(ValueError):
+    """Raised when a body line grows beyond the allowed number of bytes."""
+
+
+async def iter_line_batches(
+    request: Request, max_line_bytes: int = 0
+) -> AsyncIterator[List[bytes]]:
+    """
+    Yield the complete lines of each request body chunk as it arrives.
+
+    The body is consumed chunk by chunk, so only the current chunk and the
+    incomplete line at its end are kept in memory. Line terminators (\\n or
+    \\r\\n) are stripped and empty lines are skipped; chunks without a
+    complete line yield nothing.
+
+    Args:
+        request (Request): Incoming request with a line-oriented body
+        max_line_bytes (int): Maximum size of a line, 0 for no limit
+
+    Yields:
+        List[bytes]: The non-empty lines completed by one chunk
+
+    Raises:
+        LineTooLong: If a line exceeds max_line_bytes
+    """
+    pending = b""
+    async for chunk in request.stream():
+        if not chunk:
+            continue
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        if max_line_bytes and len(pending) > max_line_bytes:
+            raise LineTooLong(f"line longer than {max_line_bytes} bytes")
+        lines = [line.rstrip(b"\r") for line in lines]
+        lines = [line for line in lines if line]
+        if max_line_bytes and any(len(line) > max_line_bytes for line in lines):
+            raise LineTooLong(f"line longer than {max_line_bytes} bytes")
+        if lines:
+            yield lines
+    pending = pending.rstrip(b"\r")
+    if pending:
+        yield [pending]
+
+
+async def iter_lines(request: Request) -> AsyncIterator[str]:
+    """
+    Yield the lines of a request body as they arrive.
+
+    Args:
+        request (Request): Incoming request with a UTF-8 text body
+
+    Yields:
+        str: Each non-empty line of the body
+
+    Raises:
+        UnicodeDecodeError: If the body is not valid UTF-8
+    """
+    async for lines in iter_line_batches(request):
+        for line in lines:
+            yield line.decode("utf-8")
+
+
+async def read_edges(request: Request, size: int = 4) -> Tuple[bytes, bytes, int]:
+    """
+    Read a request body keeping only its first and last bytes.
+
+    Chunks are inspected through memoryviews and dropped as soon as their
+    edges are copied, so memory stays flat whatever the body size.
+
+    Args:
+        request (Request): Incoming request
+        size (int): Number of bytes kept at each end
+
+    Returns:
+        Tuple[bytes, bytes, int]: The first bytes, the last bytes and the
+        total body length
+    """
+    head = b""
+    tail = b""
+    length = 0
+    async for chunk in request.stream():
+        view = memoryview(chunk)
+        length += len(view)
+        if len(head) < size:
+            head += view[: size - len(head)]
+        tail = (tail + view[-size:])[-size:]
+    return head, tail, length
+
+
+async def read_int32_array(request: Request) -> array:
+    """
+    Read a body of little-endian int32 values straight into an array.
+
+    Chunks are appended to the array as they arrive, so the body is never
+    held as a whole next to its decoded copy.
+
+    Args:
+        request (Request): Incoming request with a binary body
+
+    Returns:
+        array: The values, as an array('i')
+
+    Raises:
+        ValueError: If the body length is not a multiple of 4 bytes
+    """
+    values = array("i")
+    pending = b""
+    async for chunk in request.stream():
+        if pending:
+            chunk = pending + chunk
+        usable = len(chunk) - len(chunk) % 4
+        values.frombytes(memoryview(chunk)[:usable])
+        pending = chunk[usable:]
+    if pending:
+        raise ValueError("binary body length must be a multiple of 4 bytes")
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response that may be produced while the request body is read.
+
+    Starlette's StreamingResponse watches for client disconnects by calling
+    receive() concurrently with the body iterator, which would steal the
+    request body chunks the iterator is still reading. This response only
+    streams; a client disconnect surfaces in the iterator itself, as the
+    ClientDisconnect raised by request.stream().
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
@@ -1,7 +1,13 @@
 # backend/core/validators.py
 from datetime import date
-from typing import List
-from pydantic import BaseModel, Field, model_validator
+from typing import Annotated, Any, Dict, List, Literal, Optional
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+    model_serializer,
+    model_validator,
+)
 
 
 # Pergunta 1:  Valida se é uma string
@@ -25,6 +31,40 @@ class SequenceOutput(BaseModel):
     result: int
 
 
+# Operações sobre vários termos da sequência
+class SequenceBatchInput(BaseModel):
+    positions: List[Annotated[int, Field(gt=0)]] = Field(..., min_length=1)
+
+
+class SequenceBatchOutput(BaseModel):
+    results: List[int]
+
+
+class SequenceRangeInput(BaseModel):
+    # Mesma semântica de range(): stop exclusivo
+    start: int = Field(..., gt=0)
+    stop: int = Field(..., gt=0)
+    step: int = Field(1, gt=0)
+
+
+class SequenceRangeStreamInput(SequenceRangeInput):
+    # ndjson: arrays JSON por linha; binary: int64 little-endian
+    format: Literal["ndjson", "binary"] = "ndjson"
+
+
+class SequenceSumOutput(BaseModel):
+    count: int
+    sum: int
+
+
+class SequenceValueInput(BaseModel):
+    value: int
+
+
+class SequencePositionOutput(BaseModel):
+    position: Optional[int] = None
+
+
 # ------------------------------------
 
 
@@ -32,12 +72,66 @@ class SequenceOutput(BaseModel):
 class BoardGameInput(BaseModel):
     board_size: int = Field(..., ge=3)
     board: List[int] = Field(..., min_length=2)
+    # exact: inteiro exato; mod: resto por modulus; log10: aproximação
+    combinations_mode: Literal["exact", "mod", "log10"] = "exact"
+    modulus: Optional[int] = Field(None, ge=1)
+
+    @model_validator(mode="after")
+    def check_modulus(self) -> "BoardGameInput":
+        _check_modulus(self.combinations_mode, self.modulus)
+        return self
+
+
+# Tabuleiro binário: int32 little-endian no corpo (opções na query string)
+# ou em base64 dentro do JSON
+class BoardGameBinaryParams(BaseModel):
+    combinations_mode: Literal["exact", "mod", "log10"] = "exact"
+    modulus: Optional[int] = Field(None, ge=1)
+
+    @model_validator(mode="after")
+    def check_modulus(self) -> "BoardGameBinaryParams":
+        _check_modulus(self.combinations_mode, self.modulus)
+        return self
+
+
+class BoardGameBase64Input(BoardGameBinaryParams):
+    board_size: int = Field(..., ge=3)
+    board_base64: str = Field(..., min_length=1)
+
+
+def _check_modulus(combinations_mode: str, modulus: Optional[int]) -> None:
+    if combinations_mode == "mod" and modulus is None:
+        raise ValueError("modulus is required when combinations_mode is 'mod'")
 
 
 class BoardGameOutput(BaseModel):
     turns: int
     probability: float
-    combinations: int
+    combinations: Optional[int] = None
+    combinations_log10: Optional[float] = None
+    combinations_scientific: Optional[str] = None
+
+    # Só os campos do modo pedido: respostas "exact" mantêm o formato antigo
+    @model_serializer(mode="wrap")
+    def _omit_unused_modes(self, handler):
+        return {key: value for key, value in handler(self).items() if value is not None}
+
+
+# Sessões de tabuleiro: o estado fica no servidor e recebe edições
+class BoardGameCellPatch(BaseModel):
+    index: int = Field(..., ge=0)
+    value: int
+
+
+class BoardGamePatchInput(BaseModel):
+    cells: List[BoardGameCellPatch] = Field(..., min_length=1)
+
+
+class BoardGameSessionOutput(BoardGameOutput):
+    session_id: str
+    board_size: int
+    # Células recalculadas pela última operação
+    recomputed_cells: int
 
 
 # ------------------------------------
@@ -62,3 +156,58 @@ class BenefitsInput(BaseModel):
 class BenefitsOutput(BaseModel):
     vacation: float
     thirteenth_salary: float
+
+
+# Lote de cálculos de benefícios (um resultado ou erro por linha)
+class BenefitsBatchItem(BaseModel):
+    index: int
+    result: Optional[BenefitsOutput] = None
+    error: Optional[str] = None
+
+
+class BenefitsBatchOutput(BaseModel):
+    results: List[BenefitsBatchItem]
+    errors: int
+
+
+# ------------------------------------
+
+
+# Lote heterogêneo: cada item indica o desafio e a sua entrada
+class ChallengeBatchItem(BaseModel):
+    challenge: str
+    input: Dict[str, Any]
+
+
+class ChallengeBatchInput(BaseModel):
+    items: List[ChallengeBatchItem] = Field(..., min_length=1)
+
+
+class ChallengeBatchResult(BaseModel):
+    index: int
+    challenge: str
+    # Status HTTP que o item teria recebido na rota do desafio
+    status: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class ChallengeBatchOutput(BaseModel):
+    results: List[ChallengeBatchResult]
+    errors: int
+
+
+def format_validation_error(exc: ValidationError) -> str:
+    """
+    Render a Pydantic validation error as a single line message.
+
+    Args:
+        exc (ValidationError): The validation error of one record
+
+    Returns:
+        str: Semicolon separated "field: message" pairs
+    """
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}"
+        for error in exc.errors()
+    )
@@ -1,20 +1,42 @@
 """
 Main application module for the Challenge API.
 
-This module serves as the entry point for the FastAPI application,
-configuring the main app instance, lifespan management, middleware,
-and API route registration.
+This module serves as the entry point for the FastAPI application:
+create_app builds an app instance with its lifespan management,
+middleware and API route registration. Importing the module is cheap;
+route modules, challenges and their dependencies are only imported when
+an app is created (on the first access to main.app, as done by uvicorn
+with "main:app") or, for challenges, when they are first built.
 
 The API provides endpoints for various coding challenges including
 string operations, sequence calculations, board game solutions,
 and employment benefits computations.
 """
 
-from core.logging import logger
-from core.config import settings
-from fastapi import FastAPI, Request
+import importlib
+import time
+from typing import TYPE_CHECKING, Dict
+from core.logging import logger, request_sampler, setup_logging, shutdown_logging
+from core.config import Settings, settings
+from core.metrics import request_latency, request_size, requests_in_flight
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from api.routes import string, sequence, board_game, benefits
+from src.challenges.execution_context import DeadlineExceeded, ExecutionCancelled
+
+if TYPE_CHECKING:
+    from core.executor import ExecutorSaturated
+
+# Módulos de rotas e prefixos, importados só por create_app
+ROUTE_MODULES = (
+    ("api.routes.string", "/api/v1"),
+    ("api.routes.sequence", "/api/v1"),
+    ("api.routes.board_game", "/api/v1"),
+    ("api.routes.benefits", "/api/v1"),
+    ("api.routes.batch", "/api/v1"),
+    ("api.routes.cache", "/api/v1"),
+    ("api.routes.metrics", ""),
+)
 
 
 @asynccontextmanager
@@ -24,6 +46,10 @@ async def lifespan(app: FastAPI):
 
     Handles initialization and cleanup operations for the application.
     The code before yield runs on startup, and code after yield runs on shutdown.
+    On startup logging is configured, the import-time profile of the app
+    is logged and, with CHALLENGE_WARMUP, every challenge is imported,
+    built and warmed up once in the registry; on shutdown the worker pools
+    are stopped and queued logs are flushed.
 
     Args:
         app (FastAPI): The FastAPI application instance
@@ -31,27 +57,103 @@ async def lifespan(app: FastAPI):
     Yields:
         None: Control is returned to the application runtime
     """
-    logger.info(f"Application started: {settings.APP_NAME}")
+    from core.executor import executor
+    from src.challenges.registry import log_startup_report, registry
+
+    config: Settings = app.state.settings
+    setup_logging()
+    log_import_profile(app.state.import_ms)
+    if config.CHALLENGE_WARMUP:
+        log_startup_report(registry.build())
+    logger.info(f"Application started: {config.APP_NAME}")
 
     yield
-    logger.info(f"Application stopped: {settings.APP_NAME}")
+    executor.shutdown()
+    logger.info(f"Application stopped: {config.APP_NAME}")
+    shutdown_logging()
 
 
-app = FastAPI(
-    title=settings.APP_NAME,
-    description="API for solving coding challenges",
-    version="1.0.0",
-    lifespan=lifespan,
-)
+def create_app(config: Settings = settings) -> FastAPI:
+    """
+    Build the FastAPI application.
+
+    Route modules (and through them the executor, the caches and the
+    challenge registry) are imported here rather than when this module is
+    imported, and the time taken by each import is kept in
+    app.state.import_ms for the startup log. Challenge modules themselves
+    are imported when the registry builds them.
+
+    The app-level middleware and exception handlers follow config;
+    process-wide singletons (executor, caches, registry, logging) keep
+    using the settings of the process.
+
+    Args:
+        config (Settings): Settings of the app. Default: the process
+            settings
+
+    Returns:
+        FastAPI: The configured application
+    """
+    app = FastAPI(
+        title=config.APP_NAME,
+        description="API for solving coding challenges",
+        version="1.0.0",
+        lifespan=lifespan,
+    )
+    app.state.settings = config
+
+    import_ms: Dict[str, float] = {}
+    for module_name, prefix in ROUTE_MODULES:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        import_ms[module_name] = (time.perf_counter() - start) * 1000
+        app.include_router(module.router, prefix=prefix)
+    app.state.import_ms = import_ms
+
+    from core.admission import AdmissionController, AdmissionMiddleware
+    from core.deadlines import DeadlineMiddleware
+    from core.executor import ExecutorSaturated
+
+    # Registrados antes do log de acesso, que assim também vê os 413 e 429
+    app.add_middleware(DeadlineMiddleware, config=config)
+    app.add_middleware(AdmissionMiddleware, controller=AdmissionController(config))
+    app.middleware("http")(log_requests)
+
+    app.add_exception_handler(ExecutorSaturated, executor_saturated_handler)
+    app.add_exception_handler(DeadlineExceeded, deadline_exceeded_handler)
+    app.add_exception_handler(ExecutionCancelled, execution_cancelled_handler)
+    return app
+
+
+def log_import_profile(import_ms: Dict[str, float]) -> None:
+    """
+    Log how long the route modules took to import when the app was built.
+
+    Modules share most of their dependencies, so each figure only counts
+    what was not already imported by the modules before it.
+
+    Args:
+        import_ms (Dict[str, float]): Import time per route module, as kept
+            by create_app in app.state.import_ms
+    """
+    for name, elapsed in import_ms.items():
+        logger.info(
+            f"Imported {name} ({elapsed:.2f} ms)",
+            extra={"route_module": name, "import_ms": round(elapsed, 2)},
+        )
+    logger.info(f"Route modules imported in {sum(import_ms.values()):.2f} ms")
 
 
-@app.middleware("http")
 async def log_requests(request: Request, call_next):
     """
-    HTTP middleware for logging incoming requests.
+    HTTP middleware for logging and measuring handled requests.
 
-    Logs all incoming HTTP requests with method and URL information
-    before passing them to the next middleware or route handler.
+    Writes one access log record per request with method, path, status
+    code and duration as structured fields. Successful, fast requests are
+    sampled according to LOG_SAMPLE_RATES; errors and slow requests are
+    always logged. When METRICS_ENABLED is on, every request is also
+    recorded in the latency, request size and in-flight metrics, labelled
+    by route template so path parameters do not create new series.
 
     Args:
         request (Request): The incoming HTTP request
@@ -60,15 +162,101 @@ async def log_requests(request: Request, call_next):
     Returns:
         Response: The HTTP response from the next handler
     """
-    logger.info(
-        "Request received", extra={"method": request.method, "url": str(request.url)}
-    )
-    response = await call_next(request)
+    record_metrics = request.app.state.settings.METRICS_ENABLED
+    if record_metrics:
+        requests_in_flight.inc()
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    except Exception:
+        logger.exception(
+            "Request failed",
+            extra={"method": request.method, "path": request.url.path},
+        )
+        if record_metrics:
+            _record_request(request, 500, time.perf_counter() - start)
+        raise
+    duration = time.perf_counter() - start
+    if record_metrics:
+        _record_request(request, response.status_code, duration)
+
+    duration_ms = duration * 1000
+    if request_sampler.should_log(request.url.path, response.status_code, duration_ms):
+        logger.info(
+            "Request handled",
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "status": response.status_code,
+                "duration_ms": round(duration_ms, 2),
+            },
+        )
     return response
 
 
-# Register API routers
-app.include_router(string.router, prefix="/api/v1")
-app.include_router(sequence.router, prefix="/api/v1")
-app.include_router(board_game.router, prefix="/api/v1")
-app.include_router(benefits.router, prefix="/api/v1")
+def _record_request(request: Request, status: int, duration: float) -> None:
+    requests_in_flight.dec()
+    route = request.scope.get("route")
+    # Rotas inexistentes ficam agrupadas para limitar a cardinalidade
+    path = route.path if route is not None else "unmatched"
+    request_latency.observe(duration, request.method, path, str(status))
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        request_size.observe(int(content_length), request.method, path)
+
+
+async def executor_saturated_handler(request: Request, exc: "ExecutorSaturated"):
+    """
+    Translate a saturated execution backend into a 503 response.
+
+    Args:
+        request (Request): The request that could not be scheduled
+        exc (ExecutorSaturated): The saturation error
+
+    Returns:
+        JSONResponse: 503 response with a Retry-After header
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded):
+    """
+    Translate an abandoned challenge execution into a 504 response.
+
+    Args:
+        request (Request): The request whose deadline passed
+        exc (DeadlineExceeded): The deadline error
+
+    Returns:
+        JSONResponse: 504 response
+    """
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
+async def execution_cancelled_handler(request: Request, exc: ExecutionCancelled):
+    """
+    Answer a request whose client disconnected during execution.
+
+    The response is never delivered; the status only shows up in logs
+    and metrics, as nginx's 499 "client closed request".
+
+    Args:
+        request (Request): The abandoned request
+        exc (ExecutionCancelled): The cancellation error
+
+    Returns:
+        Response: Empty 499 response
+    """
+    return Response(status_code=499)
+
+
+def __getattr__(name: str):
+    # main.app é criado no primeiro acesso (uvicorn "main:app", testes)
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
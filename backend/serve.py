@@ -0,0 +1,184 @@
+"""
+Production entry point of the Challenge API.
+
+Run from the backend directory:
+
+    python serve.py
+
+The server is configured from Settings (SERVER_* and PORT). With
+gunicorn and uvicorn-worker installed, the app runs on SERVER_WORKERS
+uvicorn workers managed by gunicorn: the app is imported once in the
+master process and the workers are forked from it, so they share its
+memory copy-on-write, and each worker is gracefully replaced after
+SERVER_MAX_REQUESTS requests (plus jitter). Without them, uvicorn's own
+process manager runs the workers, each importing the app itself. With DEBUG, a single
+uvicorn process with auto-reload is started instead, for development.
+
+Every worker is a separate process with its own executor pools, caches,
+metrics and admission budgets.
+"""
+
+import gc
+import os
+from typing import Any, Dict
+
+import uvicorn
+from core.config import Settings, settings
+from core.optional import optional_module
+
+
+def worker_count(config: Settings) -> int:
+    """
+    Return the number of worker processes to start.
+
+    Args:
+        config (Settings): Server settings
+
+    Returns:
+        int: SERVER_WORKERS, or the number of CPU cores when unset
+    """
+    if config.SERVER_WORKERS is not None:
+        return max(1, config.SERVER_WORKERS)
+    return os.cpu_count() or 1
+
+
+def event_loop(config: Settings) -> str:
+    """
+    Return the event loop implementation the workers will use.
+
+    Args:
+        config (Settings): Server settings
+
+    Returns:
+        str: "uvloop" or "asyncio"; "auto" picks uvloop when installed
+    """
+    if config.SERVER_LOOP != "auto":
+        return config.SERVER_LOOP
+    return "uvloop" if optional_module("uvloop") is not None else "asyncio"
+
+
+def http_protocol(config: Settings) -> str:
+    """
+    Return the HTTP parser the workers will use.
+
+    Args:
+        config (Settings): Server settings
+
+    Returns:
+        str: "httptools" or "h11"; "auto" picks httptools when installed
+    """
+    if config.SERVER_HTTP != "auto":
+        return config.SERVER_HTTP
+    return "httptools" if optional_module("httptools") is not None else "h11"
+
+
+def uvicorn_options(config: Settings) -> Dict[str, Any]:
+    """
+    Build the keyword arguments of uvicorn.run.
+
+    The uvicorn access log is turned off: requests are already logged,
+    with sampling, by the application middleware.
+
+    Args:
+        config (Settings): Server settings
+
+    Returns:
+        Dict[str, Any]: Options for uvicorn.run("main:app", ...)
+    """
+    options: Dict[str, Any] = {
+        "host": config.SERVER_HOST,
+        "port": config.PORT,
+        "loop": event_loop(config),
+        "http": http_protocol(config),
+        "backlog": config.SERVER_BACKLOG,
+        "timeout_keep_alive": config.SERVER_KEEPALIVE_SECONDS,
+        "timeout_graceful_shutdown": config.SERVER_GRACEFUL_TIMEOUT,
+        "access_log": False,
+    }
+    if config.DEBUG:
+        options["reload"] = True
+    else:
+        options["workers"] = worker_count(config)
+        options["limit_max_requests"] = config.SERVER_MAX_REQUESTS
+    return options
+
+
+def gunicorn_options(config: Settings) -> Dict[str, Any]:
+    """
+    Build the gunicorn settings of the server.
+
+    Args:
+        config (Settings): Server settings
+
+    Returns:
+        Dict[str, Any]: gunicorn settings, without the worker class
+    """
+    return {
+        "bind": f"{config.SERVER_HOST}:{config.PORT}",
+        "workers": worker_count(config),
+        "backlog": config.SERVER_BACKLOG,
+        "keepalive": config.SERVER_KEEPALIVE_SECONDS,
+        "max_requests": config.SERVER_MAX_REQUESTS or 0,
+        "max_requests_jitter": config.SERVER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": config.SERVER_GRACEFUL_TIMEOUT,
+        "timeout": config.SERVER_WORKER_TIMEOUT,
+        "preload_app": config.SERVER_PRELOAD,
+        "loglevel": config.LOG_LEVEL.lower(),
+    }
+
+
+def load_app():
+    """
+    Import the app and the code of its challenges.
+
+    Runs in the gunicorn master when SERVER_PRELOAD is on, before any
+    worker exists: nothing here starts threads or opens connections (the
+    lifespan of each worker does that). Objects created so far are moved
+    out of the garbage collector's reach with gc.freeze, so collections in
+    the workers do not write to, and thereby copy, the shared pages.
+
+    Returns:
+        FastAPI: The application
+    """
+    import main
+    from src.challenges.registry import registry
+
+    app = main.app
+    registry.import_modules()
+    optional_module("numpy")
+    gc.freeze()
+    return app
+
+
+def run_gunicorn(config: Settings) -> None:
+    from gunicorn.app.base import BaseApplication
+    from uvicorn_worker import UvicornWorker
+
+    class ChallengeWorker(UvicornWorker):
+        CONFIG_KWARGS = {"loop": event_loop(config), "http": http_protocol(config)}
+
+    class Server(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options(config).items():
+                self.cfg.set(key, value)
+            self.cfg.set("worker_class", ChallengeWorker)
+
+        def load(self):
+            return load_app()
+
+    Server().run()
+
+
+def serve(config: Settings = settings) -> None:
+    if (
+        config.DEBUG
+        or optional_module("gunicorn") is None
+        or optional_module("uvicorn_worker") is None
+    ):
+        uvicorn.run("main:app", **uvicorn_options(config))
+    else:
+        run_gunicorn(config)
+
+
+if __name__ == "__main__":
+    serve()
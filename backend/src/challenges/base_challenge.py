@@ -1,16 +1,63 @@
+from typing import Optional
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
+from src.challenges.execution_context import ExecutionContext
 
 
 class IChallenge(ABC):
     @abstractmethod
-    def execute(self, input_data: BaseModel) -> BaseModel:
+    def execute(
+        self, input_data: BaseModel, context: Optional[ExecutionContext] = None
+    ) -> BaseModel:
         """Executa a lógica do desafio.
 
+        Desafios demorados devem chamar context.check() periodicamente, para
+        abandonar o trabalho quando o prazo da requisição expira ou o
+        cliente desconecta; os rápidos podem ignorar o contexto.
+
         Args:
             input_data (BaseModel): Dados de entrada validados pelo Pydantic.
+            context (Optional[ExecutionContext]): Prazo e cancelamento da
+                requisição, ou None quando não há.
 
         Returns:
             BaseModel: Dados de saída validados pelo Pydantic.
         """
         pass
+
+    def warmup(self) -> None:
+        """Prepara estado de longa duração antes de atender requisições.
+
+        Chamado uma única vez, na inicialização da aplicação, para a
+        instância compartilhada do desafio. A implementação padrão não faz
+        nada; desafios podem sobrescrever para pré-calcular tabelas, aquecer
+        caches ou importar dependências pesadas.
+        """
+
+    def input_size(self, input_data: BaseModel) -> Optional[int]:
+        """Informa o tamanho de uma entrada, para as métricas.
+
+        Args:
+            input_data (BaseModel): Dados de entrada validados pelo Pydantic.
+
+        Returns:
+            Optional[int]: Tamanho da entrada na unidade natural do desafio
+            (células, caracteres, ...), ou None quando não se aplica.
+        """
+        return None
+
+    def estimate_cost(self, body_size: int) -> float:
+        """Estima o custo de uma requisição antes de o corpo ser lido.
+
+        Usado pelo controle de admissão, que só conhece o tamanho do corpo
+        (Content-Length ou bytes já recebidos). A unidade é o custo de
+        processar 1 KiB de entrada em tempo linear; a implementação padrão
+        cobra exatamente isso, mais uma unidade fixa por requisição.
+
+        Args:
+            body_size (int): Tamanho do corpo, em bytes.
+
+        Returns:
+            float: Custo estimado da requisição.
+        """
+        return 1.0 + body_size / 1024
@@ -0,0 +1,116 @@
+from typing import List
+
+# Dia do ano (a partir de 0) em que cada mês começa; índice 1 = bissexto
+_MONTH_STARTS = (
+    (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365),
+    (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366),
+)
+
+# Mesmo intervalo de anos de datetime.date
+MIN_YEAR = 1
+MAX_YEAR = 9999
+
+
+def is_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def year_start_ordinal(year: int) -> int:
+    """
+    Return the proleptic Gregorian ordinal of January 1st of a year.
+
+    Same numbering as date.toordinal (January 1st of year 1 is day 1),
+    computed by integer arithmetic for any year.
+
+    Args:
+        year (int): The year
+
+    Returns:
+        int: Ordinal of the first day of the year
+    """
+    before = year - 1
+    return before * 365 + before // 4 - before // 100 + before // 400 + 1
+
+
+class CalendarTable:
+    """
+    Day ordinals of the first day of every month in a range of years.
+
+    Dates are handled as date.toordinal() integers, so the ordinal of a
+    day, the length of its month or the start of its year are one list
+    lookup plus integer arithmetic instead of building date or datetime
+    objects. Years outside the table are computed with the same
+    arithmetic, so the range only affects speed, never results.
+
+    Attributes:
+        first_year (int): First year held by the table
+        last_year (int): Last year held by the table
+        month_starts (List[int]): Ordinal of the first day of each month,
+            at index (year - first_year) * 12 + month - 1, followed by
+            January 1st of the year after last_year
+    """
+
+    def __init__(self, first_year: int, last_year: int):
+        self.first_year = max(MIN_YEAR, first_year)
+        self.last_year = max(self.first_year, min(MAX_YEAR, last_year))
+        # 12 entradas por ano e mais uma: o início do mês seguinte dá a
+        # duração de cada mês, inclusive dezembro do último ano
+        self.month_starts: List[int] = []
+        for year in range(self.first_year, self.last_year + 1):
+            start = year_start_ordinal(year)
+            offsets = _MONTH_STARTS[is_leap(year)][:12]
+            self.month_starts.extend(start + offset for offset in offsets)
+        self.month_starts.append(year_start_ordinal(self.last_year + 1))
+        self._last_index = len(self.month_starts) - 1
+
+    def year_start(self, year: int) -> int:
+        """
+        Return the ordinal of January 1st of a year.
+
+        Args:
+            year (int): The year
+
+        Returns:
+            int: Ordinal of the first day of the year
+        """
+        index = (year - self.first_year) * 12
+        if 0 <= index < self._last_index:
+            return self.month_starts[index]
+        return year_start_ordinal(year)
+
+    def is_leap(self, year: int) -> bool:
+        index = (year - self.first_year) * 12 + 1
+        if 0 < index < self._last_index:
+            starts = self.month_starts
+            return starts[index + 1] - starts[index] == 29
+        return is_leap(year)
+
+    def ordinal(self, year: int, month: int, day: int) -> int:
+        """
+        Return the ordinal of a day, validating it as datetime does.
+
+        Args:
+            year (int): The year
+            month (int): The month, 1 to 12
+            day (int): The day of the month
+
+        Returns:
+            int: Same value as date(year, month, day).toordinal()
+
+        Raises:
+            ValueError: If the date does not exist, with datetime's message
+                (e.g. February 29th of a common year)
+        """
+        index = (year - self.first_year) * 12 + month - 1
+        if 0 <= index < self._last_index:
+            start = self.month_starts[index]
+            length = self.month_starts[index + 1] - start
+        else:
+            if not MIN_YEAR <= year <= MAX_YEAR:
+                raise ValueError(f"year {year} is out of range")
+            month_starts = _MONTH_STARTS[is_leap(year)]
+            start = year_start_ordinal(year) + month_starts[month - 1]
+            length = month_starts[month] - month_starts[month - 1]
+        if not 0 < day <= length:
+            raise ValueError("day is out of range for month")
+        return start + day - 1
@@ -1,5 +1,9 @@
-from datetime import datetime
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from core.config import settings
 from src.challenges.base_challenge import IChallenge
+from src.challenges.benefits_calendar import CalendarTable
+from src.challenges.execution_context import ExecutionContext
 from core.validators import BenefitsInput, BenefitsOutput
 
 
@@ -12,11 +16,25 @@ class BenefitsChallenge(IChallenge):
     Calculations are based on the CLT (Consolidação das Leis do Trabalho)
     rules.
 
+    Dates are handled as day ordinals with a CalendarTable covering
+    BENEFITS_CALENDAR_FIRST_YEAR to BENEFITS_CALENDAR_LAST_YEAR, so no
+    date or datetime objects are built per calculation.
+
     Inherits from:
         IChallenge: Base interface for challenge implementations
+
+    Attributes:
+        calendar (CalendarTable): Year starts used by the calculation
     """
 
-    def execute(self, input_data: BenefitsInput) -> BenefitsOutput:
+    def __init__(self, calendar: Optional[CalendarTable] = None):
+        self.calendar = calendar or CalendarTable(
+            settings.BENEFITS_CALENDAR_FIRST_YEAR, settings.BENEFITS_CALENDAR_LAST_YEAR
+        )
+
+    def execute(
+        self, input_data: BenefitsInput, context: Optional[ExecutionContext] = None
+    ) -> BenefitsOutput:
         """
         Calculate employment benefits based on salary and employment period.
 
@@ -26,6 +44,8 @@ class BenefitsChallenge(IChallenge):
                 - hire_date (date): Employee hire date
                 - resignation_date (date):
                     Employee resignation/termination date
+            context (Optional[ExecutionContext]): Unused, the calculation
+                takes constant time
 
         Returns:
             BenefitsOutput: Object containing calculated benefits:
@@ -44,30 +64,34 @@ class BenefitsChallenge(IChallenge):
             Calculations follow Brazilian labor law (CLT) requirements and use
             30-day months for daily salary calculation as standard practice.
         """
-        salary = input_data.salary
-        hire_date = datetime.combine(input_data.hire_date, datetime.min.time())
-        resignation_date = datetime.combine(
-            input_data.resignation_date, datetime.min.time()
+        vacation, thirteenth_salary = self._calculate(
+            input_data.salary, input_data.hire_date, input_data.resignation_date
         )
+        return BenefitsOutput(vacation=vacation, thirteenth_salary=thirteenth_salary)
+
+    def _calculate(
+        self, salary: float, hire_date: date, resignation_date: date
+    ) -> Tuple[float, float]:
+        # Datas como ordinais (date.toordinal): só aritmética inteira
+        calendar = self.calendar
+        resignation = resignation_date.toordinal()
 
         # Salário diário (baseado em 30 dias, média usada para férias)
         daily_salary = salary / 30
 
         # Calcular férias proporcionais
-        last_anniversary = datetime(
+        month, day = hire_date.month, hire_date.day
+        year = (
             resignation_date.year
-            if hire_date.replace(year=hire_date.year) <= resignation_date
-            else hire_date.year,
-            hire_date.month,
-            hire_date.day,
-        )
-        if last_anniversary > resignation_date:
-            last_anniversary = last_anniversary.replace(year=last_anniversary.year - 1)
-        days_worked = (resignation_date - last_anniversary).days
-        is_leap_year = last_anniversary.year % 4 == 0 and (
-            last_anniversary.year % 100 != 0 or last_anniversary.year % 400 == 0
+            if hire_date.toordinal() <= resignation
+            else hire_date.year
         )
-        year_days = 366 if is_leap_year and last_anniversary.month <= 2 else 365
+        last_anniversary = calendar.ordinal(year, month, day)
+        if last_anniversary > resignation:
+            year -= 1
+            last_anniversary = calendar.ordinal(year, month, day)
+        days_worked = resignation - last_anniversary
+        year_days = 366 if month <= 2 and calendar.is_leap(year) else 365
         vacation_proportion = min(days_worked / year_days, 1.0)
         vacation_days = 30 * vacation_proportion
         vacation_value = round(
@@ -76,10 +100,9 @@ class BenefitsChallenge(IChallenge):
 
         # Calcular décimo terceiro proporcional
         # (conforme CLT: mês completo se > 15 dias)
-        year_start = datetime(resignation_date.year, 1, 1)
         days_worked_in_year = (
-            resignation_date - year_start
-        ).days + 1  # Inclui o dia da demissão
+            resignation - calendar.year_start(resignation_date.year)
+        ) + 1  # Inclui o dia da demissão
         months_worked = (
             days_worked_in_year + 14
         ) // 30  # Arredonda para mês completo se > 15 dias
@@ -89,6 +112,38 @@ class BenefitsChallenge(IChallenge):
             salary * thirteenth_proportion, 2
         )  # Arredonda para 2 casas decimais
 
-        return BenefitsOutput(
-            vacation=vacation_value, thirteenth_salary=thirteenth_value
-        )
+        return vacation_value, thirteenth_value
+
+    def execute_batch(self, inputs: List[BenefitsInput]) -> List[Dict[str, Any]]:
+        """
+        Calculate benefits for many employees at once.
+
+        Rows go through the same ordinal arithmetic as execute, so the
+        values and their rounding are exactly those of execute. Items are
+        plain dicts rather than BenefitsBatchItem models: building two
+        models per row costs more than the calculation itself, and the
+        batch route writes the dicts to JSON in a single pass.
+
+        Args:
+            inputs (List[BenefitsInput]): Validated input records
+
+        Returns:
+            List[Dict[str, Any]]: One item per input, in input order, shaped
+            as BenefitsBatchItem: "index" (position in inputs), "result"
+            (a dict with "vacation" and "thirteenth_salary") and "error".
+            Rows whose anniversary date does not exist (hired on February
+            29th) carry an error instead of a result.
+        """
+        items = []
+        calculate = self._calculate
+        for index, row in enumerate(inputs):
+            try:
+                vacation, thirteenth_salary = calculate(
+                    row.salary, row.hire_date, row.resignation_date
+                )
+            except ValueError as exc:
+                items.append({"index": index, "result": None, "error": str(exc)})
+                continue
+            result = {"vacation": vacation, "thirteenth_salary": thirteenth_salary}
+            items.append({"index": index, "result": result, "error": None})
+        return items
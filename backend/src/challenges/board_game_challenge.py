@@ -1,9 +1,16 @@
-from typing import List
+import math
+from typing import List, Optional
 from collections import deque
+from core.config import settings
 from core.logging import logger
 from src.challenges.base_challenge import IChallenge
+from src.challenges.board_game_solver import BoardSolution, BoardState, solve_board
+from src.challenges.execution_context import ExecutionContext
 from core.validators import BoardGameInput, BoardGameOutput
 
+# Peso de 1 KiB de tabuleiro no controle de admissão
+_COST_PER_KIB = 8.0
+
 
 class BoardGameChallenge(IChallenge):
     """
@@ -19,7 +26,9 @@ class BoardGameChallenge(IChallenge):
         IChallenge: Base interface for challenge implementations
     """
 
-    def execute(self, input_data: BoardGameInput) -> BoardGameOutput:
+    def execute(
+        self, input_data: BoardGameInput, context: Optional[ExecutionContext] = None
+    ) -> BoardGameOutput:
         """
         Solve the board game challenge and calculate all required metrics.
 
@@ -28,6 +37,12 @@ class BoardGameChallenge(IChallenge):
                 - board_size (int): The size of the game board (n x n)
                 - board (List[int]): List of integers representing board
                 cell values
+                - combinations_mode (str): "exact" (default), "mod" or
+                "log10"
+                - modulus (Optional[int]): Modulus used in "mod" mode
+            context (Optional[ExecutionContext]): Deadline and cancellation
+                of the request, checked by the solver once per block of
+                cells
 
         Returns:
             BoardGameOutput: Object containing calculated results:
@@ -35,10 +50,17 @@ class BoardGameChallenge(IChallenge):
                 - probability (float): Probability of successfully reaching
                 the end
                 - combinations (int): Number of possible paths to reach
-                the end
+                the end, reduced modulo modulus in "mod" mode (None in
+                "log10" mode)
+                - combinations_log10 (float): log10 of the number of paths,
+                only in "log10" mode
+                - combinations_scientific (str): The same approximation in
+                scientific notation, only in "log10" mode
 
         Raises:
             ValueError: If board validation fails or inputs are invalid
+            DeadlineExceeded: If the request's deadline passes while solving
+            ExecutionCancelled: If the request is cancelled while solving
         """
         n = input_data.board_size
         board = input_data.board
@@ -47,26 +69,108 @@ class BoardGameChallenge(IChallenge):
         if len(board) != n:
             return BoardGameOutput(turns=0, probability=0.0, combinations=0)
 
-        # Menor número de turnos (BFS)
-        min_turns = self._min_turns(n, board)
+        # Turnos, probabilidade e combinações em tempo O(n)
+        solution = solve_board(
+            n,
+            board,
+            input_data.combinations_mode,
+            input_data.modulus,
+            settings.BOARD_GAME_NUMPY_MIN_CELLS,
+            context,
+        )
+
+        logger.debug(
+            "BoardGameChallenge results: turns=%s, probability=%s",
+            solution.turns,
+            solution.probability,
+        )
+        return self.output(solution)
+
+    def solve_state(
+        self, input_data: BoardGameInput, context: Optional[ExecutionContext] = None
+    ) -> BoardState:
+        """
+        Solve a board and keep the solver state, so it can be edited later.
+
+        Args:
+            input_data (BoardGameInput): Board and combinations mode, as in
+                execute
+            context (Optional[ExecutionContext]): Deadline and cancellation
+                of the first solve
+
+        Returns:
+            BoardState: The solved, editable board state
+
+        Raises:
+            ValueError: If the board does not have board_size cells
+            IndexError: If a fixed jump lands before the start of the board
+            DeadlineExceeded: If the request's deadline passes while solving
+        """
+        if len(input_data.board) != input_data.board_size:
+            raise ValueError("board must have exactly board_size cells")
+        return BoardState(
+            input_data.board_size,
+            list(input_data.board),
+            input_data.combinations_mode,
+            input_data.modulus,
+            settings.BOARD_GAME_NUMPY_MIN_CELLS,
+            context,
+        )
 
-        # Probabilidade de sucesso (DP)
-        probability = self._probability(n, board)
+    def output(self, solution: BoardSolution) -> BoardGameOutput:
+        """
+        Build the response model for a solver result.
 
-        # Número de combinações (DP)
-        combinations = self._combinations(n, board)
+        Args:
+            solution (BoardSolution): Metrics computed by the solver
 
-        logger.info(f"BoardGameChallenge results: turns={min_turns}")
-        logger.info(f"BoardGameChallenge results: probability={probability}")
-        logger.info(f"BoardGameChallenge results: combinations={combinations}")
+        Returns:
+            BoardGameOutput: The metrics, with the scientific notation of
+            the combinations in "log10" mode
+        """
         return BoardGameOutput(
-            turns=min_turns, probability=probability, combinations=combinations
+            turns=solution.turns,
+            probability=solution.probability,
+            combinations=solution.combinations,
+            combinations_log10=solution.combinations_log10,
+            combinations_scientific=_scientific(solution.combinations_log10),
         )
 
+    def input_size(self, input_data: BoardGameInput) -> int:
+        """
+        Report the number of board cells, for the metrics.
+
+        Args:
+            input_data (BoardGameInput): Validated board game input
+
+        Returns:
+            int: Length of the board
+        """
+        return len(input_data.board)
+
+    def estimate_cost(self, body_size: int) -> float:
+        """
+        Estimate the cost of a board from the size of its request body.
+
+        A JSON board takes 2 to 4 bytes per cell and a binary one 4, and
+        every cell goes through three passes, one of them on integers that
+        grow with the board in "exact" mode; a KiB of board is therefore
+        charged as _COST_PER_KIB KiB of linear-time input.
+
+        Args:
+            body_size (int): Size of the request body, in bytes
+
+        Returns:
+            float: Estimated cost, in admission control units
+        """
+        return 1.0 + body_size / 1024 * _COST_PER_KIB
+
     def _min_turns(self, n: int, board: List[int]) -> int:
         """
         Calculate the minimum number of turns to reach the end using BFS.
 
+        Reference O(n²) implementation, kept to validate solve_board.
+
         Players can make:
         - Fixed jump: move forward by board[i] positions from position i
         - Free jumps: move to any position j where j > i
@@ -113,6 +217,8 @@ class BoardGameChallenge(IChallenge):
         Calculate the probability of successfully reaching the end using
         dynamic programming.
 
+        Reference O(n²) implementation, kept to validate solve_board.
+
         Assumes uniform probability distribution for all possible moves from
         each position.
 
@@ -151,6 +257,8 @@ class BoardGameChallenge(IChallenge):
         Calculate the number of distinct paths to reach the end using
         dynamic programming.
 
+        Reference O(n²) implementation, kept to validate solve_board.
+
         Args:
             n (int): Size of the board
             board (List[int]): List of integers representing board cell values
@@ -178,3 +286,22 @@ class BoardGameChallenge(IChallenge):
             dp[i] = sum(dp[j] for j in possible_jumps)
 
         return dp[0]
+
+
+def _scientific(log10_value: Optional[float]) -> Optional[str]:
+    """
+    Render a base-10 logarithm as a number in scientific notation.
+
+    Args:
+        log10_value (Optional[float]): log10 of the number, or None
+
+    Returns:
+        Optional[str]: e.g. "1.234568e+3010", or None
+    """
+    if log10_value is None:
+        return None
+    exponent = math.floor(log10_value)
+    mantissa = 10 ** (log10_value - exponent)
+    if mantissa >= 9.9999995:
+        mantissa, exponent = 1.0, exponent + 1
+    return f"{mantissa:.6f}e+{exponent}"
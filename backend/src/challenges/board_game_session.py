@@ -0,0 +1,94 @@
+import threading
+import uuid
+from typing import Mapping, Optional
+from core.cache import LRUCache
+from core.config import settings
+from src.challenges.board_game_solver import BoardSolution, BoardState
+
+
+class BoardSession:
+    """
+    A board uploaded once and edited in place.
+
+    Edits of the same session are serialized by a lock, so concurrent
+    patches never interleave their recomputations.
+
+    Attributes:
+        session_id (str): Identifier returned to the client
+        state (BoardState): Solver state of the current board
+        recomputed_cells (int): Cells recomputed by the last operation
+    """
+
+    def __init__(self, session_id: str, state: BoardState):
+        self.session_id = session_id
+        self.state = state
+        self.recomputed_cells = state.n
+        self.lock = threading.Lock()
+
+    def apply(self, cells: Mapping[int, int]) -> BoardSolution:
+        """
+        Edit some cells and return the metrics of the edited board.
+
+        Args:
+            cells (Mapping[int, int]): New jump value by cell index
+
+        Returns:
+            BoardSolution: The board metrics after the edit
+
+        Raises:
+            ValueError: If a cell index is outside the board
+            IndexError: If a new fixed jump lands before the start of the
+                board (the session is left unchanged)
+        """
+        with self.lock:
+            self.recomputed_cells = self.state.update(cells)
+            return self.state.solution()
+
+    def solution(self) -> BoardSolution:
+        with self.lock:
+            return self.state.solution()
+
+
+class BoardSessionStore:
+    """
+    In-process store of board sessions.
+
+    Sessions live in an LRU bounded by BOARD_SESSION_MAX_ENTRIES and expire
+    BOARD_SESSION_TTL_SECONDS after their last use. They are not shared
+    between worker processes, so deployments with several workers need
+    sticky routing for the session endpoints.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._sessions = LRUCache(max_entries, ttl_seconds)
+
+    def create(self, state: BoardState) -> BoardSession:
+        session = BoardSession(uuid.uuid4().hex, state)
+        self._sessions.set(session.session_id, session)
+        return session
+
+    def get(self, session_id: str) -> Optional[BoardSession]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            # Renova o prazo de expiração a cada uso
+            self._sessions.set(session_id, session)
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        return self._sessions.delete(session_id)
+
+
+# Sessões do processo, compartilhadas por todas as requisições
+session_store = BoardSessionStore(
+    settings.BOARD_SESSION_MAX_ENTRIES, settings.BOARD_SESSION_TTL_SECONDS
+)
+
+
+def get_session_store() -> BoardSessionStore:
+    """
+    Dependency provider for the board session store.
+
+    Returns:
+        BoardSessionStore: The store shared by the session endpoints.
+    """
+    return session_store
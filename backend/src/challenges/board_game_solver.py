@@ -0,0 +1,572 @@
+import math
+import sys
+from array import array
+from typing import (
+    Callable,
+    List,
+    Mapping,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from core.optional import optional_module
+from src.challenges.execution_context import ExecutionContext
+
+# Modos de cálculo do número de combinações
+COMBINATIONS_EXACT = "exact"
+COMBINATIONS_MOD = "mod"
+COMBINATIONS_LOG10 = "log10"
+
+# Reescala dos valores aproximados antes de estourar o float (2^1024)
+_LOG_RESCALE_BITS = 960
+_LOG_RESCALE_LIMIT = 2.0**_LOG_RESCALE_BITS
+_LOG10_2 = math.log10(2)
+
+# Restos de módulos até 2^62 cabem, somados, num int64
+_INT64_LIMIT = 2**62
+
+# Intervalo, em células, entre as somas correntes guardadas por BoardState
+_BLOCK_CELLS = 1024
+
+# Tamanho mínimo do tabuleiro para o pré-processamento vetorizado com NumPy
+NUMPY_MIN_CELLS = 512
+
+
+def _no_check() -> None:
+    pass
+
+
+class BoardSolution(NamedTuple):
+    """
+    Metrics computed by the board game solver.
+
+    Attributes:
+        turns (int): Minimum number of turns to reach the last cell
+        probability (float): Probability of reaching the last cell
+        combinations (Optional[int]): Number of distinct paths to the last
+            cell, exact or reduced modulo the requested modulus; None in
+            log10 mode
+        combinations_log10 (Optional[float]): Base-10 logarithm of the
+            number of paths, only in log10 mode
+    """
+
+    turns: int
+    probability: float
+    combinations: Optional[int]
+    combinations_log10: Optional[float] = None
+
+
+def solve_board(
+    n: int,
+    board: Sequence[int],
+    combinations_mode: str = COMBINATIONS_EXACT,
+    modulus: Optional[int] = None,
+    numpy_min_cells: Optional[int] = NUMPY_MIN_CELLS,
+    context: Optional[ExecutionContext] = None,
+) -> BoardSolution:
+    """
+    Compute turns, probability and combinations in linear time.
+
+    From cell i a player may take the fixed jump to i + board[i] (when it
+    stays below n) or a free jump to any cell j > i. Both dynamic programs
+    therefore only need, for every cell, the sum of the values of all later
+    cells plus the value at the fixed jump target. The sums are kept as
+    running suffix sums while walking the board backwards, instead of being
+    recomputed from scratch for every cell.
+
+    Since a free jump reaches the last cell straight from the start, the
+    minimum number of turns is always 1 for boards with at least two cells.
+
+    The number of paths grows roughly as 2ⁿ, so besides the exact count it
+    can be computed modulo a machine-size modulus or approximated by its
+    base-10 logarithm, both without big-integer arithmetic.
+
+    The results match BoardGameChallenge's reference implementation,
+    including its handling of non-positive jumps (Python negative indexing,
+    with jumps landing more than n cells before the start raising
+    IndexError). Probabilities are summed in a different order, so they may
+    differ from the reference in the last bits when the board contains
+    non-positive jumps.
+
+    Boards of at least numpy_min_cells cells have their probability
+    pre-processed with NumPy when it is installed (see BoardState); the
+    results are bit-for-bit those of the pure-Python passes.
+
+    Args:
+        n (int): Size of the board
+        board (Sequence[int]): Jump value for each cell
+        combinations_mode (str): "exact", "mod" or "log10"
+        modulus (Optional[int]): Modulus used in "mod" mode
+        numpy_min_cells (Optional[int]): Smallest board that uses the
+            NumPy backend; None to always use pure Python
+        context (Optional[ExecutionContext]): Deadline and cancellation of
+            the request, checked once per block of cells
+
+    Returns:
+        BoardSolution: The board metrics
+
+    Raises:
+        IndexError: If a fixed jump lands before the start of the board
+        ValueError: If the mode is unknown or "mod" has no valid modulus
+        DeadlineExceeded: If the context's deadline passes while solving
+        ExecutionCancelled: If the context is cancelled while solving
+    """
+    return BoardState(
+        n, board, combinations_mode, modulus, numpy_min_cells, context
+    ).solution()
+
+
+class BoardState:
+    """
+    Solver state of one board, kept to re-solve it after cell edits.
+
+    The value of cell i only depends on board[i] and on the values of the
+    cells after it, so editing cell k only changes the values of cells
+    0..k. Besides the per-cell values, the state keeps the running suffix
+    sums at the start of every block of _BLOCK_CELLS cells; an edit resumes
+    the backward pass from the block holding k, recomputing at most
+    k + _BLOCK_CELLS cells instead of the whole board. Resumed passes
+    perform exactly the same operations as a full solve, so the results are
+    identical to solving the edited board from scratch.
+
+    The first solve of a board of at least numpy_min_cells cells skips
+    most of the probability pass when NumPy is installed. The recurrence
+    is sequential (every cell needs the running sum of all the cells after
+    it), but every cell from which all moves go forward has probability
+    exactly 1.0: the longest such suffix of the board is found and filled
+    with vectorized operations, together with its running sums, and the
+    backward pass only runs over the cells before it. Sums of 1.0 are
+    exact in floating point, so the values are identical to the
+    pure-Python pass (the tolerance is zero), not merely close. The
+    combinations passes have no such shortcut and always run in Python.
+
+    The first solve checks the optional ExecutionContext once per block
+    and stops when it is cancelled or past its deadline. Updates always
+    run to completion, so a stored state is never left half re-solved.
+
+    Attributes:
+        n (int): Size of the board
+        board (Sequence[int]): Jump value for each cell
+        combinations_mode (str): "exact", "mod" or "log10"
+        modulus (Optional[int]): Modulus used in "mod" mode
+    """
+
+    def __init__(
+        self,
+        n: int,
+        board: Sequence[int],
+        combinations_mode: str = COMBINATIONS_EXACT,
+        modulus: Optional[int] = None,
+        numpy_min_cells: Optional[int] = NUMPY_MIN_CELLS,
+        context: Optional[ExecutionContext] = None,
+    ) -> None:
+        if combinations_mode == COMBINATIONS_MOD and (modulus is None or modulus < 1):
+            raise ValueError("combinations_mode 'mod' requires a positive modulus")
+        if combinations_mode not in (
+            COMBINATIONS_EXACT,
+            COMBINATIONS_MOD,
+            COMBINATIONS_LOG10,
+        ):
+            raise ValueError(f"Unknown combinations_mode: {combinations_mode}")
+
+        self.n = n
+        self.board = board
+        self.combinations_mode = combinations_mode
+        self.modulus = modulus
+        if n <= 1:
+            return
+
+        _check_start_jump(n, board)
+        blocks = (n - 2) // _BLOCK_CELLS + 1
+        # Valores por célula em arrays tipados (8 bytes por célula), exceto
+        # o modo exato, cujos inteiros não cabem em tamanho fixo
+        self._probability = _zeros("d", n)
+        self._probability[n - 1] = 1.0
+        self._probability_checkpoints = [1.0] * blocks
+        if combinations_mode == COMBINATIONS_LOG10:
+            self._combinations = _zeros("d", n)
+            self._combinations[n - 1] = 1.0
+            self._exponents = _zeros("q", n)
+            self._combinations_checkpoints = [(1.0, 0)] * blocks
+        elif combinations_mode == COMBINATIONS_MOD and modulus <= _INT64_LIMIT:
+            self._combinations = _zeros("q", n)
+            self._combinations[n - 1] = 1 % modulus
+            self._combinations_checkpoints = [1 % modulus] * blocks
+        else:
+            last = 1 if combinations_mode == COMBINATIONS_EXACT else 1 % modulus
+            self._combinations = [0] * n
+            self._combinations[n - 1] = last
+            self._combinations_checkpoints = [last] * blocks
+
+        probability_start = n - 2
+        if (
+            numpy_min_cells is not None
+            and n >= numpy_min_cells
+            and optional_module("numpy") is not None
+        ):
+            probability_start = _probability_suffix(
+                n, board, self._probability, self._probability_checkpoints
+            )
+        self._solve(n - 2, probability_start, context.check if context else _no_check)
+
+    def solution(self) -> BoardSolution:
+        """
+        Return the metrics of the board in its current state.
+
+        Returns:
+            BoardSolution: The board metrics
+        """
+        log10 = self.combinations_mode == COMBINATIONS_LOG10
+        if self.n <= 1:
+            return BoardSolution(
+                turns=0, probability=0.0, combinations=None if log10 else 0
+            )
+        if log10:
+            return BoardSolution(
+                turns=1,
+                probability=self._probability[0],
+                combinations=None,
+                combinations_log10=math.log10(self._combinations[0])
+                + self._exponents[0] * _LOG10_2,
+            )
+        return BoardSolution(
+            turns=1,
+            probability=self._probability[0],
+            combinations=self._combinations[0],
+        )
+
+    def update(self, cells: Mapping[int, int]) -> int:
+        """
+        Change the jump values of some cells and re-solve the board.
+
+        The edit is validated before anything changes: on error the state
+        is left as it was.
+
+        Args:
+            cells (Mapping[int, int]): New jump value by cell index
+
+        Returns:
+            int: Number of cells whose values were recomputed
+
+        Raises:
+            ValueError: If a cell index is outside the board
+            IndexError: If a new fixed jump lands before the start of the
+                board
+        """
+        n = self.n
+        board = self.board
+        for index, value in cells.items():
+            if not 0 <= index < n:
+                raise ValueError(f"Cell index {index} is outside the board")
+            if index < n - 1 and index + value < -n:
+                raise IndexError("list index out of range")
+        if not cells:
+            return 0
+
+        previous = {index: board[index] for index in cells}
+        for index, value in cells.items():
+            board[index] = value
+        try:
+            _check_start_jump(n, board)
+        except IndexError:
+            for index, value in previous.items():
+                board[index] = value
+            raise
+
+        # A última célula não tem pulo a recalcular
+        last = max((index for index in cells if index < n - 1), default=-1)
+        if last < 0:
+            return 0
+        start = min(n - 2, last // _BLOCK_CELLS * _BLOCK_CELLS + _BLOCK_CELLS - 1)
+        # Células a recalcular voltam a valer 0, como numa solução nova
+        _clear(self._probability, start + 1)
+        _clear(self._combinations, start + 1)
+        self._solve(start)
+        return start + 1
+
+    def _solve(
+        self,
+        start: int,
+        probability_start: Optional[int] = None,
+        check: Callable[[], None] = _no_check,
+    ) -> None:
+        n = self.n
+        if probability_start is None:
+            probability_start = start
+        if probability_start >= 0:
+            _probability(
+                n,
+                self.board,
+                self._probability,
+                self._probability_checkpoints,
+                probability_start,
+                check,
+            )
+        if self.combinations_mode == COMBINATIONS_LOG10:
+            _combinations_log10(
+                n,
+                self.board,
+                self._combinations,
+                self._exponents,
+                self._combinations_checkpoints,
+                start,
+                check,
+            )
+        elif self.combinations_mode == COMBINATIONS_MOD:
+            _combinations_mod(
+                n,
+                self.board,
+                self._combinations,
+                self._combinations_checkpoints,
+                start,
+                self.modulus,
+                check,
+            )
+        else:
+            _combinations_exact(
+                n,
+                self.board,
+                self._combinations,
+                self._combinations_checkpoints,
+                start,
+                check,
+            )
+
+
+def int32_board(data: bytes) -> array:
+    """
+    Decode a board sent as little-endian int32 values.
+
+    Args:
+        data (bytes): 4 bytes per cell
+
+    Returns:
+        array: The jump values, as an array('i') of 4 bytes per cell
+
+    Raises:
+        ValueError: If the length is not a multiple of 4
+    """
+    if len(data) % 4:
+        raise ValueError("binary board length must be a multiple of 4 bytes")
+    board = array("i")
+    board.frombytes(data)
+    if sys.byteorder == "big":
+        board.byteswap()
+    return board
+
+
+def _zeros(typecode: str, n: int) -> array:
+    return array(typecode, [0]) * n
+
+
+def _clear(values: MutableSequence, count: int) -> None:
+    if isinstance(values, array):
+        values[:count] = _zeros(values.typecode, count)
+    else:
+        values[:count] = [0] * count
+
+
+# Cada passo reverso começa no início de um bloco (as posições
+# b * _BLOCK_CELLS + _BLOCK_CELLS - 1, ou n - 2 no último bloco) e grava a soma
+# corrente nesse ponto, de onde uma edição pode retomá-lo.
+
+
+def _block_cells(block: int, start: int) -> range:
+    first = block * _BLOCK_CELLS
+    return range(min(start, first + _BLOCK_CELLS - 1), first - 1, -1)
+
+
+def _probability(
+    n: int,
+    board: Sequence[int],
+    dp: List[float],
+    checkpoints: List[float],
+    start: int,
+    check: Callable[[], None],
+) -> None:
+    # Células ainda não calculadas valem 0, exatamente o que a DP de
+    # referência lê para pulos que caem na própria célula ou antes dela.
+    total = checkpoints[start // _BLOCK_CELLS]
+    for block in range(start // _BLOCK_CELLS, -1, -1):
+        check()
+        checkpoints[block] = total
+        for i in _block_cells(block, start):
+            free_jumps = n - 1 - i
+            target = i + board[i]
+            if target < n:
+                if target < 0:
+                    if target < -n:
+                        raise IndexError("list index out of range")
+                    target += n
+                value = (total + dp[target]) / (free_jumps + 1)
+            else:
+                value = total / free_jumps
+            dp[i] = value
+            total += value
+
+
+def _probability_suffix(
+    n: int, board: Sequence[int], dp: array, checkpoints: List[float]
+) -> int:
+    """
+    Fill, with NumPy, the suffix of cells whose probability is exactly 1.0.
+
+    A cell whose fixed jump leaves the board or lands on a later cell only
+    moves to cells that are solved before it; if all of those are 1.0, so
+    is the cell, and the running sum before cell c is the exact integer
+    n - 1 - c. The suffix therefore ends at the last cell whose fixed jump
+    lands on itself or on an earlier cell (after Python's negative
+    indexing), which reads a 0.0 or fails in the backward pass.
+
+    Args:
+        n (int): Size of the board
+        board (Sequence[int]): Jump value for each cell
+        dp (array): Probability per cell, as an array('d')
+        checkpoints (List[float]): Running sums at the start of each block
+
+    Returns:
+        int: Cell where the backward pass must start, at the start of a
+        block (-1 when the whole board was filled)
+    """
+    np = optional_module("numpy")
+    try:
+        if isinstance(board, array):
+            jumps = np.frombuffer(board, dtype=board.typecode)[: n - 1]
+        else:
+            jumps = np.asarray(board[: n - 1], dtype=np.int64)
+    except OverflowError:
+        # Pulos fora do int64: fica com o passo em Python puro
+        return n - 2
+    cells = np.arange(n - 1, dtype=np.int64)
+    # Limita os pulos para a soma não estourar; a classificação não muda
+    targets = cells + np.clip(jumps, -2 * n, n)
+    targets = np.where(targets < 0, targets + n, targets)
+    backward = np.flatnonzero((targets < n) & (targets <= cells))
+    if len(backward):
+        last = int(backward[-1])
+        start = min(n - 2, last // _BLOCK_CELLS * _BLOCK_CELLS + _BLOCK_CELLS - 1)
+    else:
+        start = -1
+
+    np.frombuffer(dp, dtype=np.float64)[start + 1 : n - 1] = 1.0
+    first_block = max(start, 0) // _BLOCK_CELLS
+    block_starts = np.minimum(
+        n - 2,
+        np.arange(first_block, len(checkpoints), dtype=np.int64) * _BLOCK_CELLS
+        + _BLOCK_CELLS
+        - 1,
+    )
+    checkpoints[first_block:] = (n - 1 - block_starts).astype(np.float64).tolist()
+    return start
+
+
+def _combinations_exact(
+    n: int,
+    board: Sequence[int],
+    dp: List[int],
+    checkpoints: List[int],
+    start: int,
+    check: Callable[[], None],
+) -> None:
+    total = checkpoints[start // _BLOCK_CELLS]
+    for block in range(start // _BLOCK_CELLS, -1, -1):
+        check()
+        checkpoints[block] = total
+        for i in _block_cells(block, start):
+            target = i + board[i]
+            if target < n:
+                if target < 0:
+                    if target < -n:
+                        raise IndexError("list index out of range")
+                    target += n
+                value = total + dp[target]
+            else:
+                value = total
+            dp[i] = value
+            total += value
+
+
+def _combinations_mod(
+    n: int,
+    board: Sequence[int],
+    dp: List[int],
+    checkpoints: List[int],
+    start: int,
+    modulus: int,
+    check: Callable[[], None],
+) -> None:
+    total = checkpoints[start // _BLOCK_CELLS]
+    for block in range(start // _BLOCK_CELLS, -1, -1):
+        check()
+        checkpoints[block] = total
+        for i in _block_cells(block, start):
+            target = i + board[i]
+            if target < n:
+                if target < 0:
+                    if target < -n:
+                        raise IndexError("list index out of range")
+                    target += n
+                value = (total + dp[target]) % modulus
+            else:
+                value = total
+            dp[i] = value
+            total = (total + value) % modulus
+
+
+def _combinations_log10(
+    n: int,
+    board: Sequence[int],
+    dp: List[float],
+    exponents: List[int],
+    checkpoints: List[Tuple[float, int]],
+    start: int,
+    check: Callable[[], None],
+) -> None:
+    # Valores guardados como mantissa * 2^expoente: a soma corrente é
+    # reescalada sempre que se aproxima do limite do float, e cada célula
+    # lembra o expoente com que foi gravada.
+    total, exponent = checkpoints[start // _BLOCK_CELLS]
+    for block in range(start // _BLOCK_CELLS, -1, -1):
+        check()
+        checkpoints[block] = (total, exponent)
+        for i in _block_cells(block, start):
+            target = i + board[i]
+            if target < n:
+                if target < 0:
+                    if target < -n:
+                        raise IndexError("list index out of range")
+                    target += n
+                value = total + math.ldexp(dp[target], exponents[target] - exponent)
+            else:
+                value = total
+            dp[i] = value
+            exponents[i] = exponent
+            total += value
+            if total > _LOG_RESCALE_LIMIT:
+                total = math.ldexp(total, -_LOG_RESCALE_BITS)
+                exponent += _LOG_RESCALE_BITS
+
+
+def _check_start_jump(n: int, board: Sequence[int]) -> None:
+    """
+    Reproduce the only failure of the reference BFS not covered by the DPs.
+
+    A negative fixed jump from the start is queued as a (negative) position
+    and expanded before the last cell is reached; its own fixed jump then
+    indexes the board from the end and may land out of range.
+
+    Args:
+        n (int): Size of the board
+        board (Sequence[int]): Jump value for each cell
+
+    Raises:
+        IndexError: If the jump chain from the start leaves the board
+    """
+    start_jump = board[0]
+    if -n <= start_jump < 0:
+        cell = start_jump + n
+        if cell + board[cell] < 0:
+            raise IndexError("list index out of range")
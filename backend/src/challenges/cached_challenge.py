@@ -0,0 +1,104 @@
+from functools import lru_cache
+from typing import Optional, get_type_hints
+from pydantic import BaseModel
+from core.cache import ResultCache, get_result_cache, input_hash
+from core.config import settings
+from src.challenges.base_challenge import IChallenge
+from src.challenges.execution_context import ExecutionContext
+
+
+class CachedChallenge(IChallenge):
+    """
+    Decorator that memoizes the results of another challenge.
+
+    Results are keyed on a canonical hash of the validated input, so any
+    IChallenge whose output depends only on its input can be wrapped.
+    The output model used to decode shared cache entries is taken from the
+    return annotation of the wrapped challenge's execute method.
+
+    Inherits from:
+        IChallenge: Base interface for challenge implementations
+    """
+
+    def __init__(self, challenge: IChallenge, cache: ResultCache):
+        self.challenge = challenge
+        self.cache = cache
+        self._namespace = type(challenge).__name__
+        self._output_model = _output_model(type(challenge))
+
+    def lookup(self, input_data: BaseModel) -> Optional[BaseModel]:
+        """
+        Return the cached output for an input, if any.
+
+        Args:
+            input_data (BaseModel): Validated challenge input
+
+        Returns:
+            Optional[BaseModel]: A copy of the cached output, or None
+        """
+        cached = self.cache.get(self.key(input_data), self._output_model)
+        return None if cached is None else cached.model_copy()
+
+    def store(self, input_data: BaseModel, output: BaseModel) -> None:
+        """
+        Cache the output computed for an input.
+
+        Args:
+            input_data (BaseModel): Validated challenge input
+            output (BaseModel): Output returned by the wrapped challenge
+        """
+        self.cache.set(self.key(input_data), output)
+
+    def key(self, input_data: BaseModel) -> str:
+        return input_hash(self._namespace, input_data)
+
+    def input_size(self, input_data: BaseModel) -> Optional[int]:
+        return self.challenge.input_size(input_data)
+
+    def estimate_cost(self, body_size: int) -> float:
+        return self.challenge.estimate_cost(body_size)
+
+    def execute(
+        self, input_data: BaseModel, context: Optional[ExecutionContext] = None
+    ) -> BaseModel:
+        """
+        Return the cached output or execute the wrapped challenge.
+
+        Args:
+            input_data (BaseModel): Validated challenge input
+            context (Optional[ExecutionContext]): Passed on to the wrapped
+                challenge on a cache miss
+
+        Returns:
+            BaseModel: Output of the wrapped challenge
+        """
+        cached = self.lookup(input_data)
+        if cached is not None:
+            return cached
+        output = self.challenge.execute(input_data, context)
+        self.store(input_data, output)
+        return output
+
+
+@lru_cache(maxsize=None)
+def _output_model(challenge_class: type) -> type:
+    return get_type_hints(challenge_class.execute)["return"]
+
+
+def with_result_cache(name: str, challenge: IChallenge) -> IChallenge:
+    """
+    Wrap a challenge with the shared result cache of its name.
+
+    Used by the route dependency providers to opt in to caching. Returns
+    the challenge unchanged when CACHE_ENABLED is off.
+
+    Args:
+        name (str): Challenge name, e.g. "board_game"
+        challenge (IChallenge): Challenge instance to wrap
+
+    Returns:
+        IChallenge: The cached challenge, or the challenge itself
+    """
+    if not settings.CACHE_ENABLED:
+        return challenge
+    return CachedChallenge(challenge, get_result_cache(name))
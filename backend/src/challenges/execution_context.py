@@ -0,0 +1,98 @@
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised inside a challenge when its request's deadline has passed.
+
+    Attributes:
+        timeout (Optional[float]): Time budget of the request, in seconds
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        detail = f" of {timeout:g}s" if timeout is not None else ""
+        super().__init__(f"Execution deadline{detail} exceeded")
+        self.timeout = timeout
+
+    def __reduce__(self):
+        # Volta inteira dos workers de processo
+        return type(self), (self.timeout,)
+
+
+class ExecutionCancelled(Exception):
+    """Raised inside a challenge when its client has gone away."""
+
+    def __init__(self) -> None:
+        super().__init__("Execution cancelled: the client disconnected")
+
+    def __reduce__(self):
+        return type(self), ()
+
+
+class ExecutionContext:
+    """
+    Deadline and cancellation state of one request, passed to execute.
+
+    Long-running challenges call check() every few thousand steps, so
+    abandoned or late work stops soon after it is no longer wanted. The
+    deadline is a time.monotonic() instant, which is shared by all the
+    processes of a machine. A context pickled to a process pool worker
+    arrives there as a plain ExecutionContext holding the same timeout,
+    deadline and cancelled flag, whatever its subclass (a RequestContext
+    holds the request's receive channel, which cannot be pickled); later
+    cancellation is a flag of this process and only reaches inline and
+    thread workers.
+
+    Attributes:
+        deadline (Optional[float]): time.monotonic() instant after which
+            the work is abandoned; None for no deadline
+        timeout (Optional[float]): Time budget the deadline was built from
+        cancelled (bool): Whether the work is no longer wanted
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.cancelled = False
+
+    def __reduce__(self):
+        # Só o prazo e o estado viajam para os workers de processo
+        return _restore_context, (self.timeout, self.deadline, self.cancelled)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def remaining(self) -> Optional[float]:
+        """
+        Return the time left before the deadline.
+
+        Returns:
+            Optional[float]: Seconds left (negative once passed), or None
+            without a deadline
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def check(self) -> None:
+        """
+        Stop the work if it is no longer wanted.
+
+        Raises:
+            ExecutionCancelled: If the context was cancelled
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.cancelled:
+            raise ExecutionCancelled()
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DeadlineExceeded(self.timeout)
+
+
+def _restore_context(
+    timeout: Optional[float], deadline: Optional[float], cancelled: bool
+) -> ExecutionContext:
+    context = ExecutionContext(timeout)
+    context.deadline = deadline
+    context.cancelled = cancelled
+    return context
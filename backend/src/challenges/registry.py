@@ -0,0 +1,218 @@
+import importlib
+import threading
+import time
+from typing import Callable, Dict, Tuple, get_type_hints
+from pydantic import BaseModel
+from core.logging import logger
+from src.challenges.base_challenge import IChallenge
+from src.challenges.cached_challenge import with_result_cache
+
+
+class ChallengeRegistry:
+    """
+    Holds one long-lived instance of every challenge strategy.
+
+    Challenges are registered with a factory and built once, normally in the
+    application lifespan. Building calls each challenge's warmup() hook and
+    records how long it took. Routes resolve their challenge by name, so
+    per-instance state (caches, tables, pools) survives across requests.
+
+    Instances are shared by concurrent requests and must be thread-safe;
+    the challenges in this package keep no per-request state.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Tuple[Callable[[], IChallenge], bool]] = {}
+        self._instances: Dict[str, IChallenge] = {}
+        self._resolved: Dict[str, IChallenge] = {}
+        self._warmup_ms: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, name: str, factory: Callable[[], IChallenge], cached: bool = False
+    ) -> None:
+        """
+        Register a challenge factory under a name.
+
+        Args:
+            name (str): Challenge name, e.g. "board_game"
+            factory (Callable[[], IChallenge]): Builds the challenge instance
+            cached (bool): Whether routes get the instance wrapped with the
+                shared result cache
+        """
+        with self._lock:
+            self._factories[name] = (factory, cached)
+            self._instances.pop(name, None)
+            self._resolved.pop(name, None)
+
+    def build(self) -> Dict[str, float]:
+        """
+        Instantiate and warm up every registered challenge not built yet.
+
+        Returns:
+            Dict[str, float]: Warmup time in milliseconds per challenge
+        """
+        with self._lock:
+            for name in self._factories:
+                if name not in self._instances:
+                    self._build(name)
+            return dict(self._warmup_ms)
+
+    def import_modules(self) -> None:
+        """
+        Import the modules of challenges registered with lazy_factory.
+
+        Nothing is built or warmed up, so no connections or threads are
+        created; used to load the code before worker processes are forked.
+        """
+        for factory, _ in self._factories.values():
+            module_name = getattr(factory, "module_name", None)
+            if module_name is not None:
+                importlib.import_module(module_name)
+
+    def get(self, name: str) -> IChallenge:
+        """
+        Return the instance routes should execute for a challenge.
+
+        Builds the challenge on first use if the registry was not built
+        yet (e.g. when the lifespan handler did not run).
+
+        Args:
+            name (str): Challenge name
+
+        Returns:
+            IChallenge: The shared instance, wrapped with the result cache
+            when the challenge was registered as cached
+
+        Raises:
+            KeyError: If no challenge is registered under that name
+        """
+        resolved = self._resolved.get(name)
+        if resolved is None:
+            with self._lock:
+                if name not in self._resolved:
+                    self._build(name)
+                resolved = self._resolved[name]
+        return resolved
+
+    def unwrapped(self, name: str) -> IChallenge:
+        """
+        Return the shared challenge instance without the result cache.
+
+        Args:
+            name (str): Challenge name
+
+        Returns:
+            IChallenge: The shared, uncached instance
+        """
+        self.get(name)
+        return self._instances[name]
+
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._factories)
+
+    def input_model(self, name: str) -> type:
+        """
+        Return the input model a challenge's execute method expects.
+
+        Taken from the annotation of execute's input_data parameter, so
+        generic endpoints can validate raw input for any challenge.
+
+        Args:
+            name (str): Challenge name
+
+        Returns:
+            type: The Pydantic input model, e.g. BoardGameInput
+
+        Raises:
+            KeyError: If no challenge is registered under that name
+            TypeError: If execute is not annotated with a Pydantic model
+        """
+        hints = get_type_hints(type(self.unwrapped(name)).execute)
+        model = hints.get("input_data")
+        if not (isinstance(model, type) and issubclass(model, BaseModel)):
+            raise TypeError(f"Challenge {name} has no annotated input model")
+        return model
+
+    def _build(self, name: str) -> None:
+        factory, cached = self._factories[name]
+        start = time.perf_counter()
+        challenge = factory()
+        challenge.warmup()
+        self._warmup_ms[name] = (time.perf_counter() - start) * 1000
+        self._instances[name] = challenge
+        self._resolved[name] = (
+            with_result_cache(name, challenge) if cached else challenge
+        )
+
+
+def lazy_factory(path: str) -> Callable[[], IChallenge]:
+    """
+    Build a factory that imports its challenge class only when called.
+
+    Registering challenges by path keeps importing the registry cheap: a
+    challenge's module (and its dependencies, such as NumPy) is imported
+    when the challenge is built, and the import time is included in the
+    build time reported at startup.
+
+    Args:
+        path (str): "module:ClassName" of the challenge class
+
+    Returns:
+        Callable[[], IChallenge]: Factory returning a new instance
+    """
+    module_name, _, class_name = path.partition(":")
+
+    def factory() -> IChallenge:
+        return getattr(importlib.import_module(module_name), class_name)()
+
+    factory.module_name = module_name
+    return factory
+
+
+# Registro global com as estratégias da aplicação
+registry = ChallengeRegistry()
+registry.register(
+    "string", lazy_factory("src.challenges.string_challenge:StringChallenge")
+)
+registry.register(
+    "sequence", lazy_factory("src.challenges.sequence_challenge:SequenceChallenge")
+)
+registry.register(
+    "board_game",
+    lazy_factory("src.challenges.board_game_challenge:BoardGameChallenge"),
+    cached=True,
+)
+registry.register(
+    "benefits",
+    lazy_factory("src.challenges.benefits_challenge:BenefitsChallenge"),
+    cached=True,
+)
+
+
+def get_registry() -> ChallengeRegistry:
+    """
+    Dependency provider for the application challenge registry.
+
+    Returns:
+        ChallengeRegistry: The registry holding the shared challenges.
+    """
+    return registry
+
+
+def log_startup_report(warmup_ms: Dict[str, float]) -> None:
+    """
+    Log how long each challenge took to import, build and warm up.
+
+    Args:
+        warmup_ms (Dict[str, float]): Warmup time per challenge, as returned
+            by ChallengeRegistry.build
+    """
+    for name, elapsed in warmup_ms.items():
+        logger.info(
+            f"Challenge ready: {name} ({elapsed:.2f} ms)",
+            extra={"challenge": name, "warmup_ms": round(elapsed, 2)},
+        )
+    logger.info(
+        f"Challenges ready: {len(warmup_ms)} in {sum(warmup_ms.values()):.2f} ms"
+    )
@@ -1,5 +1,21 @@
+import sys
+from array import array
+from typing import Iterator, List, Optional
 from src.challenges.base_challenge import IChallenge
-from core.validators import SequenceInput, SequenceOutput
+from src.challenges.execution_context import ExecutionContext
+from core.validators import (
+    SequenceInput,
+    SequenceOutput,
+    SequencePositionOutput,
+    SequenceRangeInput,
+    SequenceSumOutput,
+    SequenceValueInput,
+)
+
+FIRST_TERM = 11
+DIFFERENCE = 7
+# Maior valor representável no formato binário (int64)
+INT64_MAX = 2**63 - 1
 
 
 class SequenceChallenge(IChallenge):
@@ -19,7 +35,9 @@ class SequenceChallenge(IChallenge):
         IChallenge: Base interface for challenge implementations
     """
 
-    def execute(self, input_data: SequenceInput) -> SequenceOutput:
+    def execute(
+        self, input_data: SequenceInput, context: Optional[ExecutionContext] = None
+    ) -> SequenceOutput:
         """
         Calculate the sequence value at the specified position.
 
@@ -30,6 +48,8 @@ class SequenceChallenge(IChallenge):
             input_data (SequenceInput): Input data containing:
                 - position (int): The 1-indexed position in the
                 sequence to calculate (position >= 1)
+            context (Optional[ExecutionContext]): Unused, the value is
+                computed in constant time
 
         Returns:
             SequenceOutput: Object containing the calculated sequence value:
@@ -50,5 +70,126 @@ class SequenceChallenge(IChallenge):
             at position 1)
         """
         position = input_data.position
-        result = 11 + (position - 1) * 7
+        result = FIRST_TERM + (position - 1) * DIFFERENCE
         return SequenceOutput(result=result)
+
+    def execute_many(self, positions: List[int]) -> List[int]:
+        """
+        Calculate the sequence values at many positions at once.
+
+        Args:
+            positions (List[int]): 1-indexed positions (each >= 1)
+
+        Returns:
+            List[int]: The value at each position, in input order
+        """
+        offset = FIRST_TERM - DIFFERENCE
+        return [offset + position * DIFFERENCE for position in positions]
+
+    def range_values(self, input_data: SequenceRangeInput) -> range:
+        """
+        Return the values at the positions of a range, without computing them.
+
+        The values at positions range(start, stop, step) are themselves an
+        arithmetic progression, so they are returned as a lazy range object.
+
+        Args:
+            input_data (SequenceRangeInput): Input data containing:
+                - start (int): First position (>= 1)
+                - stop (int): Position where the range stops (exclusive)
+                - step (int): Distance between positions (>= 1)
+
+        Returns:
+            range: The values, in position order
+        """
+        first = FIRST_TERM + (input_data.start - 1) * DIFFERENCE
+        difference = input_data.step * DIFFERENCE
+        return range(
+            first, first + self.range_count(input_data) * difference, difference
+        )
+
+    def range_count(self, input_data: SequenceRangeInput) -> int:
+        """
+        Count the positions of a range.
+
+        Unlike len(range(...)), works for counts beyond sys.maxsize.
+
+        Args:
+            input_data (SequenceRangeInput): The positions to count
+
+        Returns:
+            int: Number of positions in range(start, stop, step)
+        """
+        span = input_data.stop - input_data.start
+        return max(0, -(-span // input_data.step))
+
+    def iter_range_chunks(
+        self, input_data: SequenceRangeInput, binary: bool, chunk_size: int = 65536
+    ) -> Iterator[bytes]:
+        """
+        Encode the values of a range chunk by chunk.
+
+        Args:
+            input_data (SequenceRangeInput): The positions to encode
+            binary (bool): Encode as little-endian int64 instead of NDJSON
+            chunk_size (int): Number of values per chunk
+
+        Yields:
+            bytes: Either raw int64 values or one JSON array per line
+
+        Raises:
+            OverflowError: If a binary value does not fit in an int64
+        """
+        values = self.range_values(input_data)
+        if binary and values and values[-1] > INT64_MAX:
+            raise OverflowError("sequence values do not fit in int64")
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start : start + chunk_size]
+            if binary:
+                encoded = array("q", chunk)
+                if sys.byteorder == "big":
+                    encoded.byteswap()
+                yield encoded.tobytes()
+            else:
+                yield ("[" + ",".join(map(str, chunk)) + "]\n").encode("ascii")
+
+    def range_sum(self, input_data: SequenceRangeInput) -> SequenceSumOutput:
+        """
+        Calculate the sum of the values at the positions of a range in O(1).
+
+        Uses the closed form of an arithmetic series: the number of terms
+        times the mean of the first and last terms.
+
+        Args:
+            input_data (SequenceRangeInput): The positions to sum
+
+        Returns:
+            SequenceSumOutput: Number of terms and their sum
+        """
+        count = self.range_count(input_data)
+        first = FIRST_TERM + (input_data.start - 1) * DIFFERENCE
+        last = first + (count - 1) * input_data.step * DIFFERENCE
+        total = count * (first + last) // 2 if count else 0
+        return SequenceSumOutput(count=count, sum=total)
+
+    def position_of(self, input_data: SequenceValueInput) -> SequencePositionOutput:
+        """
+        Find the position that holds a value, in O(1).
+
+        Args:
+            input_data (SequenceValueInput): Input data containing:
+                - value (int): The value to look up
+
+        Returns:
+            SequencePositionOutput: The 1-indexed position, or None when the
+            value is not a term of the sequence
+
+        Example:
+            value = 11 → position = 1
+            value = 39 → position = 5
+            value = 12 → position = None
+        """
+        offset = input_data.value - FIRST_TERM
+        if offset < 0 or offset % DIFFERENCE:
+            return SequencePositionOutput(position=None)
+        return SequencePositionOutput(position=offset // DIFFERENCE + 1)
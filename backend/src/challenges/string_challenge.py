@@ -1,5 +1,7 @@
+from typing import List, Optional
 from core.logging import logger
 from src.challenges.base_challenge import IChallenge
+from src.challenges.execution_context import ExecutionContext
 from core.validators import StringInput, StringOutput
 
 
@@ -16,7 +18,9 @@ class StringChallenge(IChallenge):
         IChallenge: Base interface for challenge implementations
     """
 
-    def execute(self, input_data: StringInput) -> StringOutput:
+    def execute(
+        self, input_data: StringInput, context: Optional[ExecutionContext] = None
+    ) -> StringOutput:
         """
         Validate if the input string meets the required pattern criteria.
 
@@ -27,6 +31,8 @@ class StringChallenge(IChallenge):
         Args:
             input_data (StringInput): Input data containing:
                 - text (str): The string to be validated
+            context (Optional[ExecutionContext]): Unused, only the first
+                and last characters are inspected
 
         Returns:
             StringOutput: Object containing the validation result:
@@ -50,9 +56,106 @@ class StringChallenge(IChallenge):
             The string must have at least 2 characters to satisfy
             both conditions.
         """
-        logger.info(f"Processing string: {input_data}")
-        logger.info(f"Processing string: {input_data.text}")
         text = input_data.text
-        is_valid = text.startswith("B") and text.endswith("A")
-        logger.info(f"StringChallenge result: {is_valid}")
+        # %.80s: só o começo do texto é formatado, mesmo em DEBUG
+        logger.debug("Processing string: %.80s", text)
+        is_valid = self.is_valid(text)
+        logger.debug("StringChallenge result: %s", is_valid)
         return StringOutput(is_valid=is_valid)
+
+    def input_size(self, input_data: StringInput) -> int:
+        """
+        Report the number of characters in the text, for the metrics.
+
+        Args:
+            input_data (StringInput): Validated string input
+
+        Returns:
+            int: Length of the text
+        """
+        return len(input_data.text)
+
+    def is_valid(self, text: str) -> bool:
+        """
+        Apply the validation rule to a plain string.
+
+        Args:
+            text (str): The string to be validated
+
+        Returns:
+            bool: True if the string starts with 'B' and ends with 'A'
+        """
+        return text.startswith("B") and text.endswith("A")
+
+    def execute_many(self, texts: List[Optional[str]]) -> List[Optional[bool]]:
+        """
+        Validate many strings without building a StringInput for each.
+
+        Used by the streaming endpoint, which validates whole chunks of an
+        upload at once. Entries that could not be parsed are passed as None
+        and stay None in the result.
+
+        Args:
+            texts (List[Optional[str]]): Strings to validate
+
+        Returns:
+            List[Optional[bool]]: The validation result of each string
+        """
+        return [None if text is None else self.is_valid(text) for text in texts]
+
+    def execute_edges(self, head: bytes, tail: bytes) -> StringOutput:
+        """
+        Validate a UTF-8 string known only by its first and last bytes.
+
+        Used by the raw-body endpoint, which never materializes the text:
+        the rule only depends on the first and last code points, which are
+        decoded from up to four bytes at each end. Bytes between the ends
+        are not inspected, so invalid UTF-8 in the middle goes unnoticed.
+
+        Args:
+            head (bytes): The first (up to 4) bytes of the text
+            tail (bytes): The last (up to 4) bytes of the text
+
+        Returns:
+            StringOutput: Object containing the validation result
+
+        Raises:
+            ValueError: If the text is empty
+            UnicodeDecodeError: If either end is not a valid UTF-8 code point
+        """
+        if not head:
+            raise ValueError("text must not be empty")
+        first = _decode_edge(head, from_end=False)
+        last = _decode_edge(tail, from_end=True)
+        # Texto de um único code point: "B" começa com B mas não termina com A
+        return StringOutput(is_valid=first == "B" and last == "A")
+
+
+def _decode_edge(data: bytes, from_end: bool) -> str:
+    """
+    Decode the code point at one end of a UTF-8 byte sequence.
+
+    UTF-8 is prefix-free, so the shortest prefix (or suffix) of up to four
+    bytes that decodes is exactly one code point.
+
+    Args:
+        data (bytes): Bytes at the start or at the end of the text
+        from_end (bool): Decode the last code point instead of the first
+
+    Returns:
+        str: The code point
+
+    Raises:
+        UnicodeDecodeError: If no valid code point is found at that end
+    """
+    view = memoryview(data)
+    for size in range(1, min(4, len(view)) + 1):
+        edge = view[len(view) - size :] if from_end else view[:size]
+        try:
+            return str(edge, "utf-8")
+        except UnicodeDecodeError:
+            continue
+    end = "end" if from_end else "start"
+    raise UnicodeDecodeError(
+        "utf-8", bytes(data), 0, len(data), f"invalid code point at the {end}"
+    )
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import struct
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from core.admission import AdmissionController, AdmissionMiddleware, estimate_cost
+from core.config import Settings
+from api.routes import board_game, string
+
+
+def make_client(**overrides):
+    config = Settings(
+        **{
+            "ADMISSION_MAX_REQUEST_COST": 100.0,
+            "ADMISSION_CLIENT_BUDGET": 150.0,
+            "ADMISSION_GLOBAL_BUDGET": 200.0,
+            **overrides,
+        }
+    )
+    controller = AdmissionController(config)
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+    app.include_router(string.router, prefix="/api/v1")
+    app.include_router(board_game.router, prefix="/api/v1")
+    return TestClient(app), controller
+
+
+def test_controller_enforces_client_and_global_budgets():
+    controller = AdmissionController(
+        Settings(ADMISSION_CLIENT_BUDGET=10.0, ADMISSION_GLOBAL_BUDGET=15.0)
+    )
+    assert controller.try_acquire("a", 8.0)
+    assert not controller.try_acquire("a", 3.0)
+    assert controller.try_acquire("b", 7.0)
+    assert not controller.try_acquire("c", 1.0)
+    controller.release("a", 8.0)
+    assert controller.try_acquire("c", 1.0)
+    assert controller.in_flight("a") == 0.0
+    assert controller.in_flight() == 8.0
+
+
+def test_board_game_costs_more_per_byte():
+    assert estimate_cost("/api/v1/board_game/", 1024) > estimate_cost(
+        "/api/v1/string/", 1024
+    )
+    assert estimate_cost("/api/v1/unknown/", 2048) == 3.0
+
+
+def test_batch_costs_as_much_as_costliest_challenge():
+    size = 400 * 1024
+    assert estimate_cost("/api/v1/batch/", size) == estimate_cost(
+        "/api/v1/board_game/", size
+    )
+
+
+def test_costly_request_rejected_before_reading_body():
+    client, controller = make_client()
+    board = [1] * 20_000
+    response = client.post(
+        "/api/v1/board_game/", json={"board_size": len(board), "board": board}
+    )
+    assert response.status_code == 413
+    assert controller.in_flight() == 0.0
+
+    response = client.post("/api/v1/string/", json={"text": "BHA"})
+    assert response.status_code == 200
+    assert controller.in_flight() == 0.0
+
+
+def test_request_over_budget_gets_429():
+    client, controller = make_client()
+    assert controller.try_acquire("testclient", 149.5)
+    response = client.post("/api/v1/string/", json={"text": "BHA"})
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    controller.release("testclient", 149.5)
+    assert client.post("/api/v1/string/", json={"text": "BHA"}).status_code == 200
+
+
+def test_chunked_body_is_charged_as_it_arrives():
+    client, controller = make_client()
+
+    def chunks():
+        for _ in range(200):
+            yield struct.pack("<256i", *([1] * 256))
+
+    response = client.post(
+        "/api/v1/board_game/binary",
+        content=chunks(),
+        headers={"content-type": "application/octet-stream"},
+    )
+    assert response.status_code == 413
+    assert controller.in_flight() == 0.0
+
+
+def test_client_header_identifies_clients():
+    client, controller = make_client(ADMISSION_CLIENT_HEADER="X-Real-IP")
+    assert controller.try_acquire("10.0.0.1", 149.5)
+    response = client.post(
+        "/api/v1/string/", json={"text": "BHA"}, headers={"X-Real-IP": "10.0.0.1"}
+    )
+    assert response.status_code == 429
+    response = client.post(
+        "/api/v1/string/", json={"text": "BHA"}, headers={"X-Real-IP": "10.0.0.2"}
+    )
+    assert response.status_code == 200
+
+
+def test_stream_is_charged_by_its_largest_chunk():
+    client, controller = make_client(ADMISSION_MAX_REQUEST_COST=10.0)
+    chunk = b"BxxxxA\n" * 1024
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": True} for _ in range(64)
+    ]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    # 448 KiB no total, nunca mais de 7 KiB de uma vez
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/string/stream",
+        "raw_path": b"/api/v1/string/stream",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"text/plain")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(client.app(scope, receive, send))
+    assert sent[0]["status"] == 200
+    body = b"".join(m.get("body", b"") for m in sent[1:]).decode().splitlines()
+    assert len(body) == 64 * 1024
+    assert json.loads(body[-1]) == {"index": 64 * 1024 - 1, "is_valid": True}
+    assert controller.in_flight() == 0.0
+
+
+def test_stream_over_budget_ends_with_error_line():
+    client, controller = make_client(ADMISSION_MAX_REQUEST_COST=10.0)
+
+    def lines():
+        for _ in range(4):
+            yield b"BxxxxA\n" * 1024
+
+    response = client.post(
+        "/api/v1/string/stream",
+        content=lines(),
+        headers={"content-type": "text/plain"},
+    )
+    assert response.status_code == 200
+    body = response.text.splitlines()
+    assert json.loads(body[-1]) == {"error": "Request exceeds the admission cost limit"}
+    assert controller.in_flight() == 0.0
@@ -0,0 +1,66 @@
+from backend.main import app
+from fastapi.testclient import TestClient
+from core.validators import BoardGameInput
+from src.challenges.registry import registry
+
+client = TestClient(app)
+
+
+def test_input_model_from_execute_annotation():
+    assert registry.input_model("board_game") is BoardGameInput
+
+
+def test_post_batch_mixed_items():
+    items = [
+        {"challenge": "string", "input": {"text": "BHA"}},
+        {"challenge": "sequence", "input": {"position": 5}},
+        {"challenge": "board_game", "input": {"board_size": 3, "board": [1, 1, 1]}},
+        {
+            "challenge": "benefits",
+            "input": {
+                "salary": 3000.0,
+                "hire_date": "2024-01-01",
+                "resignation_date": "2025-08-21",
+            },
+        },
+        {"challenge": "sequence", "input": {"position": 0}},
+        {"challenge": "chess", "input": {}},
+    ]
+    response = client.post("/api/v1/batch/", json={"items": items})
+    assert response.status_code == 200
+    data = response.json()
+    results = data["results"]
+    assert [result["index"] for result in results] == list(range(len(items)))
+    assert [result["status"] for result in results] == [200, 200, 200, 200, 422, 404]
+    assert data["errors"] == 2
+
+    assert results[0]["result"] == {"is_valid": True}
+    assert results[1]["result"] == {"result": 39}
+    single = client.post("/api/v1/board_game/", json=items[2]["input"]).json()
+    assert results[2]["result"] == single
+    single = client.post("/api/v1/benefits/", json=items[3]["input"]).json()
+    assert results[3]["result"] == single
+    assert results[4]["error"].startswith("position:")
+    assert results[5]["error"] == "Unknown challenge: chess"
+
+
+def test_post_batch_execution_error_is_per_item():
+    items = [
+        # Pulo fixo negativo a partir do início: a solução levanta IndexError
+        {"challenge": "board_game", "input": {"board_size": 3, "board": [-2, -5, 1]}},
+        {"challenge": "string", "input": {"text": "BA"}},
+    ]
+    response = client.post("/api/v1/batch/", json={"items": items})
+    results = response.json()["results"]
+    assert results[0]["status"] == 500
+    assert results[0]["error"].startswith("IndexError")
+    assert results[1]["status"] == 200
+
+
+def test_post_batch_too_many_items(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "BATCH_MAX_ITEMS", 2)
+    items = [{"challenge": "string", "input": {"text": "BA"}}] * 3
+    response = client.post("/api/v1/batch/", json={"items": items})
+    assert response.status_code == 413
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from benchmarks.common import latency_summary, measure, percentile
+from benchmarks.load import (
+    DEFAULT_MIX,
+    Workload,
+    open_client,
+    parse_mix,
+    run_closed,
+    run_open,
+)
+from benchmarks.run import compare
+from core.validators import BenefitsInput, BoardGameInput, SequenceInput, StringInput
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile(values, 1.0) == 100
+    assert percentile([], 0.5) == 0.0
+
+
+def test_measure_and_summary():
+    result = measure(lambda: sum(range(100)), repeats=3)
+    assert result["repeats"] == 3
+    assert result["min_s"] <= result["median_s"]
+
+    summary = latency_summary([0.001, 0.002, 0.003, 0.004], elapsed=0.5, errors=1)
+    assert summary["throughput_rps"] == 8.0
+    assert summary["error_rate"] == 0.25
+
+
+def test_compare_flags_regressions():
+    baseline = {"fast": {"value": 1.0}, "slow": {"value": 1.0}}
+    results = {"fast": {"value": 1.1}, "slow": {"value": 1.5}, "new": {"value": 1.0}}
+    report = {entry["name"]: entry for entry in compare(results, baseline, 0.2)}
+    assert set(report) == {"fast", "slow"}
+    assert not report["fast"]["regression"]
+    assert report["slow"]["regression"]
+
+
+def test_load_payloads_are_valid_inputs():
+    workload = Workload(parse_mix(DEFAULT_MIX), distinct=50, max_board=500)
+    models = {
+        "string": StringInput,
+        "sequence": SequenceInput,
+        "board_game": BoardGameInput,
+        "benefits": BenefitsInput,
+    }
+    for name, bodies in workload.bodies.items():
+        for body in bodies:
+            models[name].model_validate_json(body)
+
+    with pytest.raises(ValueError):
+        parse_mix("string=1,unknown=1")
+
+
+def test_load_closed_and_open_in_process():
+    workload = Workload({"string": 1, "board_game": 1}, distinct=5, max_board=50)
+
+    async def run():
+        async with open_client(None, connections=4, timeout=10) as client:
+            closed = await run_closed(
+                client, workload, concurrency=4, duration=0, requests=20
+            )
+            opened = await run_open(
+                client, workload, rate=200, duration=0.1, max_in_flight=4
+            )
+        return closed, opened
+
+    closed, opened = asyncio.run(run())
+    assert closed["requests"] == 20
+    assert closed["errors"] == 0
+    assert set(closed["endpoints"]) == {"string", "board_game"}
+    assert opened["requests"] == 20
+    assert opened["statuses"] == {"200": 20}
+    assert opened["target_rps"] == 200
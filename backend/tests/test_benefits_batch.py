@@ -0,0 +1,123 @@
+import random
+from datetime import date, timedelta
+
+from backend.main import app
+from fastapi.testclient import TestClient
+from core.validators import BenefitsInput
+from backend.src.challenges.benefits_challenge import BenefitsChallenge
+
+client = TestClient(app)
+
+
+def random_inputs(count, seed):
+    rng = random.Random(seed)
+    inputs = []
+    for _ in range(count):
+        hire_date = date(1990, 1, 1) + timedelta(days=rng.randint(0, 12000))
+        resignation_date = hire_date + timedelta(days=rng.randint(0, 4000))
+        salary = round(rng.uniform(500, 50000), 2)
+        inputs.append(
+            BenefitsInput(
+                salary=salary, hire_date=hire_date, resignation_date=resignation_date
+            )
+        )
+    return inputs
+
+
+def test_batch_matches_scalar():
+    challenge = BenefitsChallenge()
+    inputs = random_inputs(3000, seed=7)
+    inputs.append(
+        BenefitsInput(
+            salary=1000.0, hire_date="2020-02-29", resignation_date="2021-03-01"
+        )
+    )
+    for item, row in zip(challenge.execute_batch(inputs), inputs):
+        try:
+            expected = challenge.execute(row)
+        except ValueError:
+            assert item["result"] is None and item["error"]
+            continue
+        assert item["result"] == expected.model_dump()
+
+
+def test_post_benefits_batch_json():
+    response = client.post(
+        "/api/v1/benefits/batch",
+        json=[
+            {
+                "salary": 1000.0,
+                "hire_date": "2020-01-01",
+                "resignation_date": "2021-01-01",
+            },
+            {
+                "salary": -1.0,
+                "hire_date": "2020-01-01",
+                "resignation_date": "2021-01-01",
+            },
+            {
+                "salary": 3000.0,
+                "hire_date": "2024-01-01",
+                "resignation_date": "2025-08-21",
+            },
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["index"] for item in data["results"]] == [0, 1, 2]
+    assert data["errors"] == 1
+    assert data["results"][1]["error"].startswith("salary")
+    assert (
+        data["results"][2]["result"]
+        == client.post(
+            "/api/v1/benefits/",
+            json={
+                "salary": 3000.0,
+                "hire_date": "2024-01-01",
+                "resignation_date": "2025-08-21",
+            },
+        ).json()
+    )
+
+
+def test_post_benefits_batch_ndjson_and_csv():
+    ndjson = (
+        '{"salary": 1000.0, "hire_date": "2020-01-01", "resignation_date": "2021-01-01"}\n'
+        "not json\n"
+    )
+    response = client.post(
+        "/api/v1/benefits/batch",
+        content=ndjson,
+        headers={"content-type": "application/x-ndjson"},
+    )
+    # A linha malformada só invalida o próprio registro
+    assert response.status_code == 200
+    data = response.json()
+    assert data["errors"] == 1
+    assert data["results"][0]["result"] is not None
+    assert data["results"][1]["error"].startswith("invalid JSON:")
+
+    csv_body = (
+        "salary,hire_date,resignation_date\n"
+        "1000.0,2020-01-01,2020-12-20\n"
+        "1000.0,2021-01-01,2020-01-01\n"
+    )
+    response = client.post(
+        "/api/v1/benefits/batch",
+        content=csv_body,
+        headers={"content-type": "text/csv"},
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    expected = BenefitsChallenge().execute(
+        BenefitsInput(
+            salary=1000.0, hire_date="2020-01-01", resignation_date="2020-12-20"
+        )
+    )
+    assert results[0]["result"] == expected.model_dump()
+    assert results[1]["error"]
+
+
+def test_post_benefits_batch_invalid_body():
+    response = client.post("/api/v1/benefits/batch", json={"salary": 1000.0})
+    assert response.status_code == 400
@@ -0,0 +1,92 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from core.validators import BenefitsInput
+from src.challenges.benefits_calendar import CalendarTable
+from src.challenges.benefits_challenge import BenefitsChallenge
+
+
+def datetime_benefits(row):
+    # Cálculo original, com datetime, usado como referência
+    salary = row.salary
+    hire_date = datetime.combine(row.hire_date, datetime.min.time())
+    resignation_date = datetime.combine(row.resignation_date, datetime.min.time())
+    daily_salary = salary / 30
+    last_anniversary = datetime(
+        resignation_date.year if hire_date <= resignation_date else hire_date.year,
+        hire_date.month,
+        hire_date.day,
+    )
+    if last_anniversary > resignation_date:
+        last_anniversary = last_anniversary.replace(year=last_anniversary.year - 1)
+    days_worked = (resignation_date - last_anniversary).days
+    year = last_anniversary.year
+    is_leap_year = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    year_days = 366 if is_leap_year and last_anniversary.month <= 2 else 365
+    vacation_days = 30 * min(days_worked / year_days, 1.0)
+    days_worked_in_year = (
+        resignation_date - datetime(resignation_date.year, 1, 1)
+    ).days + 1
+    months_worked = min((days_worked_in_year + 14) // 30, 12)
+    return (
+        round(vacation_days * daily_salary, 2),
+        round(salary * (months_worked / 12), 2),
+    )
+
+
+def calendar_inputs(seed):
+    rng = random.Random(seed)
+    inputs = [
+        BenefitsInput(salary=1000.0, hire_date=hire, resignation_date=resignation)
+        for hire, resignation in [
+            ("2000-02-29", "2001-02-28"),
+            ("2000-02-29", "2001-03-01"),
+            ("2000-02-29", "2004-03-01"),
+            ("1999-12-31", "2000-01-01"),
+            ("2010-12-31", "2011-12-31"),
+            ("2011-01-01", "2011-12-31"),
+        ]
+    ]
+    # Datas dentro, na borda e fora da tabela de 2000 a 2010
+    for _ in range(4000):
+        hire_date = date(1990, 1, 1) + timedelta(days=rng.randint(0, 9000))
+        resignation_date = hire_date + timedelta(days=rng.randint(0, 3000))
+        salary = round(rng.uniform(500, 50000), 2)
+        inputs.append(
+            BenefitsInput(
+                salary=salary, hire_date=hire_date, resignation_date=resignation_date
+            )
+        )
+    return inputs
+
+
+def test_calendar_ordinals_match_date():
+    calendar = CalendarTable(2000, 2010)
+    day = date(1999, 1, 1)
+    while day.year < 2012:
+        assert calendar.ordinal(day.year, day.month, day.day) == day.toordinal()
+        assert calendar.year_start(day.year) == date(day.year, 1, 1).toordinal()
+        day += timedelta(days=1)
+    assert calendar.is_leap(2000) and not calendar.is_leap(2001)
+    assert calendar.is_leap(2400) and not calendar.is_leap(1900)
+    for year in (2001, 2100):
+        with pytest.raises(ValueError, match="day is out of range for month"):
+            calendar.ordinal(year, 2, 29)
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_scalar_and_batch_match_datetime_calculation(seed):
+    challenge = BenefitsChallenge(CalendarTable(2000, 2010))
+    inputs = calendar_inputs(seed)
+    for item, row in zip(challenge.execute_batch(inputs), inputs):
+        try:
+            expected = datetime_benefits(row)
+        except ValueError as exc:
+            with pytest.raises(ValueError, match=str(exc)):
+                challenge.execute(row)
+            assert item["result"] is None and item["error"] == str(exc)
+            continue
+        output = challenge.execute(row)
+        assert (output.vacation, output.thirteenth_salary) == expected
+        assert item["result"] == output.model_dump()
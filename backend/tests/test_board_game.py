@@ -1,3 +1,6 @@
+import json
+import base64
+import struct
 import pytest
 from backend.main import app
 from fastapi.testclient import TestClient
@@ -39,6 +42,8 @@ def test_post_board_game_valid():
     assert data["turns"] == 1
     assert data["probability"] == 1.0
     assert data["combinations"] == 3
+    # Modo "exact": nenhum campo dos outros modos na resposta
+    assert set(data) == {"turns", "probability", "combinations"}
 
 
 def test_post_board_game_invalid():
@@ -53,4 +58,136 @@ def test_post_board_game_invalid():
 
 def test_post_board_game_missing_field():
     response = client.post("/api/v1/board_game/", json={})
-    assert response.status_code == 422  # Campo obrigatório ausente
\ No newline at end of file
+    assert response.status_code == 422  # Campo obrigatório ausente
+
+def test_post_board_game_modes():
+    response = client.post("/api/v1/board_game/", json={
+        "board_size": 3,
+        "board": [1, 2, 3],
+        "combinations_mode": "log10",
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert "combinations" not in data
+    assert abs(data["combinations_log10"] - 0.4771212547) < 1e-9
+
+    response = client.post("/api/v1/board_game/", json={
+        "board_size": 3,
+        "board": [1, 2, 3],
+        "combinations_mode": "mod",
+    })
+    assert response.status_code == 422
+
+
+def test_board_game_session_lifecycle():
+    board = [1, 2, 1, 3, 1, 1]
+    response = client.post(
+        "/api/v1/board_game/sessions", json={"board_size": 6, "board": board}
+    )
+    assert response.status_code == 201
+    created = response.json()
+    session_id = created["session_id"]
+    assert created["recomputed_cells"] == 6
+    expected = client.post("/api/v1/board_game/", json={"board_size": 6, "board": board})
+    assert {k: created[k] for k in expected.json()} == expected.json()
+
+    response = client.patch(
+        f"/api/v1/board_game/sessions/{session_id}",
+        json={"cells": [{"index": 2, "value": 4}, {"index": 0, "value": 2}]},
+    )
+    assert response.status_code == 200
+    patched = response.json()
+    board[2], board[0] = 4, 2
+    expected = client.post("/api/v1/board_game/", json={"board_size": 6, "board": board})
+    assert {k: patched[k] for k in expected.json()} == expected.json()
+    assert patched["recomputed_cells"] == 5
+
+    # Edição inválida não altera a sessão
+    response = client.patch(
+        f"/api/v1/board_game/sessions/{session_id}",
+        json={"cells": [{"index": 9, "value": 1}]},
+    )
+    assert response.status_code == 422
+    response = client.get(f"/api/v1/board_game/sessions/{session_id}")
+    assert response.json()["combinations"] == patched["combinations"]
+
+    assert client.delete(f"/api/v1/board_game/sessions/{session_id}").status_code == 204
+    assert client.get(f"/api/v1/board_game/sessions/{session_id}").status_code == 404
+
+
+def test_board_game_session_invalid_board():
+    response = client.post(
+        "/api/v1/board_game/sessions", json={"board_size": 4, "board": [1, 1, 1]}
+    )
+    assert response.status_code == 422
+
+
+def test_post_board_game_binary_matches_json():
+    board = [1, 2, -1, 3, 1, 1, 2, 1]
+    expected = client.post(
+        "/api/v1/board_game/",
+        json={"board_size": len(board), "board": board, "combinations_mode": "log10"},
+    ).json()
+    body = struct.pack(f"<{len(board)}i", *board)
+
+    response = client.post(
+        "/api/v1/board_game/binary?combinations_mode=log10",
+        content=body,
+        headers={"content-type": "application/octet-stream"},
+    )
+    assert response.status_code == 200
+    assert response.json() == expected
+
+    response = client.post(
+        "/api/v1/board_game/base64",
+        json={
+            "board_size": len(board),
+            "board_base64": base64.b64encode(body).decode("ascii"),
+            "combinations_mode": "log10",
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == expected
+
+
+def test_post_board_game_binary_invalid():
+    body = struct.pack("<3i", 1, 1, 1)
+    assert client.post("/api/v1/board_game/binary", content=body[:-1]).status_code == 422
+    assert client.post("/api/v1/board_game/binary", content=body[:8]).status_code == 422
+    response = client.post(
+        "/api/v1/board_game/binary?combinations_mode=mod", content=body
+    )
+    assert response.status_code == 422
+    response = client.post(
+        "/api/v1/board_game/base64", json={"board_size": 3, "board_base64": "@@@"}
+    )
+    assert response.status_code == 422
+
+
+def test_exact_combinations_beyond_int_str_limit():
+    # Mais de 4300 dígitos: além do limite de int -> str do json padrão
+    board = [0] * 20_000
+    log10 = client.post(
+        "/api/v1/board_game/",
+        json={"board_size": 20_000, "board": board, "combinations_mode": "log10"},
+    ).json()
+    digits = int(log10["combinations_log10"]) + 1
+    mantissa = log10["combinations_scientific"].split("e")[0].replace(".", "")
+    assert digits > 4300
+
+    exact = {"board_size": 20_000, "board": board}
+    responses = [
+        client.post("/api/v1/board_game/", json=exact),
+        client.post(
+            "/api/v1/batch/",
+            json={"items": [{"challenge": "board_game", "input": exact}]},
+        ),
+    ]
+    for response in responses:
+        assert response.status_code == 200
+        # Os dígitos como texto, sem converter para int
+        data = json.loads(response.text, parse_int=str)
+        if "results" in data:
+            data = data["results"][0]["result"]
+        assert len(data["combinations"]) == digits
+        assert data["combinations"][:4] == mantissa[:4]
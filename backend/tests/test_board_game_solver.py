@@ -0,0 +1,192 @@
+import math
+import random
+from array import array
+
+import pytest
+from backend.src.challenges.board_game_challenge import BoardGameChallenge
+from backend.src.challenges.board_game_solver import BoardState, solve_board
+from core.validators import BoardGameInput
+
+
+def reference_solve(n, board):
+    challenge = BoardGameChallenge()
+    return (
+        challenge._min_turns(n, board),
+        challenge._probability(n, board),
+        challenge._combinations(n, board),
+    )
+
+
+def assert_matches_reference(n, board):
+    try:
+        expected = reference_solve(n, board)
+    except IndexError:
+        with pytest.raises(IndexError):
+            solve_board(n, board)
+        return
+
+    turns, probability, combinations, _ = solve_board(n, board)
+    assert turns == expected[0]
+    assert combinations == expected[2]
+    assert math.isclose(probability, expected[1], rel_tol=1e-12, abs_tol=1e-300)
+
+
+def test_solver_small_board():
+    assert solve_board(3, [1, 2, 3]) == (1, 1.0, 3, None)
+
+
+def test_solver_matches_reference_positive_jumps():
+    rng = random.Random(1234)
+    for _ in range(300):
+        n = rng.randint(2, 60)
+        board = [rng.randint(1, n + 2) for _ in range(n)]
+        assert solve_board(n, board)[:3] == reference_solve(n, board)
+
+
+def test_solver_matches_reference_any_jumps():
+    rng = random.Random(4321)
+    for _ in range(1000):
+        n = rng.randint(2, 40)
+        board = [rng.randint(-2 * n - 1, 2 * n + 1) for _ in range(n)]
+        assert_matches_reference(n, board)
+
+
+def test_solver_matches_reference_short_jumps():
+    rng = random.Random(2024)
+    for _ in range(1000):
+        n = rng.randint(2, 12)
+        board = [rng.randint(-n - 1, 2) for _ in range(n)]
+        assert_matches_reference(n, board)
+
+
+def test_solver_degenerate_boards():
+    assert solve_board(0, []) == (0, 0.0, 0, None)
+    assert solve_board(1, [5]) == (0, 0.0, 0, None)
+
+
+def test_solver_large_board_is_linear():
+    n = 5_000
+    result = solve_board(n, [1] * n)
+    assert result.turns == 1
+    assert result.probability == 1.0
+    assert result.combinations.bit_length() > n // 2
+
+
+def test_solver_modular_combinations():
+    rng = random.Random(99)
+    for _ in range(200):
+        n = rng.randint(2, 80)
+        board = [rng.randint(-n, n + 2) for _ in range(n)]
+        modulus = rng.choice([2, 7, 10**9 + 7, 2**61 - 1])
+        try:
+            exact = solve_board(n, board).combinations
+        except IndexError:
+            continue
+        result = solve_board(n, board, "mod", modulus)
+        assert result.combinations == exact % modulus
+
+
+def test_solver_log10_combinations():
+    rng = random.Random(5)
+    for n in (2, 10, 200, 3000):
+        board = [rng.randint(1, 6) for _ in range(n)]
+        exact = solve_board(n, board).combinations
+        result = solve_board(n, board, "log10")
+        assert result.combinations is None
+        assert math.isclose(result.combinations_log10, math.log10(exact), rel_tol=1e-9)
+
+
+def test_challenge_combinations_modes():
+    challenge = BoardGameChallenge()
+    board = [1] * 5000
+    result = challenge.execute(
+        BoardGameInput(board_size=5000, board=board, combinations_mode="log10")
+    )
+    assert result.combinations is None
+    assert result.combinations_scientific.endswith(
+        "e+" + str(int(result.combinations_log10))
+    )
+
+    result = challenge.execute(
+        BoardGameInput(
+            board_size=3, board=[1, 2, 3], combinations_mode="mod", modulus=2
+        )
+    )
+    assert result.combinations == 1
+
+    with pytest.raises(ValueError):
+        BoardGameInput(board_size=3, board=[1, 2, 3], combinations_mode="mod")
+
+
+@pytest.mark.parametrize(
+    "mode, modulus", [("exact", None), ("mod", 10**9 + 7), ("log10", None)]
+)
+def test_board_state_update_matches_full_solve(mode, modulus):
+    rng = random.Random(7)
+    n = 5_000
+    board = [rng.randint(1, 6) for _ in range(n)]
+    state = BoardState(n, list(board), mode, modulus)
+    for _ in range(20):
+        cells = {rng.randrange(n): rng.randint(-n, n) for _ in range(rng.randint(1, 3))}
+        try:
+            recomputed = state.update(cells)
+        except IndexError:
+            with pytest.raises(IndexError):
+                solve_board(
+                    n, [cells.get(i, v) for i, v in enumerate(board)], mode, modulus
+                )
+            assert state.board == board
+            continue
+        board = [cells.get(i, v) for i, v in enumerate(board)]
+        assert state.board == board
+        assert state.solution() == solve_board(n, board, mode, modulus)
+        assert recomputed <= min(n - 1, max(cells) + 1024)
+
+
+def test_board_state_update_cost_depends_on_index():
+    n = 100_000
+    state = BoardState(n, [1] * n, "mod", 1_000_003)
+    assert state.update({10: 3}) == 1024
+    assert state.update({n - 1: -5}) == 0
+    with pytest.raises(ValueError):
+        state.update({n: 1})
+    with pytest.raises(IndexError):
+        state.update({5: -n - 6})
+    assert state.solution() == solve_board(n, state.board, "mod", 1_000_003)
+
+
+@pytest.mark.parametrize(
+    "mode, modulus", [("exact", None), ("mod", 10**9 + 7), ("log10", None)]
+)
+def test_numpy_backend_matches_pure_python(mode, modulus):
+    rng = random.Random(17)
+    for n, low, high in (
+        (3_000, 1, 6),
+        (5_000, -3, 6),
+        (5_000, 1, 10**30),
+        (4_100, -2 * 4_100, 2 * 4_100),
+    ):
+        board = [rng.randint(low, high) for _ in range(n)]
+        try:
+            expected = solve_board(n, board, mode, modulus, numpy_min_cells=None)
+        except IndexError:
+            with pytest.raises(IndexError):
+                solve_board(n, board, mode, modulus, numpy_min_cells=0)
+            continue
+        assert solve_board(n, board, mode, modulus, numpy_min_cells=0) == expected
+        if high < 2**31:
+            packed = array("i", board)
+            assert solve_board(n, packed, mode, modulus, numpy_min_cells=0) == expected
+
+
+def test_numpy_backend_board_state_updates():
+    rng = random.Random(3)
+    n = 6_000
+    board = [rng.randint(1, 6) for _ in range(n)]
+    board[2_500] = -1
+    state = BoardState(n, list(board), numpy_min_cells=0)
+    assert state.solution() == solve_board(n, board, numpy_min_cells=None)
+    for index in (5_999, 4_000, 10):
+        state.update({index: -2})
+        board[index] = -2
+        assert state.solution() == solve_board(n, board, numpy_min_cells=None)
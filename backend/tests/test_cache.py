@@ -0,0 +1,78 @@
+import time
+
+from backend.main import app
+from fastapi.testclient import TestClient
+from core.cache import LRUCache, ResultCache, SQLiteCacheBackend, input_hash
+from core.validators import BoardGameInput, BoardGameOutput, SequenceInput
+from backend.src.challenges.board_game_challenge import BoardGameChallenge
+from backend.src.challenges.cached_challenge import CachedChallenge
+
+client = TestClient(app)
+
+
+class CountingChallenge(BoardGameChallenge):
+    calls = 0
+
+    def execute(self, input_data: BoardGameInput, context=None) -> BoardGameOutput:
+        CountingChallenge.calls += 1
+        return super().execute(input_data, context)
+
+
+def test_input_hash_is_canonical():
+    assert input_hash("x", SequenceInput(position=3)) == input_hash(
+        "x", SequenceInput.model_validate_json('{"position": 3}')
+    )
+    assert input_hash("x", SequenceInput(position=3)) != input_hash(
+        "y", SequenceInput(position=3)
+    )
+
+
+def test_lru_cache_eviction_and_ttl():
+    cache = LRUCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    expiring = LRUCache(max_entries=2, ttl_seconds=0.01)
+    expiring.set("a", 1)
+    time.sleep(0.02)
+    assert expiring.get("a") is None
+
+
+def test_cached_challenge_memoizes():
+    challenge = CachedChallenge(CountingChallenge(), ResultCache(LRUCache(10, 60)))
+    input_data = BoardGameInput(board_size=3, board=[1, 2, 3])
+    first = challenge.execute(input_data)
+    second = challenge.execute(BoardGameInput(board_size=3, board=[1, 2, 3]))
+    assert first == second
+    assert CountingChallenge.calls == 1
+    assert challenge.cache.stats()["hits"] == 1
+
+
+def test_shared_sqlite_backend(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    input_data = BoardGameInput(board_size=3, board=[1, 1, 1])
+    writer = CachedChallenge(
+        BoardGameChallenge(),
+        ResultCache(LRUCache(10, 60), SQLiteCacheBackend(path, 60)),
+    )
+    expected = writer.execute(input_data)
+
+    reader = CachedChallenge(
+        BoardGameChallenge(),
+        ResultCache(LRUCache(10, 60), SQLiteCacheBackend(path, 60)),
+    )
+    assert reader.lookup(input_data) == expected
+    assert reader.cache.stats()["shared_hits"] == 1
+
+
+def test_get_cache_stats():
+    client.post("/api/v1/board_game/", json={"board_size": 3, "board": [1, 2, 3]})
+    client.post("/api/v1/board_game/", json={"board_size": 3, "board": [1, 2, 3]})
+    response = client.get("/api/v1/cache/stats")
+    assert response.status_code == 200
+    assert response.json()["board_game"]["hits"] >= 1
@@ -0,0 +1,149 @@
+import asyncio
+import pickle
+import random
+import time
+
+import pytest
+from backend.main import app
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+from core.config import Settings
+from core.deadlines import DeadlineMiddleware, RequestContext
+from src.challenges.board_game_solver import solve_board
+from src.challenges.execution_context import (
+    DeadlineExceeded,
+    ExecutionCancelled,
+    ExecutionContext,
+)
+
+client = TestClient(app)
+
+
+def test_context_checks_deadline_and_cancellation():
+    context = ExecutionContext(60)
+    context.check()
+    assert 59 < context.remaining() <= 60
+
+    context.cancel()
+    with pytest.raises(ExecutionCancelled):
+        context.check()
+
+    with pytest.raises(DeadlineExceeded):
+        ExecutionContext(0).check()
+    assert ExecutionContext().remaining() is None
+
+
+def test_request_context_pickles_as_plain_context():
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    context = RequestContext(60, receive)
+    copy = pickle.loads(pickle.dumps(context))
+    assert type(copy) is ExecutionContext
+    assert (copy.timeout, copy.deadline, copy.cancelled) == (
+        60,
+        context.deadline,
+        False,
+    )
+
+
+def test_solver_stops_at_deadline():
+    context = ExecutionContext(0)
+    with pytest.raises(DeadlineExceeded):
+        solve_board(5_000, [1] * 5_000, context=context)
+
+
+def test_header_can_only_shorten_timeout():
+    middleware = DeadlineMiddleware(app, Settings(EXECUTION_TIMEOUT_SECONDS=5.0))
+    assert middleware.timeout_for(Headers({"x-request-timeout": "0.5"})) == 0.5
+    assert middleware.timeout_for(Headers({"x-request-timeout": "10"})) == 5.0
+    assert middleware.timeout_for(Headers({"x-request-timeout": "abc"})) == 5.0
+    assert middleware.timeout_for(Headers({"x-request-timeout": "-1"})) == 5.0
+
+    unbounded = DeadlineMiddleware(app, Settings(EXECUTION_TIMEOUT_SECONDS=None))
+    assert unbounded.timeout_for(Headers({})) is None
+    assert unbounded.timeout_for(Headers({"x-request-timeout": "2"})) == 2.0
+
+
+def test_expired_request_gets_504():
+    board = [random.randint(1, 6) for _ in range(3_000)]
+    response = client.post(
+        "/api/v1/board_game/",
+        json={"board_size": len(board), "board": board},
+        headers={"X-Request-Timeout": "0.000001"},
+    )
+    assert response.status_code == 504
+    assert "deadline" in response.json()["detail"]
+
+
+def test_batch_items_past_deadline_get_504():
+    response = client.post(
+        "/api/v1/batch/",
+        json={"items": [{"challenge": "sequence", "input": {"position": 3}}]},
+        headers={"X-Request-Timeout": "0.000001"},
+    )
+    assert response.status_code == 200
+    assert response.json()["results"][0]["status"] == 504
+
+
+def test_disconnect_cancels_work_in_flight():
+    async def scenario():
+        messages = [
+            {"type": "http.request", "body": b"{}", "more_body": False},
+            {"type": "http.disconnect"},
+        ]
+
+        async def receive():
+            await asyncio.sleep(0.05)
+            return messages.pop(0)
+
+        context = RequestContext(None, receive)
+
+        def work():
+            while True:
+                context.check()
+                time.sleep(0.001)
+
+        future = asyncio.get_running_loop().run_in_executor(None, work)
+        with pytest.raises(ExecutionCancelled):
+            await context.wait(future)
+        # As mensagens lidas pelo observador voltam para a aplicação
+        assert (await context.receive())["type"] == "http.request"
+        assert (await context.receive())["type"] == "http.disconnect"
+
+    asyncio.run(scenario())
+
+
+def test_watcher_reads_ahead_one_chunk_of_a_streamed_body():
+    async def scenario():
+        reads = 0
+
+        async def receive():
+            nonlocal reads
+            reads += 1
+            await asyncio.sleep(0)
+            return {"type": "http.request", "body": b"x" * 65536, "more_body": True}
+
+        context = RequestContext(None, receive)
+        for _ in range(3):
+            await context.wait(asyncio.ensure_future(asyncio.sleep(0.05)))
+        # Um pedaço lido adiantado, entregue na próxima leitura da aplicação
+        assert reads == 1
+        assert (await context.receive())["more_body"]
+        assert reads == 1
+        assert not context.cancelled
+
+    asyncio.run(scenario())
+
+
+def test_watcher_error_is_raised_by_next_receive():
+    async def scenario():
+        async def receive():
+            raise RuntimeError("over budget")
+
+        context = RequestContext(None, receive)
+        await context.wait(asyncio.ensure_future(asyncio.sleep(0.01)))
+        with pytest.raises(RuntimeError, match="over budget"):
+            await context.receive()
+
+    asyncio.run(scenario())
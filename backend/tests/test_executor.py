@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import pytest
+from backend.main import app
+from fastapi.testclient import TestClient
+from core.config import Settings
+from core.executor import ChallengeExecutor, ExecutorSaturated, get_executor
+from core.validators import SequenceInput, SequenceOutput
+from backend.src.challenges.base_challenge import IChallenge
+from backend.src.challenges.sequence_challenge import SequenceChallenge
+
+client = TestClient(app)
+
+
+class BlockingChallenge(IChallenge):
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def execute(self, input_data, context=None):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return SequenceOutput(result=input_data.position)
+
+
+@pytest.mark.parametrize("backend", ["inline", "thread", "process"])
+def test_executor_backends(backend):
+    executor = ChallengeExecutor(Settings(EXECUTION_BACKEND=backend))
+    try:
+        result = asyncio.run(
+            executor.run("sequence", SequenceChallenge(), SequenceInput(position=5))
+        )
+    finally:
+        executor.shutdown()
+    assert result.result == 39
+
+
+def test_executor_routes_per_challenge():
+    executor = ChallengeExecutor(
+        Settings(EXECUTION_BACKEND="inline", EXECUTION_ROUTES={"board_game": "process"})
+    )
+    assert executor.backend_for("board_game") == "process"
+    assert executor.backend_for("string") == "inline"
+
+
+def test_executor_saturation():
+    executor = ChallengeExecutor(
+        Settings(
+            EXECUTION_BACKEND="thread",
+            EXECUTION_MAX_WORKERS=1,
+            EXECUTION_QUEUE_SIZE=0,
+        )
+    )
+    challenge = BlockingChallenge()
+
+    async def scenario():
+        first = asyncio.ensure_future(
+            executor.run("sequence", challenge, SequenceInput(position=1))
+        )
+        while not challenge.started.is_set():
+            await asyncio.sleep(0.01)
+        with pytest.raises(ExecutorSaturated):
+            await executor.run("sequence", challenge, SequenceInput(position=2))
+        challenge.release.set()
+        return await first
+
+    try:
+        assert asyncio.run(scenario()).result == 1
+    finally:
+        executor.shutdown()
+
+
+def test_cancelled_call_keeps_its_slot_until_the_worker_ends():
+    executor = ChallengeExecutor(
+        Settings(
+            EXECUTION_BACKEND="thread",
+            EXECUTION_MAX_WORKERS=1,
+            EXECUTION_QUEUE_SIZE=0,
+        )
+    )
+    challenge = BlockingChallenge()
+
+    async def scenario():
+        first = asyncio.ensure_future(
+            executor.run("sequence", challenge, SequenceInput(position=1))
+        )
+        while not challenge.started.is_set():
+            await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        # O worker ainda está rodando: a vaga continua ocupada
+        with pytest.raises(ExecutorSaturated):
+            await executor.run("sequence", challenge, SequenceInput(position=2))
+        challenge.release.set()
+        while executor._pending["thread"]:
+            await asyncio.sleep(0.01)
+        return await executor.run("sequence", challenge, SequenceInput(position=3))
+
+    try:
+        assert asyncio.run(scenario()).result == 3
+    finally:
+        executor.shutdown()
+
+
+def test_post_saturated_returns_503():
+    class SaturatedExecutor:
+        async def run(self, name, challenge, input_data):
+            raise ExecutorSaturated("process", retry_after=3)
+
+    app.dependency_overrides[get_executor] = SaturatedExecutor
+    try:
+        response = client.post("/api/v1/sequence/", json={"position": 6})
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+
+
+def test_post_on_process_backend():
+    executor = ChallengeExecutor(
+        Settings(EXECUTION_BACKEND="inline", EXECUTION_ROUTES={"board_game": "process"})
+    )
+    app.dependency_overrides[get_executor] = lambda: executor
+    try:
+        response = client.post(
+            "/api/v1/board_game/",
+            json={"board_size": 5, "board": [0, 0, 0, 0, 0]},
+        )
+    finally:
+        app.dependency_overrides.clear()
+        executor.shutdown()
+    assert response.status_code == 200
+    assert response.json()["turns"] == 1
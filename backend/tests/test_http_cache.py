@@ -0,0 +1,61 @@
+from backend.main import app
+from fastapi.testclient import TestClient
+from core.config import Settings
+from core.http_cache import challenge_etag, etag_matches
+from core.validators import SequenceInput
+
+client = TestClient(app)
+
+
+def test_get_matches_post_and_sets_cache_headers():
+    body = {"salary": 5000, "hire_date": "2020-01-15", "resignation_date": "2023-06-20"}
+    posted = client.post("/api/v1/benefits/", json=body)
+    response = client.get("/api/v1/benefits/", params=body)
+    assert response.status_code == 200
+    assert response.json() == posted.json()
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert response.headers["etag"].startswith('"')
+
+
+def test_etag_is_canonical():
+    first = client.get("/api/v1/board_game/?board_size=3&board=1&board=1&board=0")
+    second = client.get(
+        "/api/v1/board_game/?board=1&board=1&board=0&combinations_mode=exact"
+        "&board_size=3"
+    )
+    other = client.get("/api/v1/board_game/?board_size=3&board=1&board=2&board=0")
+    assert first.status_code == 200
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["etag"] != other.headers["etag"]
+
+
+def test_if_none_match_gives_304():
+    etag = client.get("/api/v1/sequence/", params={"position": 9}).headers["etag"]
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get(
+            "/api/v1/sequence/",
+            params={"position": 9},
+            headers={"If-None-Match": header},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    stale = client.get(
+        "/api/v1/sequence/", params={"position": 9}, headers={"If-None-Match": '"x"'}
+    )
+    assert stale.status_code == 200
+
+
+def test_invalid_query_is_rejected():
+    assert client.get("/api/v1/string/").status_code == 422
+    assert client.get("/api/v1/sequence/?position=0").status_code == 422
+
+
+def test_etag_depends_on_version():
+    data = SequenceInput(position=3)
+    assert challenge_etag("sequence", data) != challenge_etag(
+        "sequence", data, Settings(HTTP_CACHE_VERSION="2")
+    )
+    assert challenge_etag("sequence", data) != challenge_etag("string", data)
+    assert not etag_matches(None, '"a"')
@@ -0,0 +1,99 @@
+import logging
+import logging.handlers
+import queue
+
+import core.logging as core_logging
+from core.config import settings
+from core.logging import BoundedQueueHandler, RequestLogSampler, record_extras
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def make_record(message, *args):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+
+
+def test_queue_handler_defers_formatting():
+    log_queue = queue.Queue(maxsize=10)
+    handler = BoundedQueueHandler(log_queue, [])
+    handler.handle(make_record("value=%s", 42))
+    record = log_queue.get_nowait()
+    assert record.args == (42,)
+    assert record.getMessage() == "value=42"
+
+
+def test_queue_handler_drops_when_full():
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, [])
+    for i in range(5):
+        handler.handle(make_record(f"message {i}"))
+    assert log_queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_listener_flushes_on_stop():
+    log_queue = queue.Queue(maxsize=100)
+    target = ListHandler()
+    handler = BoundedQueueHandler(log_queue, [target], block=True)
+    listener = logging.handlers.QueueListener(log_queue, target)
+    listener.start()
+    for i in range(50):
+        handler.handle(make_record("message %d", i))
+    listener.stop()
+    assert target.messages == [f"message {i}" for i in range(50)]
+
+
+def test_record_extras():
+    logger = logging.getLogger("test_extras")
+    handler = ListHandler()
+    handler.format = lambda record: record_extras(record)
+    logger.addHandler(handler)
+    logger.propagate = False
+    logger.warning("Request handled", extra={"path": "/api/v1/string/", "status": 200})
+    assert handler.messages == [{"path": "/api/v1/string/", "status": 200}]
+
+
+def test_request_sampler():
+    sampler = RequestLogSampler(
+        {"/api/v1/string": 0.0, "/api/v1/string/batch": 1.0}, slow_request_ms=100
+    )
+    assert sampler.should_log("/api/v1/sequence/", 200, 1.0)
+    assert not sampler.should_log("/api/v1/string/", 200, 1.0)
+    assert sampler.should_log("/api/v1/string/batch", 200, 1.0)
+    assert sampler.should_log("/api/v1/string/", 422, 1.0)
+    assert sampler.should_log("/api/v1/string/", 200, 150.0)
+
+
+def test_setup_after_shutdown_starts_a_new_listener(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "LOG_QUEUE_ENABLED", True)
+    monkeypatch.setattr(core_logging, "_is_setup", False)
+    monkeypatch.setattr(core_logging, "_listener", None)
+    monkeypatch.setattr(core_logging, "_queue_handler", None)
+    root_logger = logging.getLogger()
+    original_handlers = root_logger.handlers[:]
+    try:
+        core_logging.setup_logging()
+        first_listener = core_logging._listener
+        core_logging.shutdown_logging()
+        assert not core_logging._is_setup
+
+        # Um novo setup volta a enfileirar os registros
+        core_logging.setup_logging()
+        assert core_logging._is_setup
+        assert core_logging._listener not in (None, first_listener)
+        assert core_logging._queue_handler in root_logger.handlers
+        core_logging.shutdown_logging()
+    finally:
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+        for handler in original_handlers:
+            root_logger.addHandler(handler)
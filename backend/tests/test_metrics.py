@@ -0,0 +1,76 @@
+import threading
+from backend.main import app
+from fastapi.testclient import TestClient
+from core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+client = TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(5, "/a")
+    lines = list(histogram.collect())
+    assert lines[:2] == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+    ]
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{route="/a"} 5.15' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_values_are_aggregated_across_threads():
+    counter = Counter("calls_total", "Calls.", ("kind",))
+    gauge = Gauge("in_flight", "In flight.")
+
+    def work():
+        for _ in range(1000):
+            counter.inc("x")
+            gauge.inc()
+        gauge.dec(amount=500)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    registry = MetricsRegistry()
+    registry.register(counter)
+    registry.register(gauge)
+    text = registry.render()
+    assert 'calls_total{kind="x"} 4000' in text
+    assert "in_flight 2000" in text
+
+
+def test_label_count_is_checked():
+    counter = Counter("errors_total", "Errors.", ("kind",))
+    try:
+        counter.inc()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("missing label accepted")
+
+
+def test_metrics_endpoint():
+    client.post("/api/v1/string/", json={"text": "BxxA"})
+    client.post("/api/v1/board_game/", json={"board_size": 3, "board": [1, 2, 1]})
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert (
+        'http_request_duration_seconds_count{method="POST",path="/api/v1/string/",status="200"}'
+        in text
+    )
+    assert 'challenge_input_size_bucket{challenge="StringChallenge",le="10"}' in text
+    assert 'challenge_input_size_sum{challenge="BoardGameChallenge"}' in text
+    assert (
+        'challenge_execute_duration_seconds_count{challenge="StringChallenge"}' in text
+    )
+    assert "http_requests_in_flight" in text
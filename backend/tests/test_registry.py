@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+from backend.main import ROUTE_MODULES, app, create_app
+from fastapi.testclient import TestClient
+from core.validators import SequenceInput, SequenceOutput
+from backend.src.challenges.base_challenge import IChallenge
+from src.challenges.cached_challenge import CachedChallenge
+from core.config import Settings
+from src.challenges.registry import ChallengeRegistry, lazy_factory, registry
+
+
+class WarmChallenge(IChallenge):
+    instances = 0
+
+    def __init__(self):
+        WarmChallenge.instances += 1
+        self.warm = False
+
+    def warmup(self):
+        self.warm = True
+
+    def execute(self, input_data: SequenceInput, context=None) -> SequenceOutput:
+        return SequenceOutput(result=input_data.position)
+
+
+def test_registry_builds_once_and_warms_up():
+    challenges = ChallengeRegistry()
+    challenges.register("warm", WarmChallenge)
+    timings = challenges.build()
+    assert set(timings) == {"warm"}
+    assert challenges.get("warm") is challenges.get("warm")
+    assert challenges.get("warm").warm is True
+    challenges.build()
+    assert WarmChallenge.instances == 1
+
+
+def test_registry_wraps_cached_challenges():
+    assert isinstance(registry.get("board_game"), CachedChallenge)
+    assert not isinstance(registry.unwrapped("board_game"), CachedChallenge)
+    assert not isinstance(registry.get("string"), CachedChallenge)
+
+
+def test_lifespan_builds_registry():
+    with TestClient(app) as client:
+        response = client.post("/api/v1/sequence/", json={"position": 6})
+        assert response.status_code == 200
+    assert set(registry.build()) == set(registry.names())
+
+
+def test_lazy_factory_imports_on_build():
+    challenges = ChallengeRegistry()
+    challenges.register(
+        "sequence", lazy_factory("src.challenges.sequence_challenge:SequenceChallenge")
+    )
+    assert type(challenges.get("sequence")).__name__ == "SequenceChallenge"
+    assert challenges.input_model("sequence") is SequenceInput
+
+
+def test_create_app_uses_given_settings():
+    custom = create_app(Settings(APP_NAME="Custom", ADMISSION_MAX_REQUEST_COST=2.0))
+    assert custom.title == "Custom"
+    assert set(custom.state.import_ms) == {name for name, _ in ROUTE_MODULES}
+    client = TestClient(custom)
+    assert client.post("/api/v1/sequence/", json={"position": 2}).status_code == 200
+    response = client.post("/api/v1/string/", json={"text": "B" + "x" * 2048 + "A"})
+    assert response.status_code == 413
+
+
+def test_importing_main_defers_routes_and_numpy():
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = (
+        "import sys, main; "
+        "print('api.routes.board_game' in sys.modules, 'numpy' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=backend, capture_output=True, text=True
+    ).stdout
+    assert output.split() == ["False", "False"]
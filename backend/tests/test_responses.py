@@ -0,0 +1,73 @@
+import pytest
+from backend.main import app
+from fastapi.testclient import TestClient
+from core.config import settings
+
+client = TestClient(app)
+
+REQUESTS = [
+    ("post", "/api/v1/string/", {"json": {"text": "BHA"}}),
+    ("post", "/api/v1/sequence/", {"json": {"position": 12}}),
+    ("post", "/api/v1/sequence/batch", {"json": {"positions": [1, 5, 10]}}),
+    ("post", "/api/v1/sequence/sum", {"json": {"start": 1, "stop": 4}}),
+    ("post", "/api/v1/sequence/position", {"json": {"value": 40}}),
+    ("post", "/api/v1/board_game/", {"json": {"board_size": 4, "board": [1, 2, 0, 0]}}),
+    (
+        "post",
+        "/api/v1/benefits/",
+        {
+            "json": {
+                "salary": 1234.5,
+                "hire_date": "2020-01-15",
+                "resignation_date": "2023-06-20",
+            }
+        },
+    ),
+    (
+        "post",
+        "/api/v1/benefits/batch",
+        {
+            "json": [
+                {
+                    "salary": 1000,
+                    "hire_date": "2024-01-01",
+                    "resignation_date": "2024-05-01",
+                },
+                {"salary": -1},
+            ]
+        },
+    ),
+    (
+        "post",
+        "/api/v1/batch/",
+        {
+            "json": {
+                "items": [
+                    {"challenge": "sequence", "input": {"position": 3}},
+                    {"challenge": "nope", "input": {}},
+                ]
+            }
+        },
+    ),
+    ("get", "/api/v1/sequence/", {"params": {"position": 7}}),
+]
+
+
+@pytest.mark.parametrize("method,path,kwargs", REQUESTS)
+def test_fast_responses_match_validated_ones(monkeypatch, method, path, kwargs):
+    validated = getattr(client, method)(path, **kwargs)
+    monkeypatch.setattr(settings, "FAST_RESPONSES", True)
+    fast = getattr(client, method)(path, **kwargs)
+    assert fast.status_code == validated.status_code == 200
+    assert fast.json() == validated.json()
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.headers.get("etag") == validated.headers.get("etag")
+
+
+def test_fast_responses_keep_status_code(monkeypatch):
+    monkeypatch.setattr(settings, "FAST_RESPONSES", True)
+    response = client.post(
+        "/api/v1/board_game/sessions", json={"board_size": 4, "board": [1, 2, 0, 0]}
+    )
+    assert response.status_code == 201
+    assert response.json()["board_size"] == 4
@@ -1,7 +1,15 @@
+import json
+import sys
+from array import array
 import pytest
 from backend.main import app
 from fastapi.testclient import TestClient
-from core.validators import SequenceInput, SequenceOutput
+from core.validators import (
+    SequenceInput,
+    SequenceOutput,
+    SequenceRangeInput,
+    SequenceValueInput,
+)
 from backend.src.challenges.sequence_challenge import SequenceChallenge
 
 client = TestClient(app)
@@ -41,4 +49,79 @@ def test_post_sequence_invalid():
 
 def test_post_sequence_missing_field():
     response = client.post("/api/v1/sequence/", json={})
-    assert response.status_code == 422  # Campo obrigatório ausente
\ No newline at end of file
+    assert response.status_code == 422  # Campo obrigatório ausente
+
+def test_sequence_range_operations_unit():
+    challenge = SequenceChallenge()
+    values = challenge.range_values(SequenceRangeInput(start=3, stop=20, step=4))
+    assert list(values) == [
+        challenge.execute(SequenceInput(position=p)).result for p in range(3, 20, 4)
+    ]
+    total = challenge.range_sum(SequenceRangeInput(start=3, stop=20, step=4))
+    assert total.count == len(values)
+    assert total.sum == sum(values)
+    empty = challenge.range_sum(SequenceRangeInput(start=5, stop=5))
+    assert (empty.count, empty.sum) == (0, 0)
+    big = challenge.range_sum(SequenceRangeInput(start=1, stop=10**12 + 1))
+    assert big.sum == 10**12 * 11 + 7 * (10**12 - 1) * 10**12 // 2
+
+
+def test_sequence_position_unit():
+    challenge = SequenceChallenge()
+    for position in (1, 2, 5, 10**15):
+        value = challenge.execute(SequenceInput(position=position)).result
+        assert challenge.position_of(SequenceValueInput(value=value)).position == position
+    for value in (-3, 4, 10, 12, 40):
+        assert challenge.position_of(SequenceValueInput(value=value)).position is None
+
+
+def test_post_sequence_batch():
+    response = client.post("/api/v1/sequence/batch", json={"positions": [1, 5, 10]})
+    assert response.status_code == 200
+    assert response.json() == {"results": [11, 39, 74]}
+
+    response = client.post("/api/v1/sequence/batch", json={"positions": [1, 0]})
+    assert response.status_code == 422
+
+
+def test_post_sequence_range_ndjson():
+    response = client.post(
+        "/api/v1/sequence/range", json={"start": 1, "stop": 200_001, "step": 2}
+    )
+    assert response.status_code == 200
+    assert response.headers["x-sequence-count"] == "100000"
+    values = [v for line in response.text.splitlines() for v in json.loads(line)]
+    assert values == [11 + (p - 1) * 7 for p in range(1, 200_001, 2)]
+
+
+def test_post_sequence_range_binary():
+    response = client.post(
+        "/api/v1/sequence/range", json={"start": 4, "stop": 9, "format": "binary"}
+    )
+    assert response.headers["content-type"] == "application/octet-stream"
+    values = array("q", response.content)
+    if sys.byteorder == "big":
+        values.byteswap()
+    assert list(values) == [32, 39, 46, 53, 60]
+
+    response = client.post(
+        "/api/v1/sequence/range",
+        json={"start": 2**62, "stop": 2**62 + 2, "format": "binary"},
+    )
+    assert response.status_code == 400
+
+
+def test_post_sequence_sum_and_position():
+    response = client.post("/api/v1/sequence/sum", json={"start": 1, "stop": 4})
+    assert response.json() == {"count": 3, "sum": 54}
+    response = client.post("/api/v1/sequence/position", json={"value": 39})
+    assert response.json() == {"position": 5}
+    response = client.post("/api/v1/sequence/position", json={"value": 40})
+    assert response.json() == {"position": None}
+
+
+def test_post_sequence_huge_ranges():
+    response = client.post("/api/v1/sequence/sum", json={"start": 1, "stop": 10**30})
+    assert response.json()["count"] == 10**30 - 1
+    response = client.post("/api/v1/sequence/range", json={"start": 1, "stop": 10**30})
+    assert response.status_code == 413
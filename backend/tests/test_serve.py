@@ -0,0 +1,35 @@
+import os
+
+from core.config import Settings
+from serve import gunicorn_options, uvicorn_options, worker_count
+
+
+def test_worker_count_defaults_to_cpu_cores():
+    assert worker_count(Settings(SERVER_WORKERS=3)) == 3
+    assert worker_count(Settings(SERVER_WORKERS=0)) == 1
+    assert worker_count(Settings(SERVER_WORKERS=None)) == (os.cpu_count() or 1)
+
+
+def test_gunicorn_options_follow_settings():
+    options = gunicorn_options(
+        Settings(PORT=9000, SERVER_WORKERS=2, SERVER_MAX_REQUESTS=None)
+    )
+    assert options["bind"] == "0.0.0.0:9000"
+    assert options["workers"] == 2
+    assert options["max_requests"] == 0
+    assert options["preload_app"] is True
+
+
+def test_uvicorn_options_follow_settings():
+    options = uvicorn_options(
+        Settings(SERVER_WORKERS=2, SERVER_LOOP="asyncio", SERVER_HTTP="h11")
+    )
+    assert options["workers"] == 2
+    assert options["loop"] == "asyncio"
+    assert options["http"] == "h11"
+    assert options["port"] == 5879
+    assert "reload" not in options
+
+    debug = uvicorn_options(Settings(DEBUG=True))
+    assert debug["reload"] is True
+    assert "workers" not in debug
@@ -1,3 +1,4 @@
+import json
 import pytest
 from backend.main import app
 from fastapi.testclient import TestClient
@@ -39,4 +40,84 @@ def test_post_string_invalid():
 def test_post_string_empty():
     response = client.post("/api/v1/string/", json={"text": ""})
     # Se o campo for obrigatório e não aceitar vazio, pode ser 422
-    assert response.status_code in (200, 422)
\ No newline at end of file
+    assert response.status_code in (200, 422)
+
+def test_post_string_stream_text():
+    def body():
+        yield b"BA\nhello\r\n\nB"
+        yield b"xxA\n\xff\xfe\n"
+
+    response = client.post(
+        "/api/v1/string/stream", content=body(), headers={"content-type": "text/plain"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {"index": 0, "is_valid": True},
+        {"index": 1, "is_valid": False},
+        {"index": 2, "is_valid": True},
+        {"index": 3, "error": "line is not valid UTF-8"},
+    ]
+
+
+def test_post_string_stream_ndjson():
+    body = '{"text": "BCA"}\n"BA"\n{"text": ""}\n{"other": 1}\nnot json\n'
+    response = client.post(
+        "/api/v1/string/stream",
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line.get("is_valid") for line in lines] == [True, True, None, None, None]
+    assert lines[2]["error"] == "text: String should have at least 1 character"
+    assert lines[4]["error"].startswith("invalid JSON")
+
+
+def test_post_string_stream_line_too_long(monkeypatch):
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "STRING_STREAM_MAX_LINE_BYTES", 8)
+    response = client.post(
+        "/api/v1/string/stream",
+        content="BA\n" + "B" * 20 + "A\n",
+        headers={"content-type": "text/plain"},
+    )
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [{"error": "line longer than 8 bytes"}]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("BA", True),
+        ("B" + "x" * 100_000 + "A", True),
+        ("Bção€A", True),
+        ("€B😀A", False),
+        ("B😀", False),
+        ("😀A", False),
+        ("B", False),
+        ("A", False),
+    ],
+)
+def test_post_string_raw(text, expected):
+    def body():
+        # Partes pequenas cortam os code points multibyte entre chunks
+        data = text.encode("utf-8")
+        for start in range(0, len(data), 3):
+            yield data[start : start + 3]
+
+    response = client.post(
+        "/api/v1/string/raw",
+        content=body(),
+        headers={"content-type": "application/octet-stream"},
+    )
+    assert response.status_code == 200
+    assert response.json()["is_valid"] is expected
+
+
+def test_post_string_raw_errors():
+    response = client.post("/api/v1/string/raw", content=b"")
+    assert response.status_code == 422
+    response = client.post("/api/v1/string/raw", content=b"B\xffA\xe2\x82")
+    assert response.status_code == 400